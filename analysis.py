@@ -0,0 +1,146 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from lineindex import LineIndex
+from parser import NO_DAMAGE, merge_token_damage
+
+
+#düzenleme patlamalarını tek analizde birleştirip parse'ı tk thread'i dışında çalıştıran zamanlayıcı
+#bir düzenlemeden delay ms sonra metin bir kere alınır ve artımlı olarak tokenize edilip renklendirilir
+#(tk tagları metinle birlikte kaydığı için bu kısım tk thread'inde kalır, maliyeti düzenlemenin boyutu
+#kadardır); tokenların bir kopyası işçi thread'de parse edilir. Aynı anda tek parse çalışır: yeni bir
+#düzenleme gelirse çalışan parse iptal edilir, bitince güncel metin için tekrar başlatılır. Sonuç tk
+#thread'inde (after ile yoklanarak) ancak sürümü hala güncelse panellere yazılır
+class AnalysisScheduler:
+    def __init__(self, highlighter, delay=40, poll=15):
+        self.highlighter = highlighter
+        self.widget = highlighter.text
+        self.delay = delay
+        self.poll = poll
+        #her düzenlemede artar, sonuç ancak gönderildiği sürüm hala güncelse gösterilir
+        self.version = 0
+        self.scheduled = None
+        #çalışan parse: (future, sürüm, metin, tokenlar, damage, iptal)
+        self.job = None
+        #parse çalışırken yeni metin tokenize edildi, parse bitince tekrar başlatılacak
+        self.pending = False
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        #uygulanan, iptal edilen ve bittiğinde eskimiş olan parse sayıları
+        self.applied = 0
+        self.cancelled = 0
+        self.stale = 0
+
+    #<KeyRelease>, <<Paste>>, <<Cut>>: analiz zamanlanmamışsa delay ms sonrasına zamanlanır
+    #(sonraki düzenlemeler aynı analizde birleşir), çalışan parse artık eskidir
+    def on_modified(self, event=None):
+        if self.highlighter.suspended:
+            return
+        self.version += 1
+        if self.job is not None:
+            self.job[5].set()
+        if self.scheduled is None:
+            self.scheduled = self.widget.after(self.delay, self.run)
+
+    #metni bir kere alır, renklendirir ve parse'ı başlatır
+    def run(self):
+        self.scheduled = None
+        with self.highlighter.profiler.run("edit"):
+            content = self.widget.get("1.0", "end-1c")
+            try:
+                self.highlighter.highlight(content)
+                self.widget.event_generate("<<Change>>")
+            except Exception as e:
+                print(f"Error in analysis: {e}")
+            if self.job is not None:
+                self.pending = True
+                return
+            self.submit(content)
+
+    #incremental lexer'ın metni için parse'ı işçi thread'e gönderir
+    def submit(self, content):
+        highlighter = self.highlighter
+        if highlighter.incremental.text != content:
+            #renklendirme başarısız olduysa tokenlar bu metne ait değildir, parse burada yapılır
+            highlighter.update_parse_result(content)
+            return
+        damage = highlighter.take_token_damage(content)
+        ast = highlighter.restore_parse(content)
+        if ast is not None:
+            highlighter.record_ast(ast)
+            highlighter.index_symbols(highlighter.incremental.tokens)
+            highlighter.show_parse_result(ast, highlighter.incremental.tokens)
+            self.applied += 1
+            return
+        #liste sonraki düzenlemelerde yerinde değiştiği için işçi thread bir kopyasını parse eder; apply_edit
+        #Token nesnelerini değiştirmeyip yenileriyle değiştirdiği için kopyadaki tokenlar bu metne ait kalır
+        tokens = list(highlighter.incremental.tokens)
+        #satır başları da yerinde güncellenir, hata konumları için kopyası verilir
+        line_index = LineIndex(line_starts=list(highlighter.incremental.line_starts))
+        cancel = threading.Event()
+        future = self.executor.submit(self.parse, tokens, line_index, damage, cancel)
+        self.job = (future, self.version, content, tokens, damage, cancel)
+        self.widget.after(self.poll, self.check)
+
+    #işçi thread'de çalışır, profiler'da o thread'in kendi run'ı olarak görünür
+    def parse(self, tokens, line_index, damage, cancel):
+        profiler = self.highlighter.profiler
+        with profiler.run("background_parse"), profiler.stage("parse"):
+            ast = self.highlighter.incremental_parser.parse(tokens, line_index, damage, cancel)
+            profiler.set("tokens", len(tokens))
+            profiler.set("cancelled", int(ast is None))
+        return ast
+
+    #parse bittiyse sonucu tk thread'inde uygular
+    def check(self):
+        future, version, content, tokens, damage, cancel = self.job
+        if not future.done():
+            self.widget.after(self.poll, self.check)
+            return
+        self.job = None
+        highlighter = self.highlighter
+        try:
+            ast = future.result()
+        except Exception as e:
+            if version == self.version:
+                highlighter.show_parse_error(e, tokens)
+        else:
+            if ast is None:
+                #iptal edildi: parser durumu değişmedi, bu damage sonrakilerle birleştirilir
+                current = highlighter.token_damage
+                if current is None:
+                    highlighter.token_damage = None
+                elif current == NO_DAMAGE:
+                    highlighter.token_damage = damage
+                else:
+                    highlighter.token_damage = merge_token_damage(damage, *current)
+                self.cancelled += 1
+            elif version == self.version:
+                with highlighter.profiler.run("apply"):
+                    highlighter.store_parse(content, tokens)
+                    highlighter.record_ast(ast)
+                    highlighter.index_symbols(tokens)
+                    highlighter.show_parse_result(ast, tokens)
+                self.applied += 1
+            else:
+                #parser durumu bu tokenlara göre geçerlidir, sonraki parse buradan devam eder; ancak
+                #parse sırasında düzenlemeler token konumlarını kaydırmış olabilir, önbelleğe yazılmaz
+                self.stale += 1
+        if self.pending:
+            self.pending = False
+            #zamanlanmış analiz varsa parse'ı o başlatacak
+            if self.scheduled is None:
+                self.submit(highlighter.incremental.text)
+
+    #zamanlanmış analizi kaldırır, çalışan parse'ı iptal eder ve sonucunu eskitir
+    def cancel(self):
+        self.version += 1
+        self.pending = False
+        if self.scheduled is not None:
+            self.widget.after_cancel(self.scheduled)
+            self.scheduled = None
+        if self.job is not None:
+            self.job[5].set()
+
+    def shutdown(self):
+        if self.job is not None:
+            self.job[5].set()
+        self.executor.shutdown(wait=False)
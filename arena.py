@@ -0,0 +1,133 @@
+from array import array
+
+#AST düğüm türleri, arena bunları küçük tamsayı kodlarıyla saklar
+#SEQUENCE parser'ın ürettiği python listeleri içindir (statement, parametre, argüman listeleri)
+NODE_KINDS = ("SEQUENCE", "PROGRAM", "COMMENT", "PASS", "BREAK", "CONTINUE", "KEYWORD",
+              "CLASS_DEF", "FUNC_DEF", "IF", "ELIF", "WHILE", "FOR", "ASSIGN", "EXPR",
+              "RETURN", "PRINT", "FUNC_CALL", "BIN_OP", "UNARY_OP", "NUMBER", "STRING",
+              "FSTRING", "IDENTIFIER", "LIST", "SET", "ERROR")
+NODE_CODES = {kind: code for code, kind in enumerate(NODE_KINDS)}
+SEQUENCE = NODE_CODES["SEQUENCE"]
+
+
+#alan kodlarında None'ı gösteren değer (çift kodlar alt düğüm, diğer tek kodlar values tablosu)
+NONE_FIELD = 1
+
+
+#Parser'ın ürettiği iç içe tuple AST'yi düz dizilerde saklayan kompakt arena
+#her düğümün tür kodu array('B'), alanlarının codes dizisindeki başlangıcı array('I') içinde tutulur
+#bir düğümün alanları codes dizisinde art arda durur, her alan tek bir kodtur: alt düğüm 2*indeks,
+#str değerler 2*(values'daki sırası)+3, None 1; aynı isim ya da sayı values'ta bir kere tutulur
+#düğümler ön sırada (pre-order) numaralanır: bir alt ağaç [indeks, subtree_end) aralığıdır, kök 0'dır
+class ASTArena:
+    def __init__(self):
+        self.kinds = array("B")
+        self.starts = array("I")
+        self.codes = array("I")
+        self.values = []
+        self.value_codes = {}
+
+    #tuple AST'den arena oluşturur
+    @classmethod
+    def from_tuple(cls, ast):
+        arena = cls()
+        arena.add_tuple(ast)
+        return arena
+
+    def __len__(self):
+        return len(self.kinds)
+
+    #str değerin alan kodu, ilk görüldüğünde values tablosuna eklenir
+    def value_code(self, value):
+        code = self.value_codes.get(value)
+        if code is None:
+            code = self.value_codes[value] = 2 * len(self.values) + 3
+            self.values.append(value)
+        return code
+
+    #tuple AST'yi arenaya ekler ve kök indeksini döndürür
+    #özyineleme kullanılmaz, çok derin ağaçlarda da çalışır
+    def add_tuple(self, ast):
+        kinds, starts, codes = self.kinds, self.starts, self.codes
+        node_codes = NODE_CODES
+        value_codes = self.value_codes
+        root = len(kinds)
+        stack = [(ast, -1)]
+        while stack:
+            node, slot = stack.pop()
+            if slot >= 0:
+                codes[slot] = 2 * len(kinds)
+            if isinstance(node, list):
+                kinds.append(SEQUENCE)
+                fields = node
+            else:
+                kinds.append(node_codes[node[0]])
+                fields = node[1:]
+            start = len(codes)
+            starts.append(start)
+            for field in fields:
+                if field is None:
+                    codes.append(NONE_FIELD)
+                elif isinstance(field, str):
+                    code = value_codes.get(field)
+                    codes.append(code if code is not None else self.value_code(field))
+                else:
+                    #alt düğüm, kodu ziyaret edilince yazılır
+                    codes.append(0)
+            #alt düğümler soldan sağa numaralansın diye yığına ters sırada eklenir
+            for offset in range(len(fields) - 1, -1, -1):
+                field = fields[offset]
+                if isinstance(field, (tuple, list)):
+                    stack.append((field, start + offset))
+        return root
+
+    #düğümün türü ("BIN_OP" gibi)
+    def kind(self, index):
+        return NODE_KINDS[self.kinds[index]]
+
+    #düğümün alan kodları
+    def field_codes(self, index):
+        end = self.starts[index + 1] if index + 1 < len(self.kinds) else len(self.codes)
+        return self.codes[self.starts[index]:end]
+
+    #düğümün alanları; alt düğümler int indeks, diğerleri str ya da None olarak döner
+    def fields(self, index):
+        values = self.values
+        return [code >> 1 if not code & 1 else None if code == NONE_FIELD else values[(code - 3) >> 1]
+                for code in self.field_codes(index)]
+
+    def children(self, index):
+        return [code >> 1 for code in self.field_codes(index) if not code & 1]
+
+    #index'in alt ağacından sonraki ilk düğüm
+    def subtree_end(self, index):
+        remaining = 1
+        while remaining:
+            remaining += len(self.children(index)) - 1
+            index += 1
+        return index
+
+    #alt ağacı (tür, alanlar...) tuple biçimine geri çevirir (format_ast ve eski kodla uyum için)
+    #pre-order'da alt düğümler ebeveynden sonra geldiği için sondan başa tek geçiş yeterlidir
+    def to_tuple(self, index=0):
+        end = self.subtree_end(index)
+        values = self.values
+        built = [None] * (end - index)
+        for node in range(end - 1, index - 1, -1):
+            fields = [built[(code >> 1) - index] if not code & 1
+                      else None if code == NONE_FIELD else values[(code - 3) >> 1]
+                      for code in self.field_codes(node)]
+            kind = self.kinds[node]
+            built[node - index] = fields if kind == SEQUENCE else (NODE_KINDS[kind],) + tuple(fields)
+        return built[0]
+
+    #alt ağaçtaki düğümleri (indeks, tür) olarak sırayla verir, isinstance gerekmez
+    def walk(self, index=0):
+        kinds = self.kinds
+        for node in range(index, self.subtree_end(index)):
+            yield node, NODE_KINDS[kinds[node]]
+
+    #dizilerin kapladığı bayt (values tablosundaki str'ler hariç, onlar tokenlarla ortak)
+    def nbytes(self):
+        return (sum(len(column) * column.itemsize for column in (self.kinds, self.starts, self.codes))
+                + self.values.__sizeof__())
@@ -0,0 +1,131 @@
+#AST düğümünün görünümdeki alt öğeleri: tuple alanları sırayla, listeler düzleştirilerek
+def ast_children(node):
+    if not isinstance(node, tuple):
+        return []
+    children = []
+    for field in node[1:]:
+        if isinstance(field, list):
+            children.extend(field)
+        else:
+            children.append(field)
+    return children
+
+
+#tuple düğümler türüyle, diğer her şey str olarak gösterilir
+def node_label(node):
+    return node[0] if isinstance(node, tuple) else str(node)
+
+
+#write_ast satırları bu kadar biriktirip tek write ile yazar
+WRITE_CHUNK = 4096
+
+
+#AST'yi girintili metin olarak out'a (dosya, StringIO) satır parçaları halinde yazar
+#özyineleme ve string birleştirme yapılmaz, süre çıktı boyutuyla doğrusaldır
+#eski format_ast ile aynı çıktı: bir düğümün son alt öğesi olan değerlerin sondaki boşlukları atılır
+def write_ast(node, out, indent=0):
+    lines = []
+    append = lines.append
+    pads = ["  " * depth for depth in range(32)]
+    #(düğüm, girinti, ebeveynin son alt öğesi mi)
+    stack = [(node, indent, False)]
+    pop, push = stack.pop, stack.append
+    while stack:
+        #biriken satırlar, ardından en az bir satır daha geleceği biliniyorken yazılır
+        if len(lines) >= WRITE_CHUNK:
+            out.write("\n".join(lines))
+            out.write("\n")
+            lines.clear()
+        node, depth, last = pop()
+        while depth >= len(pads):
+            pads.append("  " * len(pads))
+        if type(node) is tuple:
+            append(pads[depth] + node[0])
+            #ast_children, çağrı maliyeti olmasın diye burada açık yazılır
+            children = []
+            for field in node[1:]:
+                if type(field) is list:
+                    children.extend(field)
+                else:
+                    children.append(field)
+            count = len(children)
+            for index in range(count - 1, -1, -1):
+                push((children[index], depth + 1, index == count - 1))
+        else:
+            label = str(node)
+            append(pads[depth] + (label.rstrip() if last else label))
+    out.write("\n".join(lines))
+
+
+#ttk.Treeview üzerinde tembel AST görünümü
+#alt öğeler sadece düğüm açıldığında oluşturulur, açılmamış düğümlerde tek bir boş yer tutucu bulunur
+#update'te üst seviye statement'lar öncekilerle kimlikleri (is) ile karşılaştırılır; IncrementalParser
+#değişmeyen statement'lar için aynı tuple'ları döndürdüğü için sadece değişenlerin öğeleri yenilenir,
+#değişmeyenlerin açık/kapalı durumu korunur
+class ASTView:
+    def __init__(self, tree):
+        self.tree = tree
+        #gösterilen üst seviye statement'lar ve öğe kimlikleri
+        self.statements = []
+        self.items = []
+        #henüz açılmamış öğe -> düğüm; öğe kimlikleri "n<sayı>.<sıra>..." biçimindedir, baştaki kısım
+        #üst seviye öğedir (silinen statement'ların kayıtları bununla temizlenir)
+        self.pending = {}
+        self.counter = 0
+        self.tree.bind("<<TreeviewOpen>>", self.on_open)
+
+    #("PROGRAM", statements) ağacını gösterir, dönüş yenilenen statement sayısı
+    def update(self, ast):
+        statements = ast[1]
+        old = self.statements
+        prefix = 0
+        limit = min(len(old), len(statements))
+        while prefix < limit and old[prefix] is statements[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old[-1 - suffix] is statements[-1 - suffix]:
+            suffix += 1
+
+        removed = self.items[prefix:len(old) - suffix]
+        if removed:
+            self.tree.delete(*removed)
+            removed = set(removed)
+            self.pending = {item: node for item, node in self.pending.items()
+                            if item.split(".", 1)[0] not in removed}
+        added = []
+        for offset, statement in enumerate(statements[prefix:len(statements) - suffix]):
+            self.counter += 1
+            added.append(self.insert("", prefix + offset, statement, f"n{self.counter}"))
+        self.items[prefix:len(old) - suffix] = added
+        self.statements = list(statements)
+        return len(added)
+
+    def clear(self):
+        if self.items:
+            self.tree.delete(*self.items)
+        self.statements, self.items, self.pending = [], [], {}
+
+    #öğeyi ekler, alt öğesi olan düğümlere açılınca doldurulacak bir yer tutucu konur
+    def insert(self, parent, index, node, item):
+        self.tree.insert(parent, index, iid=item, text=node_label(node))
+        if ast_children(node):
+            self.tree.insert(item, "end", iid=item + ".", text="")
+            self.pending[item] = node
+        return item
+
+    #<<TreeviewOpen>>: açılan öğe odaktaki öğedir
+    def on_open(self, event=None):
+        self.expand(self.tree.focus())
+
+    #öğenin alt öğelerini oluşturur (sadece ilk açılışta)
+    def expand(self, item):
+        node = self.pending.pop(item, None)
+        if node is None:
+            return
+        self.tree.delete(item + ".")
+        for index, child in enumerate(ast_children(node)):
+            self.insert(item, "end", child, f"{item}.{index}")
+
+    #görünen ağaç yerine tam AST'yi metin olarak yazar (dışa aktarma)
+    def export(self, out):
+        write_ast(("PROGRAM", self.statements), out)
@@ -0,0 +1,135 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from lexer import Lexer
+from lineindex import LineIndex
+from parser import Parser
+
+#her işçi süreçte bir kere oluşturulan lexer (master regex tekrar derlenmez)
+_lexer = None
+
+
+def get_lexer():
+    global _lexer
+    if _lexer is None:
+        _lexer = Lexer()
+    return _lexer
+
+
+#kök dizindeki tüm .py dosyalarını sıralı olarak bulur (çıktı sırası buna göredir)
+def find_sources(root):
+    if os.path.isfile(root):
+        return [root]
+    sources = []
+    for directory, subdirs, files in os.walk(root):
+        subdirs[:] = sorted(d for d in subdirs if not d.startswith("."))
+        for name in sorted(files):
+            if name.endswith(".py"):
+                sources.append(os.path.join(directory, name))
+    return sources
+
+
+#tek dosyayı tokenize ve parse eder, JSON'a yazılacak sonucu döndürür
+#mode "ast" ise AST, "tokens" ise [tür, değer, başlangıç, bitiş] listesi yazılır
+def process_file(path, mode="ast"):
+    result = {"path": path}
+    try:
+        with open(path, encoding="utf-8", errors="replace") as file:
+            text = file.read()
+    except OSError as e:
+        result["error"] = str(e)
+        return result
+
+    lexer = get_lexer()
+    start = time.perf_counter()
+    tokens = lexer.tokenize(text)
+    lex_time = time.perf_counter() - start
+    result["lines"] = text.count("\n") + 1
+    result["token_count"] = len(tokens)
+    result["lex_ms"] = round(lex_time * 1000, 3)
+    if lexer.diagnostics:
+        result["diagnostics"] = len(lexer.diagnostics)
+    if mode == "tokens":
+        result["tokens"] = [(t.type, t.value, t.position[0], t.position[1]) for t in tokens]
+
+    parser = Parser(tokens, LineIndex(text))
+    start = time.perf_counter()
+    try:
+        ast = parser.parse()
+        if mode == "ast":
+            result["ast"] = ast
+    except (SyntaxError, RecursionError) as e:
+        result["error"] = str(e)
+        result["error_position"] = parser.get_position()
+    except Exception as e:
+        #parser'daki beklenmeyen bir hata sadece bu dosyanın sonucuna yazılır, toplu işi durdurmaz
+        result["error"] = f"{type(e).__name__}: {e}"
+        result["error_position"] = parser.get_position()
+    result["parse_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return result
+
+
+#process pool'a gönderilen iş: (yol, mod) çifti
+def process_job(job):
+    return process_file(*job)
+
+
+#dosyaları işçi süreçlere chunk_size'lık parçalar halinde dağıtır
+#executor.map sonuçları gönderim sırasıyla verdiği için çıktı, hangi işçinin önce bittiğinden bağımsızdır
+def run_batch(root, output, workers=None, chunk_size=16, mode="ast"):
+    sources = find_sources(root)
+    jobs = [(path, mode) for path in sources]
+    workers = workers or os.cpu_count() or 1
+    relative = os.path.isdir(root)
+
+    summary = {"files": 0, "tokens": 0, "errors": 0}
+    start = time.perf_counter()
+    if workers == 1:
+        results = map(process_job, jobs)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(process_job, jobs, chunksize=chunk_size)
+    try:
+        for result in results:
+            if relative:
+                result["path"] = os.path.relpath(result["path"], root)
+            output.write(json.dumps(result, ensure_ascii=False))
+            output.write("\n")
+            summary["files"] += 1
+            summary["tokens"] += result.get("token_count", 0)
+            summary["errors"] += "error" in result
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    summary["seconds"] = round(time.perf_counter() - start, 3)
+    summary["workers"] = workers
+    return summary
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(
+        prog="batch.py",
+        description="Dizindeki tüm .py dosyalarını paralel olarak tokenize ve parse eder, sonuçları JSON Lines olarak yazar.")
+    arg_parser.add_argument("root", help="taranacak dizin ya da dosya")
+    arg_parser.add_argument("-o", "--output", help="çıktı dosyası (varsayılan: stdout)")
+    arg_parser.add_argument("-j", "--workers", type=int, default=None, help="işçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    arg_parser.add_argument("--chunk-size", type=int, default=16, help="bir işçiye tek seferde gönderilen dosya sayısı")
+    arg_parser.add_argument("--tokens", action="store_true", help="AST yerine token listesini yaz")
+    args = arg_parser.parse_args(argv)
+
+    mode = "tokens" if args.tokens else "ast"
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            summary = run_batch(args.root, output, args.workers, args.chunk_size, mode)
+    else:
+        summary = run_batch(args.root, sys.stdout, args.workers, args.chunk_size, mode)
+    print(f"{summary['files']} dosya, {summary['tokens']} token, {summary['errors']} hata, "
+          f"{summary['seconds']} sn ({summary['workers']} işçi)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,775 @@
+import gc
+import html
+import io
+import json
+import mmap
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from arena import NODE_KINDS, ASTArena
+from astview import write_ast
+from benchmarks.faketext import FakeText
+from benchmarks.suite import smoke
+from cache import LRUCache, content_key
+from core import Analyzer
+from highlighter import SyntaxHighlighter
+from lexer import IncrementalLexer, Lexer, TokenArray
+from loader import FileLoader
+from parser import IncrementalParser, Parser
+from profiling import Profiler
+from render import write_ansi, write_html, write_latex
+from symbols import SymbolIndex
+
+#ölçümlerde kullanılan örnek kod, istenen satır sayısına kadar tekrarlanır
+SAMPLE_CODE = '''# Python Syntax Highlighter Example
+def calculate_fibonacci(n):
+    """Calculate nth Fibonacci number"""
+    if n <= 1:
+        return n
+    else:
+        return calculate_fibonacci(n-1) + calculate_fibonacci(n-2)
+
+numbers = [0, 1, 2, 3, 5, 8, 13]
+for num in numbers:
+    result = calculate_fibonacci(num)
+    print(f"Fibonacci({num}) = {result}")
+
+class Person:
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+
+    def greet(self):
+        return f"Hello, I'm {self.name} and I'm {self.age} years old!"
+
+person = Person('Alice', 25)
+message = person.greet()
+floating = 3.14159 * 2 // 7 ** 2 != 1 <= 5
+'''
+
+
+#türkçe isimler, emoji ve tanımsız karakterler içeren örnek kod
+UNICODE_SAMPLE_CODE = '''# Öğrenci notları 📚
+def ortalama_hesapla(öğrenci_listesi):
+    toplam_puan = 0
+    for öğrenci in öğrenci_listesi:
+        toplam_puan = toplam_puan + öğrenci.puan
+    return toplam_puan / len(öğrenci_listesi)
+
+sınıf_adı = "Bilgisayar Mühendisliği 🎓"
+başarı_oranı = ortalama_hesapla(öğrenciler) ✅ @etiket $değer
+görüşler = ["çok iyi 👍", "güzel 😀"] 🚀🚀🚀
+'''
+
+
+#ifade ağırlıklı örnek kod, iki ifade motorunun da desteklediği operatörlerle
+EXPRESSION_SAMPLE_CODE = '''total = (price * quantity - discount) / 100 + tax * (1 + rate) // 2
+flag = count + 1 >= limit * 2 - offset != (width - 1) * height % 7
+score = -value * weight + bonus(level, streak * 3) - penalty[0] / (1 + misses)
+area = (x2 - x1) * (y2 - y1) + (z2 - z1) * depth - [a, b, c] == {d, e}
+'''
+
+
+#atama ağırlıklı örnek kod, uzun noktalı isimlerle (is_assignment ileri bakışı için)
+ASSIGNMENT_SAMPLE_CODE = '''self.config.network.timeout = settings.defaults.network.timeout
+self.state.current.index = self.state.current.index + 1
+app.window.layout.sidebar.width = app.window.layout.width // 4
+result = self.cache.entries.lookup(key)
+self.stats.requests.total = self.stats.requests.total + batch.size
+'''
+
+
+#istenen satır sayısında kaynak kod üretir
+def make_source(lines=20000, sample=SAMPLE_CODE):
+    sample_lines = sample.splitlines(keepends=True)
+    repeat = lines // len(sample_lines) + 1
+    return "".join((sample_lines * repeat)[:lines])
+
+
+#fonksiyonu birkaç kez çalıştırıp en iyi süreyi döndürür
+def measure(func, *args, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+#iki motorun aynı token akışını ürettiğini kontrol eder
+def check_tokenize_parity(lexer, text):
+    loop_tokens = [(t.type, t.value, t.position) for t in lexer.tokenize_loop(text)]
+    regex_tokens = [(t.type, t.value, t.position) for t in lexer.tokenize_regex(text)]
+    if loop_tokens != regex_tokens:
+        for index, (a, b) in enumerate(zip(loop_tokens, regex_tokens)):
+            if a != b:
+                raise AssertionError(f"Token {index} farklı: loop={a} regex={b}")
+        raise AssertionError(f"Token sayısı farklı: loop={len(loop_tokens)} regex={len(regex_tokens)}")
+    return len(loop_tokens)
+
+
+#loop ve regex motorlarının hızını karşılaştırır
+def bench_tokenize(lines=20000):
+    lexer = Lexer()
+    text = make_source(lines)
+    token_count = check_tokenize_parity(lexer, text)
+    size_mb = len(text) / 1e6
+
+    print(f"tokenize: {lines} satır, {len(text)} karakter, {token_count} token (parity OK)")
+    results = {}
+    for engine in Lexer.ENGINES:
+        elapsed = measure(getattr(lexer, f"tokenize_{engine}"), text)
+        results[engine] = elapsed
+        print(f"  {engine:<6} {elapsed * 1000:9.1f} ms  {size_mb / elapsed:7.2f} MB/s")
+    print(f"  hızlanma: {results['loop'] / results['regex']:.1f}x")
+    return results
+
+
+#fonksiyonun çalışırken ayırdığı en yüksek bellek miktarı (bayt)
+def peak_memory(func, *args):
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+#tüm metni tokenize etmek ile dosyadan akış halinde tokenize etmeyi karşılaştırır
+def bench_stream(lines=20000):
+    lexer = Lexer()
+    data = make_source(lines).encode("utf-8")
+
+    def whole():
+        text = io.BytesIO(data).read().decode("utf-8")
+        return len(lexer.tokenize(text))
+
+    def streaming():
+        count = 0
+        for _ in lexer.tokenize_stream(io.BytesIO(data)):
+            count += 1
+        return count
+
+    print(f"stream: {lines} satır, {len(data)} bayt")
+    for name, func in (("tokenize", whole), ("stream", streaming)):
+        elapsed = measure(func)
+        peak = peak_memory(func)
+        print(f"  {name:<8} {elapsed * 1000:9.1f} ms  tepe bellek {peak / 1e6:8.2f} MB")
+
+
+#ascii dışı karakterlerin yoğun olduğu kodda iki motorun hızı ve üretilen ERROR tokenları
+def bench_unicode(lines=20000):
+    lexer = Lexer()
+    text = make_source(lines, UNICODE_SAMPLE_CODE)
+    token_count = check_tokenize_parity(lexer, text)
+    size_mb = len(text.encode("utf-8")) / 1e6
+
+    print(f"unicode: {lines} satır, {len(text)} karakter, {token_count} token (parity OK)")
+    for engine in Lexer.ENGINES:
+        elapsed = measure(getattr(lexer, f"tokenize_{engine}"), text)
+        print(f"  {engine:<6} {elapsed * 1000:9.1f} ms  {size_mb / elapsed:7.2f} MB/s  "
+              f"{len(lexer.diagnostics)} ERROR tokenı")
+
+
+#dosyayı okuyup çözerek tokenize etmek ile mmap üzerinde bayt olarak tokenize etmeyi karşılaştırır
+def bench_bytes(lines=20000):
+    lexer = Lexer()
+    with tempfile.TemporaryDirectory() as directory:
+        for name, sample in (("ascii", SAMPLE_CODE), ("unicode", UNICODE_SAMPLE_CODE)):
+            path = os.path.join(directory, f"{name}.py")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(make_source(lines, sample))
+
+            def decoded():
+                with open(path, encoding="utf-8") as file:
+                    return lexer.tokenize_array(file.read())
+
+            def mapped():
+                with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    view = memoryview(data)
+                    try:
+                        return len(lexer.tokenize_bytes(view))
+                    finally:
+                        view.release()
+
+            #bayt konumları karakter konumlarına çevrilince tokenize_array ile aynı olmalı
+            with open(path, "rb") as file:
+                data = file.read()
+            expected = decoded()
+            converted = lexer.tokenize_bytes(data).decode()
+            if (list(expected.kinds), list(expected.starts), list(expected.ends)) != \
+                    (list(converted.kinds), list(converted.starts), list(converted.ends)):
+                raise AssertionError(f"tokenize_bytes ({name}) tokenize_array ile aynı değil")
+
+            print(f"bytes ({name}): {lines} satır, {len(data)} bayt, {len(expected)} token (parity OK)")
+            for label, func in (("decode+str", decoded), ("mmap", mapped)):
+                elapsed = measure(func)
+                peak = peak_memory(func)
+                print(f"  {label:<10} {elapsed * 1000:9.1f} ms  {len(data) / 1e6 / elapsed:7.2f} MB/s  "
+                      f"tepe bellek {peak / 1e6:8.2f} MB")
+
+
+#dosyanın ortasına tek karakter eklenip silinirken tam parse ile artımlı parse'ı karşılaştırır
+def bench_reparse(lines=20000, edits=20):
+    lexer = Lexer()
+    text = make_source(lines)
+    incremental = IncrementalLexer(lexer)
+    incremental.reset(text)
+    parser = IncrementalParser()
+    parser.parse(incremental.tokens)
+    #highlighter'ın yolu: damage Analyzer.update'te birikir, Analyzer.parse'ta alınır
+    analyzer = Analyzer(lexer, cache_size=0)
+    analyzer.update(text)
+    analyzer.parse(text)
+
+    full_time = incremental_time = analyzer_time = 0.0
+    reparsed = analyzer_reparsed = 0
+    for step in range(edits):
+        #üst seviye bir satırın önüne sırayla ekleme ve geri silme, metin her iki adımda bir başa döner
+        if step % 2 == 0:
+            offset = text.index("\nnumbers", len(text) // 2 + step * 997) + 1
+        if step % 2 == 0:
+            damage = incremental.apply_edit(offset, 0, "x = 1\n")
+        else:
+            damage = incremental.apply_edit(offset, len("x = 1\n"), "")
+        text = incremental.text
+
+        start = time.perf_counter()
+        expected = Parser(incremental.tokens).parse()
+        full_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = parser.parse(incremental.tokens, None, damage[:3])
+        incremental_time += time.perf_counter() - start
+        reparsed += parser.reparsed
+        if result != expected:
+            raise AssertionError(f"artımlı parse {step}. düzenlemede tam parse ile aynı değil")
+
+        start = time.perf_counter()
+        analyzer.update(text)
+        result = analyzer.parse(text)
+        analyzer_time += time.perf_counter() - start
+        analyzer_reparsed += analyzer.incremental_parser.reparsed
+        if result != expected:
+            raise AssertionError(f"Analyzer.parse {step}. düzenlemede tam parse ile aynı değil")
+
+    print(f"reparse: {lines} satır, {len(parser.statements)} statement, {edits} düzenleme (AST'ler aynı)")
+    print(f"  tam parse   {full_time / edits * 1000:9.2f} ms/düzenleme")
+    print(f"  artımlı     {incremental_time / edits * 1000:9.2f} ms/düzenleme  "
+          f"ortalama {reparsed / edits:.1f} statement yeniden parse edildi")
+    #lex dahil; statement sayısı artımlı satırıyla aynı olmalı
+    print(f"  Analyzer    {analyzer_time / edits * 1000:9.2f} ms/düzenleme  "
+          f"ortalama {analyzer_reparsed / edits:.1f} statement yeniden parse edildi")
+
+
+#düzenle/geri al döngüsü: metin her iki adımda bir önceki haline döner
+#önbellekli taraf highlighter gibi metnin hash'ine bakar, isabette parse etmeden duruma döner
+def bench_cache(lines=20000, edits=20):
+    lexer = Lexer()
+    text = make_source(lines)
+    offset = text.index("\nnumbers", len(text) // 2) + 1
+    results = {}
+    for cached in (False, True):
+        incremental = IncrementalLexer(lexer)
+        incremental.reset(text)
+        parser = IncrementalParser(recover=True)
+        parser.parse(incremental.tokens)
+        cache = LRUCache()
+        elapsed = 0.0
+        asts = []
+        for step in range(edits):
+            if step % 2 == 0:
+                damage = incremental.apply_edit(offset, 0, "x = (1 +\n")
+            else:
+                damage = incremental.apply_edit(offset, len("x = (1 +\n"), "")
+            gc.collect()
+            start = time.perf_counter()
+            snapshot = None
+            if cached:
+                key = content_key(incremental.text)
+                snapshot = cache.get(key)
+            if snapshot is not None:
+                ast = parser.restore(snapshot)
+            else:
+                ast = parser.parse(incremental.tokens, None, damage[:3])
+                if cached:
+                    cache.put(key, parser.snapshot(), 64 * len(incremental.tokens))
+            elapsed += time.perf_counter() - start
+            asts.append((ast, parser.errors))
+        results[cached] = elapsed, asts, cache
+    if results[False][1] != results[True][1]:
+        raise AssertionError("önbellekten dönen AST'ler parse edilenlerle aynı değil")
+
+    print(f"cache: {lines} satır, {edits} düzenle/geri al adımı (AST'ler aynı)")
+    for cached in (False, True):
+        elapsed, _, cache = results[cached]
+        line = f"  {'önbellekli' if cached else 'önbelleksiz':<12} {elapsed / edits * 1000:9.2f} ms/düzenleme"
+        if cached:
+            stats = cache.stats()
+            line += f"  {stats['hits']} isabet, {stats['misses']} ıska"
+        print(line)
+
+    #baştan tokenize ile önbellekteki snapshot'tan geri yükleme
+    incremental = IncrementalLexer(lexer)
+    incremental.reset(text)
+    snapshot = incremental.snapshot()
+    gc.collect()
+    reset_time = measure(incremental.reset, text)
+    gc.collect()
+    restore_time = measure(incremental.restore, snapshot)
+    print(f"  {'reset':<12} {reset_time * 1000:9.2f} ms")
+    print(f"  {'restore':<12} {restore_time * 1000:9.2f} ms")
+
+
+#düzenleme başına artımlı analiz (update + parse) profiler kapalıyken ve açıkken; açık profiler her analizde
+#aşama sürelerini, sayaçları ve AST düğüm sayısını (sadece yeni statement'lar dolaşılarak) kaydeder
+def bench_profiling(lines=20000, edits=40):
+    text = make_source(lines)
+    offset = text.index("\nnumbers", len(text) // 2) + 1
+    results = {}
+    for enabled in (False, True):
+        profiler = Profiler(enabled=enabled)
+        analyzer = Analyzer(Lexer(), cache_size=0, profiler=profiler)
+        analyzer.update(text)
+        analyzer.parse(text)
+        elapsed = 0.0
+        for step in range(edits):
+            edited = text[:offset] + "x = 1\n" + text[offset:] if step % 2 == 0 else text
+            gc.collect()
+            start = time.perf_counter()
+            with profiler.run("edit"):
+                analyzer.update(edited)
+                analyzer.parse(edited)
+            elapsed += time.perf_counter() - start
+        results[enabled] = elapsed / edits, profiler
+
+    print(f"profiling: {lines} satır, {edits} düzenleme")
+    for enabled in (False, True):
+        elapsed, profiler = results[enabled]
+        print(f"  {'açık' if enabled else 'kapalı':<8} {elapsed * 1000:9.3f} ms/düzenleme")
+    print(f"  ek maliyet: {(results[True][0] - results[False][0]) * 1e6:.0f} µs/düzenleme")
+    summary = results[True][1].summary()
+    for name, stage in summary["stages"].items():
+        print(f"    {name:<8} ortalama {stage['mean_ms']:7.3f} ms")
+    #ek maliyetin çoğu yeniden parse edilen statement'ların AST düğümlerini saymaktır
+    print(f"    yeniden parse edilen statement ortalaması {summary['counters']['reparsed'] / summary['runs']:.0f}")
+
+
+#büyük bir dosyayı tek insert ve tam analizle açmak ile FileLoader'ın parça parça yüklemesini karşılaştırır
+#tk yerine FakeText (tk'nin kendi insert maliyeti ölçülmez); parse iki tarafta da arka plan zamanlayıcısıyla
+#yapılır, ölçülen tk thread'inde geçen süredir: ilk ekranın renklenmesine kadar geçen süre ve en uzun kesinti
+def bench_loading(lines=200000):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "buyuk.py")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(make_source(lines))
+        size = os.path.getsize(path)
+
+        def make_highlighter():
+            widget = FakeText(view=(0.0, 0.0), deferred=True)
+            return widget, SyntaxHighlighter(widget, Lexer(), FakeText(), viewport=True, cache_size=0,
+                                             background=True)
+
+        #eski yol: dosya okunur, tek insert, highlight ve parse zamanlaması tek seferde
+        widget, highlighter = make_highlighter()
+        start = time.perf_counter()
+        with open(path, encoding="utf-8") as file:
+            content = file.read()
+        widget.insert("1.0", content)
+        highlighter.scheduler.run()
+        whole = time.perf_counter() - start
+        highlighter.scheduler.shutdown()
+        #ilk yolun tokenları ikinci yolun çöp toplama turlarına karışmasın
+        del widget, highlighter
+        gc.collect()
+
+        #FileLoader: her zamanlayıcı bir tk kesintisidir, ilki dosyanın başını gösterir
+        widget, highlighter = make_highlighter()
+        loader = FileLoader(widget, highlighter)
+        pauses = []
+        start = time.perf_counter()
+        loader.load(path)
+        pauses.append(time.perf_counter() - start)
+        #yükleme bitince zamanlanan analiz de (highlight ve parse'ın işçi thread'e verilmesi) bir kesintidir
+        while loader.loading or highlighter.scheduler.scheduled is not None:
+            tick_start = time.perf_counter()
+            widget.run_pending()
+            pauses.append(time.perf_counter() - tick_start)
+        total = time.perf_counter() - start
+        highlighter.scheduler.shutdown()
+        if highlighter.incremental.text != content:
+            raise AssertionError("FileLoader dosyanın metnini yüklemedi")
+
+    print(f"loading: {lines} satır, {size / 1e6:.1f} MB")
+    print(f"  tek insert    kesinti {whole * 1000:8.1f} ms")
+    #parça başına iş neredeyse sadece parçanın boyutu kadardır (metin kopyası hariç); en uzun kesinti çoğunlukla yükleme bitince zamanlanan
+    #analizdir (tokenların işçi thread için kopyalanması)
+    print(f"  FileLoader    ilk ekran {pauses[0] * 1000:6.1f} ms  ortalama kesinti "
+          f"{sum(pauses) / len(pauses) * 1000:6.1f} ms  en uzun {max(pauses) * 1000:6.1f} ms  "
+          f"{len(pauses)} tick, toplam {total * 1000:8.1f} ms")
+
+
+#write_ast'ten önceki format_ast, karşılaştırma için (her seviyede string birleştirme)
+def concat_format_ast(node, indent=0):
+    if not isinstance(node, tuple):
+        return "  " * indent + str(node)
+    result = "  " * indent + node[0] + "\n"
+    for child in node[1:]:
+        if isinstance(child, list):
+            for item in child:
+                result += concat_format_ast(item, indent + 1) + "\n"
+        elif isinstance(child, tuple):
+            result += concat_format_ast(child, indent + 1) + "\n"
+        else:
+            result += "  " * (indent + 1) + str(child) + "\n"
+    return result.rstrip()
+
+
+#birleştirmede her seviye alt ağacının metnini tekrar kopyalar, derin ağaçlarda süre karesel büyür
+def bench_format(lines=20000, depth=250):
+    lexer = Lexer()
+    deep_source = "".join(f"x{i} = " + "(" * depth + "1" + " + 1)" * depth + "\n" for i in range(20))
+    for name, source in (("örnek", make_source(lines)), (f"{depth} derinlik", deep_source)):
+        ast = Parser(lexer.tokenize(source)).parse()
+
+        def streaming():
+            out = io.StringIO()
+            write_ast(ast, out)
+            return out.getvalue()
+
+        text = streaming()
+        if text != concat_format_ast(ast):
+            raise AssertionError("write_ast eski format_ast ile aynı metni üretmedi")
+        print(f"format ({name}): {source.count(chr(10))} satır, {text.count(chr(10)) + 1} satırlık AST metni (çıktılar aynı)")
+        for label, func in (("birleştirme", lambda: concat_format_ast(ast)), ("write_ast", streaming)):
+            gc.collect()
+            print(f"  {label:<12} {measure(func) * 1000:9.1f} ms")
+
+
+#bir ismin tanımlarını AST'yi dolaşarak bulur, karşılaştırma için
+def walk_definitions(node, name, found):
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, tuple):
+            if node[0] in ("FUNC_DEF", "CLASS_DEF", "ASSIGN") and node[1] == name:
+                found.append(node)
+            stack.extend(field for field in node[1:] if isinstance(field, (tuple, list)))
+    return found
+
+
+def bench_symbols(lines=20000, queries=100):
+    lexer = Lexer()
+    tokens = lexer.tokenize(make_source(lines))
+    parser = Parser(tokens)
+    ast = parser.parse()
+    index = SymbolIndex(tokens, [start for start, _ in parser.statement_spans], parser.symbols)
+    names = index.names()
+    if any(len(index.definitions(name)) != len(walk_definitions(ast, name, [])) for name in names):
+        raise AssertionError("tanım indeksi ile AST dolaşması farklı sayıda tanım buldu")
+    print(f"symbols: {lines} satır, {len(index)} tanım, {len(names)} isim (sonuçlar aynı)")
+    gc.collect()
+    walk_time = measure(lambda: [walk_definitions(ast, names[i % len(names)], []) for i in range(queries)])
+    gc.collect()
+    index_time = measure(lambda: [index.definitions(names[i % len(names)]) for i in range(queries)])
+    print(f"  {'AST dolaşma':<12} {walk_time / queries * 1000:9.3f} ms/sorgu")
+    print(f"  {'indeks':<12} {index_time / queries * 1000:9.3f} ms/sorgu")
+
+
+#token başına kaçış ve string birleştirme ile HTML (karşılaştırma için eski yöntem)
+def concat_html(text, tokens):
+    result = '<pre class="hl">'
+    position = 0
+    for token in tokens:
+        start, end = token.position
+        result += html.escape(text[position:start], quote=False)
+        result += f'<span class="hl-{token.type}">' + html.escape(token.value, quote=False) + "</span>"
+        position = end
+    return result + html.escape(text[position:], quote=False) + "</pre>\n"
+
+
+#write_html'i eski yöntemle (aynı çıktı), TokenArray ile ve ANSI/LaTeX çıktılarıyla karşılaştırır
+def bench_render(lines=20000):
+    lexer = Lexer()
+    text = make_source(lines)
+    tokens = lexer.tokenize(text)
+    array = lexer.tokenize_array(text)
+    out = io.StringIO()
+    write_html(text, tokens, out, standalone=False)
+    assert out.getvalue() == concat_html(text, tokens)
+    size_mb = len(text.encode("utf-8")) / 1e6
+    print(f"render: {lines} satır, {size_mb:.2f} MB, {len(tokens)} token (HTML eski yöntemle aynı)")
+
+    def run(writer, source):
+        out = io.StringIO()
+        writer(text, source, out)
+        return out
+
+    cases = (("html (birleştirme)", lambda: concat_html(text, tokens)),
+             ("html", lambda: run(write_html, tokens)),
+             ("html (TokenArray)", lambda: run(write_html, array)),
+             ("ansi", lambda: run(write_ansi, tokens)),
+             ("latex", lambda: run(write_latex, tokens)))
+    for name, func in cases:
+        elapsed = measure(func)
+        print(f"  {name:<20} {elapsed * 1000:9.1f} ms  {size_mb / elapsed:7.2f} MB/s")
+
+
+#ayrı bir python sürecinde kodun çalışma süresi (yorumlayıcının açılışı dahil), en iyi süre
+def process_time(args, repeat=5):
+    return measure(subprocess.run, [sys.executable] + args, repeat=repeat)
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+#server.py'nin başlangıç süresi ve istek başına gecikmesi, tek seferlik süreçlerle karşılaştırmalı
+def bench_server(lines=2000, requests=300):
+    here = os.path.dirname(os.path.abspath(__file__))
+    text = make_source(lines)
+    print(f"server: {lines} satır, {requests} istek")
+    for name, code in (("python", "pass"), ("import core", "import core"),
+                       ("import highlighter", "import highlighter")):
+        elapsed = process_time(["-c", code])
+        print(f"  {name:<22} {elapsed * 1000:9.1f} ms (süreç)")
+
+    with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False, encoding="utf-8") as file:
+        file.write(text)
+    try:
+        one_shot = process_time([os.path.join(here, "render.py"), file.name, "-o", os.devnull])
+    finally:
+        os.unlink(file.name)
+    print(f"  {'render.py (tek sefer)':<22} {one_shot * 1000:9.1f} ms/istek")
+
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, os.path.join(here, "server.py")], stdin=subprocess.PIPE,
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding="utf-8")
+    try:
+        process.stderr.readline()
+        ready = time.perf_counter() - start
+        print(f"  {'server hazır':<22} {ready * 1000:9.1f} ms")
+
+        def call(method, params, request_id=1):
+            process.stdin.write(json.dumps({"jsonrpc": "2.0", "id": request_id, "method": method,
+                                            "params": params}) + "\n")
+            process.stdin.flush()
+            return json.loads(process.stdout.readline())
+
+        #ilk yanıt: yorumlayıcının açılışı dahil süreçten sonuca kadar
+        call("highlight", {"text": text, "format": "html"})
+        print(f"  {'ilk yanıt':<22} {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+        cases = (("highlight html", "highlight", {"format": "html"}, False),
+                 ("highlight (belge)", "highlight", {"document": "bench"}, True),
+                 ("highlight (değişen)", "highlight", {"document": "bench", "changed_only": True}, True),
+                 ("parse (belge)", "parse", {"document": "bench"}, True))
+        for name, method, params, edit in cases:
+            latencies = []
+            for index in range(requests):
+                #belge isteklerinde her istek bir önceki metnin küçük bir düzenlemesidir
+                source = text + f"edit_{index} = {index}\n" if edit else text
+                request_start = time.perf_counter()
+                response = call(method, dict(params, text=source), index)
+                latencies.append(time.perf_counter() - request_start)
+                assert "result" in response, response
+            print(f"  {name:<22} p50 {percentile(latencies, 0.5) * 1000:7.2f} ms  "
+                  f"p99 {percentile(latencies, 0.99) * 1000:7.2f} ms")
+
+        #istekler yanıt beklenmeden art arda gönderilir, havuz aynı anda işler
+        #(yanıtlar okunurken yazılır, yoksa iki yöndeki pipe'lar dolunca iki taraf da bekler)
+        small = "\n".join(text.splitlines()[:50])
+
+        def send_all():
+            for index in range(requests):
+                process.stdin.write(json.dumps({"jsonrpc": "2.0", "id": index, "method": "highlight",
+                                                "params": {"text": small}}) + "\n")
+            process.stdin.flush()
+
+        start = time.perf_counter()
+        sender = threading.Thread(target=send_all)
+        sender.start()
+        ids = {json.loads(process.stdout.readline())["id"] for _ in range(requests)}
+        sender.join()
+        assert ids == set(range(requests))
+        elapsed = time.perf_counter() - start
+        print(f"  {'art arda (50 satır)':<22} {requests / elapsed:9.0f} istek/sn")
+        stats = call("stats", {})["result"]
+        print(f"  sunucu ölçümü: başlangıç {stats['startup_ms']:.1f} ms, "
+              f"highlight p50 {stats['methods']['highlight']['p50_ms']:.2f} ms")
+        call("shutdown", {})
+    finally:
+        process.stdin.close()
+        process.wait()
+
+
+#tuple AST düğümlerini türlerine göre sayar (isinstance ile dolaşma)
+def count_tuple_kinds(node, counts):
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, tuple):
+            counts[node[0]] = counts.get(node[0], 0) + 1
+            stack.extend(node[1:])
+    return counts
+
+
+#tuple AST ile ASTArena'nın bellek kullanımını ve dolaşma hızını karşılaştırır
+def bench_ast(lines=20000):
+    lexer = Lexer()
+    tokens = lexer.tokenize(make_source(lines))
+
+    tracemalloc.start()
+    ast = Parser(tokens).parse()
+    tuple_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    arena = ASTArena.from_tuple(ast)
+    arena_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    if arena.to_tuple() != ast:
+        raise AssertionError("ASTArena.to_tuple tuple AST ile aynı değil")
+
+    def arena_counts():
+        counts = [0] * len(NODE_KINDS)
+        for code in arena.kinds:
+            counts[code] += 1
+        return counts
+
+    tuple_counts = count_tuple_kinds(ast, {})
+    print(f"ast: {lines} satır, {len(arena)} düğüm (to_tuple aynı)")
+    print(f"  tuple      {tuple_size / 1e6:8.2f} MB  {tuple_size / len(arena):6.1f} B/düğüm  "
+          f"parse {measure(lambda: Parser(tokens).parse()) * 1000:8.1f} ms  "
+          f"dolaşma {measure(count_tuple_kinds, ast, {}) * 1000:7.1f} ms")
+    print(f"  ASTArena   {arena_size / 1e6:8.2f} MB  {arena_size / len(arena):6.1f} B/düğüm  "
+          f"dönüştürme {measure(ASTArena.from_tuple, ast) * 1000:5.1f} ms  "
+          f"dolaşma {measure(arena_counts) * 1000:7.1f} ms  to_tuple {measure(arena.to_tuple) * 1000:7.1f} ms")
+    return tuple_counts
+
+
+#ifade ağırlıklı kodda pratt ve descent ifade motorlarını karşılaştırır, ayrıca iki motorun
+#recursion limitine takılmadan parse edebildiği en derin parantez iç içeliğini ölçer
+def bench_expressions(lines=20000):
+    lexer = Lexer()
+    tokens = lexer.tokenize(make_source(lines, EXPRESSION_SAMPLE_CODE))
+    if Parser(tokens, engine="pratt").parse() != Parser(tokens, engine="descent").parse():
+        raise AssertionError("pratt ve descent motorları farklı AST üretti")
+
+    print(f"ifade: {lines} satır, {len(tokens)} token (AST'ler aynı)")
+    for engine in Parser.ENGINES:
+        #önceki ölçümlerin çöpleri bu ölçümün gc süresine eklenmesin
+        gc.collect()
+        elapsed = measure(lambda: Parser(tokens, engine=engine).parse())
+        depth = max_nesting(lexer, engine)
+        print(f"  {engine:<8} {elapsed * 1000:9.1f} ms  en derin iç içe parantez: {depth}")
+
+
+#motorun RecursionError vermeden parse ettiği en derin "x = ((((1))))" iç içeliği
+def max_nesting(lexer, engine):
+    low, high = 1, sys.getrecursionlimit()
+    while low < high:
+        depth = (low + high + 1) // 2
+        tokens = lexer.tokenize("x = " + "(" * depth + "1" + ")" * depth)
+        try:
+            Parser(tokens, engine=engine).parse()
+            low = depth
+        except RecursionError:
+            high = depth - 1
+    return low
+
+
+#atama ağırlıklı kodda kural önbelleği (memoize) açık ve kapalı parse'ı karşılaştırır
+#geri dönen tek kural is_assignment olduğu için statement başına bir isabet olur, fark gürültü içindedir
+def bench_memoize(lines=20000):
+    lexer = Lexer()
+    tokens = lexer.tokenize(make_source(lines, ASSIGNMENT_SAMPLE_CODE))
+    if Parser(tokens).parse() != Parser(tokens, memoize=False).parse():
+        raise AssertionError("memoize açık ve kapalı parse farklı AST üretti")
+
+    parser = Parser(tokens)
+    parser.parse()
+    print(f"memoize: {lines} satır, {len(tokens)} token (AST'ler aynı), {parser.memo_hits} önbellek isabeti")
+    for memoize in (False, True):
+        gc.collect()
+        elapsed = measure(lambda: Parser(tokens, memoize=memoize).parse())
+        print(f"  {'açık' if memoize else 'kapalı':<7} {elapsed * 1000:9.1f} ms")
+
+
+#__slots__ eklenmeden önceki Token, karşılaştırma için
+class DictToken:
+    def __init__(self, type, value, position):
+        self.type = type
+        self.value = value
+        self.position = position
+
+
+#token listesi ile TokenArray'in bellek kullanımını karşılaştırır (kaynak metin hariç)
+def bench_memory(lines=20000):
+    lexer = Lexer()
+    text = make_source(lines)
+    tokens = lexer.tokenize(text)
+
+    def dict_tokens():
+        return [DictToken(t.type, t.value[:], t.position) for t in lexer.tokenize(text)]
+
+    def slot_tokens():
+        return lexer.tokenize(text)
+
+    def token_array():
+        return lexer.tokenize_array(text)
+
+    print(f"bellek: {lines} satır, {len(tokens)} token")
+    results = {}
+    for name, func in (("Token (__dict__)", dict_tokens), ("Token (__slots__)", slot_tokens),
+                       ("TokenArray", token_array)):
+        tracemalloc.start()
+        kept = func()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del kept
+        elapsed = measure(func)
+        results[name] = size
+        print(f"  {name:<18} {size / 1e6:8.2f} MB  {size / len(tokens):6.1f} B/token  {elapsed * 1000:8.1f} ms")
+    return results
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    lines = int(argv[0]) if argv else 20000
+    #ölçüm takımının (python -m benchmarks) bütün durumları önce küçük bir kaynakla bir kere çalıştırılır
+    smoke()
+    bench_tokenize(lines)
+    bench_stream(lines)
+    bench_memory(lines)
+    bench_unicode(lines)
+    bench_bytes(lines)
+    bench_reparse(lines)
+    bench_ast(lines)
+    bench_expressions(lines)
+    bench_memoize(lines)
+    bench_cache(lines)
+    bench_format(lines)
+    bench_symbols(lines)
+    bench_render(lines)
+    bench_profiling(lines)
+    #çok MB'lık dosyalar; kesintiler dosya boyutuyla büyümemeli
+    bench_loading(lines * 10)
+    bench_loading(lines * 20)
+    bench_server()
+
+
+if __name__ == "__main__":
+    main()
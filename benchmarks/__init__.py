@@ -0,0 +1,5 @@
+#sentetik kaynak üreteci, tk'siz Text widget ve taban çizgisine karşı ölçüm takımı
+#çalıştırma: python -m benchmarks --output sonuc.json --baseline taban.json
+from benchmarks.corpus import SHAPES, generate
+from benchmarks.faketext import FakeText
+from benchmarks.suite import CASES, compare, run_suite
@@ -0,0 +1,249 @@
+import random
+
+#tohumlu kaynak kod üreteci: aynı (satır sayısı, şekil, tohum) her zaman aynı metni verir
+#üretilen kod bu projenin lexer ve parser'ının desteklediği alt kümededir (def, class, if/elif/else,
+#for, while, return, print, atama, çağrı, liste, f-string, yorum), hatasız parse edilir
+SHAPES = ("mixed", "strings", "comments", "nested", "dotted")
+
+NAMES = ("value", "total", "count", "index", "result", "item", "buffer", "offset", "node", "data",
+         "limit", "scale", "width", "height", "name", "score", "level", "step", "cache", "state")
+CLASS_NAMES = ("Parser", "Token", "Buffer", "Session", "Config", "Renderer", "Matrix", "Worker")
+BUILTINS = ("len", "str", "int", "range", "min", "max", "sum", "abs")
+OPERATORS = ("+", "-", "*", "//", "%", "<<", ">>", "&", "|")
+COMPARISONS = ("<", ">", "<=", ">=", "==", "!=")
+TEXT_WORDS = ("lorem", "ipsum", "sözdizimi", "renk", "token", "ağaç", "satır", "değer", "hata",
+              "çıktı", "<b>", "&amp;", "{x}", "tab\\t", "yeni\\n", "tırnak\\\"", "yol\\\\dosya")
+
+
+class SourceGenerator:
+    def __init__(self, shape="mixed", seed=0):
+        if shape not in SHAPES:
+            raise ValueError(f"Bilinmeyen şekil: {shape} (seçenekler: {', '.join(SHAPES)})")
+        self.shape = shape
+        self.random = random.Random(seed)
+        self.counter = 0
+
+    #en az lines satırlık kaynak; bloklar bölünmediği için birkaç satır fazla olabilir
+    def generate(self, lines):
+        out = []
+        while len(out) < lines:
+            out.extend(self.block())
+        return "\n".join(out) + "\n"
+
+    #şekle göre bir üst seviye blok (satır listesi)
+    def block(self):
+        rng = self.random
+        if self.shape == "strings":
+            makers = ((self.string_block, 5), (self.function, 2), (self.statement_line, 1))
+        elif self.shape == "comments":
+            makers = ((self.comment_block, 5), (self.function, 2), (self.statement_line, 1))
+        elif self.shape == "nested":
+            makers = ((self.nested_block, 4), (self.nested_expression_line, 3), (self.function, 1))
+        elif self.shape == "dotted":
+            makers = ((self.dotted_block, 4), (self.class_def, 2), (self.statement_line, 1))
+        else:
+            makers = ((self.function, 3), (self.class_def, 2), (self.statement_line, 2), (self.string_block, 1),
+                      (self.comment_block, 1), (self.nested_block, 1), (self.dotted_block, 1))
+        total = sum(weight for _, weight in makers)
+        pick = rng.uniform(0, total)
+        for maker, weight in makers:
+            pick -= weight
+            if pick <= 0:
+                return maker()
+        return makers[-1][0]()
+
+    def unique(self, base):
+        self.counter += 1
+        return f"{base}_{self.counter}"
+
+    def name(self):
+        return self.random.choice(NAMES)
+
+    def number(self):
+        rng = self.random
+        return str(rng.randint(0, 1000)) if rng.random() < 0.7 else f"{rng.uniform(0, 100):.{rng.randint(1, 5)}f}"
+
+    def atom(self):
+        rng = self.random
+        roll = rng.random()
+        if roll < 0.45:
+            return self.name()
+        if roll < 0.75:
+            return self.number()
+        if roll < 0.85:
+            return f"{rng.choice(BUILTINS)}({self.name()})"
+        if roll < 0.95:
+            return f"self.{self.name()}"
+        return f"[{self.name()}, {self.number()}]"
+
+    def expression(self, terms=None):
+        rng = self.random
+        terms = terms or rng.randint(1, 4)
+        parts = [self.atom()]
+        for _ in range(terms - 1):
+            parts.append(rng.choice(OPERATORS))
+            parts.append(self.atom())
+        return " ".join(parts)
+
+    def condition(self):
+        return f"{self.expression(2)} {self.random.choice(COMPARISONS)} {self.atom()}"
+
+    def string(self):
+        rng = self.random
+        words = " ".join(rng.choice(TEXT_WORDS) for _ in range(rng.randint(1, 8)))
+        quote = rng.choice(("'", '"'))
+        return quote + words + quote
+
+    def fstring(self):
+        rng = self.random
+        pieces = [f"{rng.choice(TEXT_WORDS[:10])} {{{self.name()}}}" for _ in range(rng.randint(1, 4))]
+        return 'f"' + " ".join(pieces) + '"'
+
+    #tek satırlık basit statement (atama, print, çağrı)
+    def simple_statement(self):
+        rng = self.random
+        roll = rng.random()
+        if roll < 0.5:
+            return f"{self.name()} = {self.expression()}"
+        if roll < 0.7:
+            return f"print({self.fstring()}, {self.name()})"
+        if roll < 0.85:
+            return f"{self.name()} = {rng.choice(BUILTINS)}({self.expression(2)})"
+        return f"{self.name()} = [{', '.join(self.atom() for _ in range(rng.randint(1, 5)))}]"
+
+    def statement_line(self):
+        return [self.simple_statement()]
+
+    #gövdesi blok statement'larıyla dolu fonksiyon
+    def function(self, indent=""):
+        rng = self.random
+        params = ", ".join(rng.sample(NAMES, rng.randint(0, 4)))
+        lines = [f"{indent}def {self.unique('compute')}({params}):"]
+        inner = indent + "    "
+        if rng.random() < 0.4:
+            lines.append(f'{inner}"""{self.string()[1:-1]}"""')
+        for _ in range(rng.randint(2, 8)):
+            roll = rng.random()
+            if roll < 0.5:
+                lines.append(inner + self.simple_statement())
+            elif roll < 0.7:
+                lines.append(f"{inner}if {self.condition()}:")
+                lines.append(f"{inner}    {self.simple_statement()}")
+                if rng.random() < 0.5:
+                    lines.append(f"{inner}elif {self.condition()}:")
+                    lines.append(f"{inner}    {self.simple_statement()}")
+                lines.append(f"{inner}else:")
+                lines.append(f"{inner}    {self.simple_statement()}")
+            elif roll < 0.85:
+                lines.append(f"{inner}for {self.name()} in range({self.atom()}):")
+                lines.append(f"{inner}    {self.simple_statement()}")
+            else:
+                lines.append(f"{inner}while {self.condition()}:")
+                lines.append(f"{inner}    {self.simple_statement()}")
+        lines.append(f"{inner}return {self.expression()}")
+        lines.append("")
+        return lines
+
+    def class_def(self):
+        rng = self.random
+        base = f"({rng.choice(CLASS_NAMES)})" if rng.random() < 0.4 else ""
+        lines = [f"class {self.unique(rng.choice(CLASS_NAMES))}{base}:"]
+        params = rng.sample(NAMES, rng.randint(1, 4))
+        lines.append(f"    def __init__(self, {', '.join(params)}):")
+        for param in params:
+            lines.append(f"        self.{param} = {param}")
+        for _ in range(rng.randint(1, 3)):
+            lines.extend(self.function("    "))
+        return lines
+
+    #kısa ve uzun stringler, çok satırlı üç tırnaklı stringler ve f-stringler
+    def string_block(self):
+        rng = self.random
+        lines = []
+        for _ in range(rng.randint(2, 6)):
+            roll = rng.random()
+            if roll < 0.4:
+                lines.append(f"{self.name()} = {' + '.join(self.string() for _ in range(rng.randint(1, 4)))}")
+            elif roll < 0.65:
+                lines.append(f"print({self.fstring()})")
+            else:
+                body = [" ".join(rng.choice(TEXT_WORDS) for _ in range(rng.randint(3, 12)))
+                        for _ in range(rng.randint(2, 8))]
+                lines.append(f'{self.name()} = """' + body[0])
+                lines.extend(body[1:-1])
+                lines.append(body[-1] + '"""')
+        return lines
+
+    #yorum satırları, satır sonu yorumları ve yorumlanmış kod
+    def comment_block(self):
+        rng = self.random
+        lines = []
+        for _ in range(rng.randint(3, 10)):
+            roll = rng.random()
+            words = " ".join(rng.choice(TEXT_WORDS) for _ in range(rng.randint(2, 14)))
+            if roll < 0.5:
+                lines.append(f"# {words}")
+            elif roll < 0.75:
+                lines.append(f"{self.simple_statement()}  # {words}")
+            else:
+                lines.append(f"# {self.simple_statement()}")
+        return lines
+
+    #iç içe parantezler, listeler ve çağrılar
+    def nested_expression(self, depth):
+        rng = self.random
+        if depth == 0:
+            return self.atom()
+        inner = self.nested_expression(depth - 1)
+        roll = rng.random()
+        if roll < 0.4:
+            return f"({inner} {rng.choice(OPERATORS)} {self.atom()})"
+        if roll < 0.7:
+            return f"{rng.choice(BUILTINS)}({inner})"
+        return f"[{inner}, {self.atom()}]"
+
+    def nested_expression_line(self):
+        return [f"{self.name()} = {self.nested_expression(self.random.randint(5, 30))}"]
+
+    #iç içe if/for/while blokları (parser her blokta tek statement okur, girinti sadece görünüm içindir)
+    def nested_block(self):
+        rng = self.random
+        lines = []
+        indent = ""
+        for _ in range(rng.randint(3, 12)):
+            roll = rng.random()
+            if roll < 0.4:
+                lines.append(f"{indent}if {self.condition()}:")
+            elif roll < 0.7:
+                lines.append(f"{indent}for {self.name()} in {self.nested_expression(rng.randint(1, 4))}:")
+            else:
+                lines.append(f"{indent}while {self.condition()}:")
+            indent += "    "
+        lines.append(f"{indent}{self.name()} = {self.nested_expression(rng.randint(2, 10))}")
+        return lines
+
+    #uzun noktalı isimler: atama hedefleri, çağrılar ve okumalar
+    def dotted_name(self, parts=None):
+        rng = self.random
+        parts = parts or rng.randint(3, 12)
+        return ".".join(["self"] + [rng.choice(NAMES) for _ in range(parts - 1)])
+
+    def dotted_block(self):
+        rng = self.random
+        lines = []
+        for _ in range(rng.randint(2, 8)):
+            roll = rng.random()
+            if roll < 0.5:
+                lines.append(f"{self.dotted_name()} = {self.dotted_name()} + {self.atom()}")
+            elif roll < 0.8:
+                args = ", ".join(self.dotted_name(rng.randint(2, 6)) for _ in range(rng.randint(1, 3)))
+                lines.append(f"{self.dotted_name()}({args})")
+            else:
+                lines.append(f"if {self.dotted_name()} {rng.choice(COMPARISONS)} {self.dotted_name()}:")
+                lines.append(f"    {self.dotted_name()} = {self.expression()}")
+        return lines
+
+
+#lines satırlık (en az) seed tohumlu shape şeklinde kaynak
+def generate(lines=2000, shape="mixed", seed=0):
+    return SourceGenerator(shape, seed).generate(lines)
@@ -0,0 +1,274 @@
+import re
+from bisect import bisect_left, bisect_right
+from lineindex import LineIndex
+
+#tk olmadan highlight ölçmek için Text widget yerine geçen sahte widget
+#SyntaxHighlighter'ın kullandığı alt kümeyi (get, insert, delete, index, tag_add, tag_remove, tag_names,
+#dump, yview, bind, after_idle ...) tk ile aynı anlamda uygular: taglar tag başına sıralı ve birleşik
+#[başlangıç, bitiş) aralıkları olarak tutulur, ekleme iki yanında da olan tagları alır, silme aralıkları
+#kaydırır. Düzenlemeler main.py'deki CustomText gibi (offset, silinen, eklenen) olarak kaydedilir.
+#Tk'nin kendi maliyeti (B-ağacı, çizim) ölçülmez; sayaçlar kaç tk çağrısı yapılacağını gösterir
+
+INDEX_PATTERN = re.compile(r"(?:(\d+)\.(\d+|end)|(end))\s*(?:([+-])\s*(\d+)\s*(?:c|chars))?")
+
+
+class FakeText:
+    #view, yview()'in döndürdüğü (üst, alt) kesirleridir (viewport modunu ölçmek için)
+    #deferred=True ise after ile zamanlananlar hemen çalışmaz, run_pending ile sırayla çalıştırılır
+    def __init__(self, text="", view=(0.0, 1.0), deferred=False):
+        self.content = ""
+        self.view = view
+        self.deferred = deferred
+        #zamanlanmış (kimlik, fonksiyon, argümanlar), deferred modunda
+        self.pending = []
+        self.timer_id = 0
+        #tag -> (başlangıçlar, bitişler), iki sıralı liste
+        self.ranges = {}
+        self.configured = {}
+        self.bindings = {}
+        self.edits = []
+        #tk çağrısı sayıları: komut -> sayı
+        self.calls = {}
+        self._line_index = None
+        if text:
+            self.insert("1.0", text)
+            self.edits.clear()
+            self.calls.clear()
+
+    def count(self, command):
+        self.calls[command] = self.calls.get(command, 0) + 1
+
+    #içerik değişince bir sonraki indeks çevirisinde yeniden oluşturulur
+    def line_index(self):
+        if self._line_index is None:
+            self._line_index = LineIndex(self.content)
+        return self._line_index
+
+    #tk indeksi -> karakter konumu ("1.0", "3.end", "end", "end-1c", "1.0 + 5 chars")
+    def offset(self, index):
+        #highlighter'ın ürettiği "satır.sütun" indeksleri regex'e girmeden çevrilir
+        line, _, column = index.partition(".")
+        if line.isdigit() and column.isdigit():
+            line_starts = self.line_index().line_starts
+            line = int(line)
+            if line > len(line_starts):
+                return len(self.content)
+            line_end = line_starts[line] - 1 if line < len(line_starts) else len(self.content)
+            return min(line_starts[line - 1] + int(column), line_end)
+        match = INDEX_PATTERN.fullmatch(index.strip())
+        if match is None:
+            raise ValueError(f"Desteklenmeyen indeks: {index}")
+        line, column, end, sign, count = match.groups()
+        length = len(self.content)
+        if end:
+            #tk metnin sonunda her zaman bir satır sonu tutar, "end" onun da arkasıdır
+            offset = length + 1
+        else:
+            line_starts = self.line_index().line_starts
+            line = int(line)
+            if line > len(line_starts):
+                offset = length
+            else:
+                line_start = line_starts[line - 1]
+                line_end = line_starts[line] - 1 if line < len(line_starts) else length
+                offset = line_end if column == "end" else min(line_start + int(column), line_end)
+        if count:
+            offset += int(count) if sign == "+" else -int(count)
+        return max(0, min(offset, length))
+
+    def index(self, index):
+        return self.line_index().tk_index(self.offset(index))
+
+    def get(self, index1, index2=None):
+        self.count("get")
+        start = self.offset(index1)
+        end = self.offset(index2) if index2 is not None else start + 1
+        return self.content[start:end]
+
+    def insert(self, index, chars, *tags):
+        self.count("insert")
+        offset = self.offset(index)
+        self.content = self.content[:offset] + chars + self.content[offset:]
+        self._line_index = None
+        size = len(chars)
+        #tk: eklenen karakterler iki yanda da olan tagları alır, yani tam içine eklenen aralık büyür
+        for tag, (starts, ends) in self.ranges.items():
+            first = bisect_right(ends, offset)
+            starts[first:] = [start + size if start >= offset else start for start in starts[first:]]
+            ends[first:] = [end + size for end in ends[first:]]
+        for tag in tags:
+            self.add_range(tag, offset, offset + size)
+        self.edits.append((offset, 0, chars))
+
+    def delete(self, index1, index2=None):
+        self.count("delete")
+        start = self.offset(index1)
+        end = self.offset(index2) if index2 is not None else start + 1
+        if end <= start:
+            return
+        self.content = self.content[:start] + self.content[end:]
+        self._line_index = None
+        size = end - start
+        for starts, ends in self.ranges.values():
+            first = bisect_right(ends, start)
+            #silinen bölgeden sonra başlayan aralıklar sadece kayar
+            last = max(first, bisect_left(starts, end))
+            cut = []
+            for range_start, range_end in zip(starts[first:last], ends[first:last]):
+                range_start = min(range_start, start)
+                range_end = max(start, range_end - size)
+                if range_start < range_end:
+                    cut.append((range_start, range_end))
+            tail_starts = [range_start - size for range_start in starts[last:]]
+            tail_ends = [range_end - size for range_end in ends[last:]]
+            del starts[first:], ends[first:]
+            if tail_starts:
+                cut.append((tail_starts.pop(0), tail_ends.pop(0)))
+            #silinen bölgenin iki yanındaki aralıklar birleşir
+            for range_start, range_end in cut:
+                if ends and ends[-1] >= range_start:
+                    ends[-1] = max(ends[-1], range_end)
+                else:
+                    starts.append(range_start)
+                    ends.append(range_end)
+            starts.extend(tail_starts)
+            ends.extend(tail_ends)
+        self.edits.append((start, size, ""))
+
+    #kaydedilen düzenlemeleri verir ve temizler (CustomText.take_edits gibi)
+    def take_edits(self):
+        edits, self.edits = self.edits, []
+        return edits
+
+    #çift sayıda indeks (i1, i2, i3, i4, ...) ya da tek indeks (bir karakter)
+    def index_pairs(self, indices):
+        if len(indices) == 1:
+            start = self.offset(indices[0])
+            return [(start, start + 1)]
+        offsets = [self.offset(index) for index in indices]
+        return list(zip(offsets[::2], offsets[1::2]))
+
+    def tag_add(self, tag, *indices):
+        self.count("tag_add")
+        for start, end in self.index_pairs(indices):
+            if start < end:
+                self.add_range(tag, start, end)
+
+    def tag_remove(self, tag, *indices):
+        self.count("tag_remove")
+        for start, end in self.index_pairs(indices):
+            if start < end:
+                self.remove_range(tag, start, end)
+
+    #değen ya da örtüşen aralıklar tek aralıkta birleşir
+    def add_range(self, tag, start, end):
+        starts, ends = self.ranges.setdefault(tag, ([], []))
+        first = bisect_left(ends, start)
+        last = bisect_right(starts, end)
+        if first < last:
+            start, end = min(start, starts[first]), max(end, ends[last - 1])
+        starts[first:last] = [start]
+        ends[first:last] = [end]
+
+    def remove_range(self, tag, start, end):
+        if tag not in self.ranges:
+            return
+        starts, ends = self.ranges[tag]
+        first = bisect_right(ends, start)
+        last = bisect_left(starts, end)
+        if first >= last:
+            return
+        keep_starts, keep_ends = [], []
+        if starts[first] < start:
+            keep_starts.append(starts[first])
+            keep_ends.append(start)
+        if ends[last - 1] > end:
+            keep_starts.append(end)
+            keep_ends.append(ends[last - 1])
+        starts[first:last] = keep_starts
+        ends[first:last] = keep_ends
+
+    #index verilmezse tanımlı tüm taglar, verilirse o karakterdeki taglar
+    def tag_names(self, index=None):
+        self.count("tag_names")
+        if index is None:
+            return tuple(self.configured)
+        offset = self.offset(index)
+        names = []
+        for tag, (starts, ends) in self.ranges.items():
+            position = bisect_right(starts, offset) - 1
+            if position >= 0 and ends[position] > offset:
+                names.append(tag)
+        return tuple(names)
+
+    #[index1, index2) içindeki tag geçişleri tk'deki sırayla: ("tagon"/"tagoff", tag, "satır.sütun")
+    def dump(self, index1, index2=None, command=None, tag=False):
+        self.count("dump")
+        if not tag:
+            return []
+        start = self.offset(index1)
+        end = self.offset(index2) if index2 is not None else start + 1
+        events = []
+        for name, (starts, ends) in self.ranges.items():
+            for position in range(bisect_left(starts, start), bisect_left(starts, end)):
+                events.append((starts[position], 1, "tagon", name))
+            for position in range(bisect_right(ends, start), bisect_right(ends, end)):
+                events.append((ends[position], 0, "tagoff", name))
+        events.sort()
+        line_index = self.line_index()
+        return [(key, name, line_index.tk_index(offset)) for offset, _, key, name in events]
+
+    #tag -> [(başlangıç, bitiş), ...] karakter aralıkları (doğrulama için)
+    def tag_ranges_of(self, tag):
+        starts, ends = self.ranges.get(tag, ([], []))
+        return list(zip(starts, ends))
+
+    def tag_configure(self, tag, **options):
+        self.configured.setdefault(tag, {}).update(options)
+
+    tag_config = tag_configure
+
+    #imleç ve diğer işaretler tutulmaz
+    def mark_set(self, mark, index):
+        pass
+
+    def bind(self, sequence, func, add=None):
+        self.bindings.setdefault(sequence, []).append(func)
+
+    def event_generate(self, sequence):
+        for func in self.bindings.get(sequence, ()):
+            func()
+
+    def yview(self, *args):
+        return self.view
+
+    #zamanlayıcılar beklemeden hemen çalışır (deferred modunda sıraya alınır)
+    def after(self, ms, func=None, *args):
+        if func is None:
+            return None
+        if not self.deferred:
+            func(*args)
+            return "after#0"
+        self.timer_id += 1
+        identifier = f"after#{self.timer_id}"
+        self.pending.append((identifier, func, args))
+        return identifier
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, identifier):
+        self.pending = [timer for timer in self.pending if timer[0] != identifier]
+
+    #sıradaki zamanlayıcıyı çalıştırır, sıra boşsa False
+    def run_pending(self):
+        if not self.pending:
+            return False
+        _, func, args = self.pending.pop(0)
+        func(*args)
+        return True
+
+    def config(self, **options):
+        pass
+
+    configure = config
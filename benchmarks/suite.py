@@ -0,0 +1,308 @@
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from benchmarks.corpus import SHAPES, generate
+from benchmarks.faketext import FakeText
+from highlighter import SyntaxHighlighter
+from lexer import Lexer
+from lineindex import LineIndex
+from parser import Parser
+
+#sentetik kaynaklar üzerinde lexer, parser, highlight ve format_ast ölçümleri
+#her (durum, şekil) için en iyi süre, iş miktarına göre hız ve ayrı bir çalıştırmada en yüksek bellek
+#ölçülür; sonuçlar JSON olarak yazılır ve bir taban çizgisiyle karşılaştırılabilir
+
+#her durum hazırlık yapıp (ölçülen fonksiyon, iş miktarı, birim) döndürür; hazırlık ölçülmez ve
+#her tekrarda yeniden yapılır, böylece highlight gibi durum tutan işler her seferinde aynı yerden başlar
+#ölçülen fonksiyon her zaman (süre, sayaçlar) döndürür: süre None ise çağrının tamamı ölçülür,
+#sayaçlar sözlüğü sonuca eklenir
+
+
+#çağrının tamamı ölçülen, sayaç üretmeyen durumlar için
+def whole(function):
+    def run():
+        function()
+        return None, {}
+    return run
+
+
+def case_tokenize(text, options):
+    lexer = Lexer()
+    return whole(lambda: lexer.tokenize(text)), len(text) / 1e6, "MB/s"
+
+
+def case_parse(text, options):
+    tokens = Lexer().tokenize(text)
+    line_index = LineIndex(text)
+    return whole(lambda: Parser(tokens, line_index).parse(recover=True)), len(text) / 1e6, "MB/s"
+
+
+#boş widget'a ilk renklendirme (dosya açma), önbellek kapalı
+def case_highlight(text, options):
+    widget = FakeText(text)
+    highlighter = SyntaxHighlighter(widget, Lexer(), FakeText(), cache_size=0)
+    return whole(lambda: highlighter.highlight(text)), len(text) / 1e6, "MB/s"
+
+
+#renklendirilmiş belgede tohumlu düzenleme dizisi (karakter yazma/silme, satır ekleme/silme)
+#tırnak yazılmaz: açık kalan string belgenin geri kalanını yeniden renklendirir, o highlight durumunda ölçülür
+#düzenlemeler widget'a uygulanır, ölçülen sadece her düzenlemeden sonraki highlight'tır
+def case_edit(text, options):
+    widget = FakeText(text)
+    highlighter = SyntaxHighlighter(widget, Lexer(), FakeText(), cache_size=0)
+    highlighter.highlight(text)
+    rng = random.Random(options["seed"])
+    edits = options["edits"]
+
+    def run():
+        elapsed = 0.0
+        for _ in range(edits):
+            apply_random_edit(widget, rng)
+            content = widget.get("1.0", "end-1c")
+            start = time.perf_counter()
+            highlighter.highlight(content)
+            elapsed += time.perf_counter() - start
+        return elapsed, {}
+
+    return run, edits, "edit/s"
+
+
+#edit ile aynı düzenleme dizisi, her düzenlemeden sonra highlight ve artımlı parse (editördeki gibi)
+#ölçülen ikisinin toplamıdır; düzenleme başına yeniden parse edilen statement sayısı da kaydedilir,
+#artımlı parse'ın bozulup belgenin büyük kısmını yeniden parse etmesi süreden önce burada görünür
+def case_edit_parse(text, options):
+    widget = FakeText(text)
+    highlighter = SyntaxHighlighter(widget, Lexer(), FakeText(), cache_size=0)
+    highlighter.highlight(text)
+    highlighter.parse(text)
+    rng = random.Random(options["seed"])
+    edits = options["edits"]
+
+    def run():
+        elapsed = 0.0
+        reparsed = 0
+        for _ in range(edits):
+            apply_random_edit(widget, rng)
+            content = widget.get("1.0", "end-1c")
+            start = time.perf_counter()
+            highlighter.highlight(content)
+            highlighter.parse(content)
+            elapsed += time.perf_counter() - start
+            reparsed += highlighter.incremental_parser.reparsed
+        return elapsed, {"reparsed": reparsed / edits if edits else 0.0,
+                         "statements": len(highlighter.incremental_parser.statements)}
+
+    return run, edits, "edit/s"
+
+
+def apply_random_edit(widget, rng):
+    line_count = widget.line_index().line_count()
+    line = rng.randint(1, line_count)
+    length = int(widget.index(f"{line}.end").split(".")[1])
+    column = rng.randint(0, length)
+    roll = rng.random()
+    if roll < 0.5:
+        widget.insert(f"{line}.{column}", rng.choice("abcxyz_0123 ()[]:=+#"))
+    elif roll < 0.8:
+        if length:
+            widget.delete(f"{line}.{min(column, length - 1)}")
+    elif roll < 0.9:
+        widget.insert(f"{line}.0", f"value_{rng.randint(0, 99)} = total + {rng.randint(0, 999)}\n")
+    elif line < line_count:
+        widget.delete(f"{line}.0", f"{line + 1}.0")
+
+
+#SyntaxHighlighter.format_ast, hız üretilen AST metninin boyutuna göre
+def case_format_ast(text, options):
+    ast = Parser(Lexer().tokenize(text), LineIndex(text)).parse(recover=True)
+    highlighter = SyntaxHighlighter(FakeText(), Lexer(), FakeText(), cache_size=0)
+    size = len(highlighter.format_ast(ast)) / 1e6
+    return whole(lambda: highlighter.format_ast(ast)), size, "MB/s"
+
+
+CASES = {
+    "tokenize": case_tokenize,
+    "parse": case_parse,
+    "highlight": case_highlight,
+    "edit": case_edit,
+    "edit_parse": case_edit_parse,
+    "format_ast": case_format_ast,
+}
+
+
+#ölçülen fonksiyon kendi süresini döndürürse (edit) o kullanılır, yoksa çağrının tamamı ölçülür
+#timeit gibi ölçüm sırasında çöp toplayıcı kapatılır, kısa durumlarda süreyi en çok o oynatıyor
+def time_case(case, text, options):
+    run, amount, unit = case(text, options)
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        inner, counters = run()
+        elapsed = time.perf_counter() - start
+    finally:
+        gc.enable()
+    if inner is not None:
+        elapsed = inner
+    return elapsed, amount, unit, counters
+
+
+#bellek ölçümünde edit durumu bu kadar düzenleme yapar: tracemalloc düzenleme başına highlight'ı onlarca
+#kat yavaşlatır, en yüksek bellek ise tek düzenlemenin geçici ayırmalarıyla belirlenir
+PEAK_EDITS = 20
+
+
+#hazırlık dışındaki en yüksek bellek (MB); tracemalloc yavaşlattığı için süre ölçümünden ayrı yapılır
+def peak_case(case, text, options):
+    run, _, _ = case(text, dict(options, edits=min(options["edits"], PEAK_EDITS)))
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+#{"durum/şekil": {"seconds", "throughput", "unit", "peak_mb", "size", sayaçlar...}} sözlüğü
+#sayaçlar (edit_parse'ta "reparsed", "statements") tohumlu olduğu için her tekrarda aynıdır
+def run_suite(lines=5000, shapes=SHAPES, cases=tuple(CASES), seed=0, repeat=5, edits=200, report=print):
+    options = {"seed": seed, "edits": edits}
+    results = {}
+    for shape in shapes:
+        text = generate(lines, shape, seed)
+        for name in cases:
+            case = CASES[name]
+            best = None
+            for _ in range(repeat):
+                elapsed, amount, unit, counters = time_case(case, text, options)
+                best = elapsed if best is None else min(best, elapsed)
+            result = {
+                "seconds": best,
+                "throughput": amount / best if best > 0 else 0.0,
+                "unit": unit,
+                "peak_mb": peak_case(case, text, options),
+                "size": len(text),
+            }
+            result.update(counters)
+            key = f"{name}/{shape}"
+            results[key] = result
+            if report:
+                report(f"  {key:<22} {best * 1000:9.2f} ms  {result['throughput']:10.2f} {unit:<6}"
+                       f"  {result['peak_mb']:8.2f} MB"
+                       + (f"  {counters['reparsed']:.1f} statement/düzenleme" if "reparsed" in counters else ""))
+    return results
+
+
+#bütün durumları her şekilde küçük bir kaynakla bir kere çalıştırır; ölçüm değil, takımın çalıştığının
+#kontrolüdür (bir durumu değiştiren her değişiklikten sonra çalıştırılır)
+def smoke(report=None):
+    return run_suite(lines=60, repeat=1, edits=10, report=report)
+
+
+def make_report(results, lines, seed, repeat, edits):
+    return {
+        "meta": {
+            "lines": lines,
+            "seed": seed,
+            "repeat": repeat,
+            "edits": edits,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+#taban çizgisine göre gerilemeler: hız threshold oranından fazla düştüyse ya da en yüksek bellek
+#memory_threshold oranından fazla arttıysa. Sadece iki tarafta da olan ölçümler karşılaştırılır
+def compare(report, baseline, threshold=0.25, memory_threshold=0.1):
+    regressions = []
+    for key, result in report["results"].items():
+        base = baseline["results"].get(key)
+        if base is None:
+            continue
+        if result["throughput"] < base["throughput"] * (1 - threshold):
+            change = result["throughput"] / base["throughput"] - 1
+            regressions.append(f"{key}: hız {base['throughput']:.2f} -> {result['throughput']:.2f} "
+                               f"{result['unit']} ({change:+.0%})")
+        if result["peak_mb"] > base["peak_mb"] * (1 + memory_threshold):
+            change = result["peak_mb"] / base["peak_mb"] - 1 if base["peak_mb"] else float("inf")
+            regressions.append(f"{key}: bellek {base['peak_mb']:.2f} -> {result['peak_mb']:.2f} MB "
+                               f"({change:+.0%})")
+    return regressions
+
+
+#aynı kaynak üzerinde ölçülmediyse karşılaştırma anlamsızdır
+def baseline_mismatch(report, baseline):
+    keys = ("lines", "seed", "edits")
+    return [f"{key}: {baseline['meta'].get(key)} != {report['meta'][key]}"
+            for key in keys if baseline["meta"].get(key) != report["meta"][key]]
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Sentetik kaynaklar üzerinde tokenize, parse, highlight, düzenleme ve format_ast ölçümleri.")
+    arg_parser.add_argument("--lines", type=int, default=5000, help="şekil başına kaynak satır sayısı")
+    arg_parser.add_argument("--shapes", default=",".join(SHAPES),
+                            help=f"virgülle ayrılmış şekiller ({', '.join(SHAPES)})")
+    arg_parser.add_argument("--cases", default=",".join(CASES),
+                            help=f"virgülle ayrılmış durumlar ({', '.join(CASES)})")
+    arg_parser.add_argument("--seed", type=int, default=0, help="kaynak üreteci ve düzenlemeler için tohum")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="en iyi süre için tekrar sayısı")
+    arg_parser.add_argument("--edits", type=int, default=200,
+                            help="edit ve edit_parse durumlarındaki düzenleme sayısı")
+    arg_parser.add_argument("--smoke", action="store_true",
+                            help="bütün durumları küçük bir kaynakla bir kere çalıştırıp çıkar")
+    arg_parser.add_argument("-o", "--output", help="sonuçların yazılacağı JSON dosyası")
+    arg_parser.add_argument("--baseline", help="karşılaştırılacak önceki sonuç dosyası")
+    #aynı kod art arda ölçüldüğünde kısa durumların hızı %15-20 oynayabiliyor
+    arg_parser.add_argument("--threshold", type=float, default=0.25,
+                            help="izin verilen hız düşüşü oranı (varsayılan 0.25)")
+    arg_parser.add_argument("--memory-threshold", type=float, default=0.1,
+                            help="izin verilen en yüksek bellek artışı oranı (varsayılan 0.1)")
+    args = arg_parser.parse_args(argv)
+
+    shapes = [shape for shape in args.shapes.split(",") if shape]
+    cases = [case for case in args.cases.split(",") if case]
+    for name, valid in (("şekil", SHAPES), ("durum", CASES)):
+        unknown = [item for item in (shapes if name == "şekil" else cases) if item not in valid]
+        if unknown:
+            arg_parser.error(f"Bilinmeyen {name}: {', '.join(unknown)}")
+
+    if args.smoke:
+        results = smoke()
+        print(f"smoke: {len(results)} ölçüm çalıştı")
+        return 0
+
+    print(f"benchmark: {args.lines} satır, tohum {args.seed}, {args.repeat} tekrar")
+    results = run_suite(args.lines, shapes, cases, args.seed, args.repeat, args.edits)
+    report = make_report(results, args.lines, args.seed, args.repeat, args.edits)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        print(f"sonuçlar yazıldı: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        mismatch = baseline_mismatch(report, baseline)
+        if mismatch:
+            print(f"taban çizgisi farklı ayarlarla ölçülmüş, karşılaştırılamaz ({'; '.join(mismatch)})",
+                  file=sys.stderr)
+            return 2
+        regressions = compare(report, baseline, args.threshold, args.memory_threshold)
+        if regressions:
+            print(f"{len(regressions)} gerileme:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            return 1
+        print(f"taban çizgisine göre gerileme yok ({args.baseline})")
+    return 0
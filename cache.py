@@ -0,0 +1,60 @@
+import hashlib
+from collections import OrderedDict
+
+
+#metnin içerik adresi: aynı metin her zaman aynı anahtarı verir (geri alma, yapıştırıp geri silme)
+def content_key(text):
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+#toplam boyutu sınırlı LRU önbellek, boyutlar put'ta çağıran tarafından tahmini bayt olarak verilir
+#sınır aşılınca en uzun süredir kullanılmayan girdiler atılır; isabet/ıska/atılma sayaçları tutulur
+class LRUCache:
+    def __init__(self, max_size=32 << 20, max_entries=256):
+        self.max_size = max_size
+        self.max_entries = max_entries
+        #anahtar -> (değer, boyut), en son kullanılan sonda
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    #değeri döndürür ve en son kullanılan yapar, yoksa default
+    def get(self, key, default=None):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    #tek başına sınırı aşan değerler saklanmaz (False döner)
+    def put(self, key, value, size):
+        if size > self.max_size:
+            return False
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.size -= old[1]
+        self.entries[key] = (value, size)
+        self.size += size
+        while self.size > self.max_size or len(self.entries) > self.max_entries:
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+        return True
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
+
+    def stats(self):
+        return {"entries": len(self.entries), "size": self.size, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
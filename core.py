@@ -0,0 +1,149 @@
+from cache import LRUCache, content_key
+from lexer import IncrementalLexer, Token, find_edit
+from lineindex import LineIndex
+from parser import NO_DAMAGE, IncrementalParser, merge_token_damage
+from profiling import Profiler
+from symbols import SymbolIndex
+
+
+#tk'siz analiz çekirdeği: artımlı lexer, artımlı parser ve içerik adresli önbellek
+#SyntaxHighlighter bunun üzerine tk taglarını ve panelleri ekler; server.py gibi GUI'siz araçlar
+#tkinter import etmeden doğrudan bunu kullanır. Bir Analyzer tek bir belgeyi izler ve thread güvenli
+#değildir, aynı anda tek thread kullanmalıdır
+class Analyzer:
+    #cache_size, içerik adresli token/AST önbelleğinin tahmini bayt sınırıdır (0 verilirse önbellek kapalı)
+    #profiler (profiling.Profiler) verilirse aşama süreleri ve sayaçlar ona kaydedilir
+    def __init__(self, lexer, cache_size=32 << 20, profiler=None):
+        self.lexer = lexer
+        self.profiler = profiler or Profiler(enabled=False)
+        #düzenlemelerde sadece değişen bölgeyi yeniden tokenize eder
+        self.incremental = IncrementalLexer(lexer)
+        #parse sonucu da sadece değişen statement'lar yeniden parse edilerek güncellenir
+        #token_damage son parse'tan beri değişen token aralığıdır, None ise baştan parse edilir
+        #recover modunda hatalar parse'ı durdurmaz, geçerli statement'lar kısmi AST'de kalır
+        self.incremental_parser = IncrementalParser(recover=True)
+        self.token_damage = None
+        #son parse'taki tanımlar (isimden tanıma, konumdan kapsayan tanıma sorgular)
+        self.symbol_index = SymbolIndex()
+        #metin daha önce görülmüş bir hale dönünce (geri alma, yapıştırıp silme) tokenlar ve AST
+        #metnin hash'iyle önbellekten alınır; anahtar aynı metin için bir kere hesaplanır
+        self.cache = LRUCache(cache_size) if cache_size else None
+        self._key_text = None
+        self._key = None
+
+    #incremental lexer'ı yeni metne getirir ve yeniden tokenize edilen [start, end) aralığını döndürür
+    #düzenleme önceki metinle farktan çıkarılır; metin önbellekteyse tokenlar oradan alınır
+    def update(self, text):
+        if self.incremental.text == text:
+            return 0, 0
+        with self.profiler.stage("lex"):
+            if self.incremental.text is None or self.cache_get("tokens", text) is not None:
+                changed = self.reset(text)
+            else:
+                damage = self.incremental.apply_edit(*find_edit(self.incremental.text, text))
+                self.token_damage = merge_token_damage(self.token_damage, *damage[:3])
+                changed = damage[3], damage[4]
+        self.profiler.set("tokens", len(self.incremental.tokens))
+        return changed
+
+    #metni baştan tokenize eder (önbellekte varsa oradan alır)
+    def reset(self, text):
+        snapshot = self.cache_get("tokens", text)
+        if snapshot is not None:
+            self.incremental.restore(snapshot)
+        else:
+            self.incremental.reset(text)
+            #token başına (tür, değer, konum) tuple'ları ve kontrol noktaları
+            size = 120 * len(self.incremental.tokens) + 80 * len(self.incremental.checkpoints)
+            self.cache_put("tokens", text, self.incremental.snapshot(), size)
+        self.token_damage = None
+        return 0, len(text)
+
+    #highlight ile aynı metin için tokenlar tekrar üretilmez
+    def get_tokens(self, text):
+        if self.incremental.text == text:
+            return self.incremental.tokens
+        snapshot = self.cache_get("tokens", text)
+        if snapshot is not None:
+            return [Token(*fields) for fields in snapshot[1]]
+        return self.lexer.tokenize(text)
+
+    #satır başları incremental lexer'ın kontrol noktalarında zaten tutulduğu için metin tekrar taranmaz
+    #liste sonraki düzenlemelerde yerinde güncellenir, düzenlemeden sonra da kullanılacaksa kopyalanmalıdır
+    def get_line_index(self, text):
+        if self.incremental.text == text:
+            return LineIndex(line_starts=self.incremental.line_starts)
+        return LineIndex(text)
+
+    #metnin içerik anahtarı, highlight ve update_parse_result aynı metin için tekrar hash'lemez
+    def content_key(self, text):
+        if text is not self._key_text:
+            self._key_text, self._key = text, content_key(text)
+        return self._key
+
+    #önbellek anahtarı (tür, metnin hash'i); önbellek kapalıysa her zaman ıska
+    def cache_get(self, kind, text):
+        if self.cache is None:
+            return None
+        value = self.cache.get((kind, self.content_key(text)))
+        self.profiler.count("cache_misses" if value is None else "cache_hits")
+        return value
+
+    def cache_put(self, kind, text, value, size):
+        if self.cache is not None:
+            self.cache.put((kind, self.content_key(text)), value, size)
+
+    #son parse'tan beri değişen token aralığını verir ve sıfırlar
+    #metin incremental lexer'dakinden farklıysa parser durumu geçersizdir, baştan parse edilir
+    def take_token_damage(self, text):
+        if self.incremental.text != text:
+            self.token_damage = None
+            return None
+        damage = self.token_damage
+        #parse'tan sonra damage NO_DAMAGE olur, sonraki düzenlemenin aralığı merge_token_damage'da aynen alınır
+        self.token_damage = NO_DAMAGE
+        if damage == NO_DAMAGE:
+            end = len(self.incremental.tokens)
+            return end, end, end
+        return damage
+
+    #metnin ("PROGRAM", statements) AST'si; hatalar incremental_parser.errors'dadır
+    #tokens verilmezse get_tokens ile alınır, aynı metin daha önce parse edildiyse önbellekten döner
+    def parse(self, text, tokens=None):
+        if tokens is None:
+            tokens = self.get_tokens(text)
+        damage = self.take_token_damage(text)
+        with self.profiler.stage("parse"):
+            ast = self.restore_parse(text)
+            if ast is None:
+                ast = self.incremental_parser.parse(tokens, self.get_line_index(text), damage)
+                self.store_parse(text, tokens)
+        self.record_ast(ast)
+        self.index_symbols(tokens)
+        return ast
+
+    #son parse'ın tanımlarından symbol_index'i kurar; arka plan parse'ı sonucu uygularken de bunu çağırır
+    def index_symbols(self, tokens):
+        with self.profiler.stage("symbols"):
+            self.symbol_index = SymbolIndex(tokens, self.incremental_parser.starts, self.incremental_parser.symbols)
+
+    #parse sayaçları: statement, yeniden parse edilen statement ve AST düğümü sayıları
+    def record_ast(self, ast):
+        profiler = self.profiler
+        if profiler.enabled:
+            profiler.set("statements", len(ast[1]))
+            profiler.set("reparsed", self.incremental_parser.reparsed)
+            profiler.set("ast_nodes", profiler.count_nodes(ast[1]))
+
+    #aynı metin daha önce parse edildiyse parser o duruma döner ve AST'yi verir, yoksa None
+    #sonraki düzenlemeler buradan artımlı devam eder
+    def restore_parse(self, text):
+        snapshot = self.cache_get("ast", text)
+        if snapshot is None:
+            return None
+        return self.incremental_parser.restore(snapshot)
+
+    def store_parse(self, text, tokens):
+        #statement başına birkaç tuple düğüm ve token başına yaklaşık bir düğüm
+        size = 64 * len(tokens) + 200 * len(self.incremental_parser.statements)
+        self.cache_put("ast", text, self.incremental_parser.snapshot(), size)
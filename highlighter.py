@@ -1,176 +1,684 @@
-import tkinter as tk
-from parser import Parser
-
-#highlighting ve parse sonuc gosterimi yapılan classımız 
-class SyntaxHighlighter:
-    def __init__(self, text_widget, lexer, parse_result_widget, dark_mode=False):
-        self.text = text_widget
-        self.lexer = lexer
-        self.parse_result_widget = parse_result_widget
-        self.dark_mode = dark_mode
-
-        #renklendirme, her token için bi renk 
-        if self.dark_mode:
-            self.text.tag_configure("KEYWORD", foreground="#7ab6e7")
-            self.text.tag_configure("BUILTIN", foreground="#7c75d6")
-            self.text.tag_configure("IDENTIFIER", foreground="#bc80d8")
-            self.text.tag_configure("NUMBER", foreground="#4ec9b0")
-            self.text.tag_configure("STRING", foreground="#ce9178")
-            self.text.tag_configure("FSTRING", foreground="#caf7f4")
-            self.text.tag_configure("COMMENT", foreground="#6a9955")
-            self.text.tag_configure("OPERATOR", foreground="#d5e98f")
-            self.text.tag_configure("DELIMITER", foreground="#d5e98f")
-        else:
-            self.text.tag_configure("KEYWORD", foreground="blue")
-            self.text.tag_configure("BUILTIN", foreground="darkorange")
-            self.text.tag_configure("IDENTIFIER", foreground="black")
-            self.text.tag_configure("NUMBER", foreground="purple")
-            self.text.tag_configure("STRING", foreground="green")
-            self.text.tag_configure("FSTRING", foreground="cyan")
-            self.text.tag_configure("COMMENT", foreground="gray")
-            self.text.tag_configure("OPERATOR", foreground="red")
-            self.text.tag_configure("DELIMITER", foreground="brown")
-
-        #yazı değiştikçe highlight yap
-        self.text.bind("<KeyRelease>", self.on_modified)
-        self.text.bind("<<Paste>>", self.on_modified)
-        self.text.bind("<<Cut>>", self.on_modified)
-
-    #kullanıcı kod yazdıkça cagrılıyor
-    def on_modified(self, event=None):
-        try:
-            content = self.text.get("1.0", "end-1c")
-            self.highlight(content)
-            self.update_parse_result(content)
-            #change eventi gönder (satır numaraları için)
-            self.text.event_generate("<<Change>>")
-        except Exception as e:
-            print(f"Error in on_modified: {e}")
-
-
-    #lexer ile tokenlara ayırır ve renklendirmeyi uygular
-    def highlight(self, text):
-        #önce tüm tagları kaldır
-        for tag in self.text.tag_names():
-            self.text.tag_remove(tag, "1.0", "end")
-
-        try:
-            tokens = self.lexer.tokenize(text)      #tokenize et
-            for token in tokens:
-                start_index = f"1.0 + {token.position[0]} chars"
-                end_index = f"1.0 + {token.position[1]} chars"
-                self.text.tag_add(token.type, start_index, end_index)
-        except Exception as e:
-            print(f"Highlighting error: {e}")
-
-    #ast cikarma ve gostermeyi gerceklestırır
-    def update_parse_result(self, text):
-        self.parse_result_widget.config(state='normal')
-        self.parse_result_widget.delete("1.0", "end")
-        
-        #basarılı ise ast gosterilir degilse hata mesajı ve pos yazılır
-        try:
-            tokens = self.lexer.tokenize(text)
-            parser = Parser(tokens)
-            ast = parser.parse()
-            
-            formatted_ast = self.format_ast(ast, indent=0)
-            self.parse_result_widget.insert("1.0", f"✅ Parse Başarılı!\n\nAST:\n{formatted_ast}")
-            self.parse_result_widget.config(fg="darkgreen")
-            
-        except Exception as e:
-            error_msg = f"❌ Parse Hatası:\n{str(e)}\n\n"
-            if 'parser' in locals() and hasattr(parser, 'current_token') and parser.current_token:
-                error_msg += f"Token: {parser.current_token.value}\n"
-                error_msg += f"Position: {parser.pos}/{len(tokens) if 'tokens' in locals() else '?'}"
-            else:
-                error_msg += "Position: EOF"
-            self.parse_result_widget.insert("1.0", error_msg)
-            self.parse_result_widget.config(fg="red")
-        
-        self.parse_result_widget.config(state='disabled')
-
-
-    #ast'yi ekranda guzel gostermek icin girintileme 
-    def format_ast(self, node, indent=0):
-        if not isinstance(node, tuple):
-            return "  " * indent + str(node)
-        
-        result = "  " * indent + node[0] + "\n"
-        for child in node[1:]:
-            if isinstance(child, (list, tuple)):
-                if isinstance(child, list):
-                    for item in child:
-                        result += self.format_ast(item, indent + 1) + "\n"
-                else:
-                    result += self.format_ast(child, indent + 1) + "\n"
-            else:
-                result += "  " * (indent + 1) + str(child) + "\n"
-        
-        return result.rstrip()
-
-
-#guı ye estetik olması için satır numraları ekleme
-class LineNumbers(tk.Text):
-    def __init__(self, master, text_widget, bg='lightgray', fg='black', **kwargs):
-        super().__init__(master, **kwargs)
-        self.text_widget = text_widget
-        self.config(
-            width=4, 
-            padx=4, 
-            takefocus=0, 
-            border=0,
-            background=bg,
-            foreground=fg,
-            state='disabled', 
-            wrap='none', 
-            font=('Consolas', 12) if text_widget else ('Consolas', 12)
-        )
-        
-        if self.text_widget:
-            self.text_widget.bind("<<Change>>", self.on_change)
-            self.text_widget.bind("<MouseWheel>", self.on_mousewheel)
-            self.text_widget.bind("<Button-4>", self.on_mousewheel)
-            self.text_widget.bind("<Button-5>", self.on_mousewheel)
-            
-        self.update_line_numbers()
-
-    def on_change(self, event=None):
-        #degişiklikten sonra satır numaralarını güncelleme
-        self.after_idle(self.update_line_numbers) 
-
-    def on_mousewheel(self, event=None):
-        #mouse ile scroll edildiğinde line numbersı da scroll et
-        self.after_idle(self.sync_scroll)
-
-    def sync_scroll(self):
-        if self.text_widget:
-            #text widgetın scroll pozisyonunu
-            top, bottom = self.text_widget.yview()
-            #line numbersı aynı pozisyona scroll etme
-            self.yview_moveto(top)
-
-    def update_line_numbers(self):
-        if not self.text_widget:
-            return
-            
-        self.config(state='normal')
-        self.delete("1.0", "end")
-
-        #text widget'taki gerçek satır sayısı
-        last_line = self.text_widget.index("end-1c").split('.')[0]
-        line_count = int(last_line)
-            
-        line_numbers = "\n".join(str(i) for i in range(1, line_count + 1))
-        self.insert("1.0", line_numbers)
-        self.config(state='disabled')
-        
-        #scroll senkronizasyonu
-        self.sync_scroll()
-
-
-#satır numaraları ve highlighting özellikleri eklemek için oluşturuldu
-class CustomText(tk.Text):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        pass
+import io
+import threading
+import tkinter as tk
+from tkinter import font as tkfont
+from analysis import AnalysisScheduler
+from astview import write_ast
+from core import Analyzer
+from lexer import find_edit
+from lineindex import LineIndex
+from parser import merge_token_damage
+from profiling import Profiler
+from themes import DARK_PALETTE, LIGHT_PALETTE
+
+#highlighting ve parse sonuc gosterimi yapılan classımız 
+#lexer, parser ve önbellek core.Analyzer'dadır, bu sınıf onları tk taglarına ve panellere bağlar
+class SyntaxHighlighter(Analyzer):
+    #viewport açıksa sadece görünen satırlar (ve viewport_margin kadar komşu satır) renklendirilir
+    #cache_size, içerik adresli token/AST önbelleğinin tahmini bayt sınırıdır (0 verilirse önbellek kapalı)
+    #ast_view (astview.ASTView) verilirse AST ağaç görünümünde, parse_result_widget'ta sadece durum gösterilir
+    #outline_view (symbols.OutlineView) verilirse her parse'tan sonra tanımların anahattı güncellenir
+    #background=True ise düzenlemeler analysis.AnalysisScheduler ile birleştirilip parse arka planda yapılır
+    #profiler (profiling.Profiler) verilirse her analizin aşama süreleri ve sayaçları ona kaydedilir
+    def __init__(self, text_widget, lexer, parse_result_widget, dark_mode=False, viewport=False, viewport_margin=40,
+                 cache_size=32 << 20, ast_view=None, outline_view=None, background=False, profiler=None):
+        super().__init__(lexer, cache_size, profiler)
+        self.text = text_widget
+        self.parse_result_widget = parse_result_widget
+        self.ast_view = ast_view
+        self.outline_view = outline_view
+        self.dark_mode = dark_mode
+        self.viewport = viewport
+        self.viewport_margin = viewport_margin
+        #renklendirilmiş [başlangıç, bitiş) karakter aralıkları, düzenlemelerle birlikte kaydırılır
+        self.tagged = []
+        self._scroll_pending = False
+        #son renklendirme geçişindeki tk çağrısı sayısı (tag_add, tag_remove, dump, tag_names)
+        self.tcl_calls = 0
+        #dosya yüklenirken (loader.FileLoader) True, düzenleme eventleri analiz başlatmaz
+        self.suspended = False
+        self.token_tags = ["KEYWORD", "BUILTIN", "IDENTIFIER", "NUMBER", "STRING",
+                           "FSTRING", "COMMENT", "OPERATOR", "DELIMITER", "ERROR"]
+
+        #renklendirme, her token için bi renk (paletler themes.py'de, render.py ile ortak)
+        palette = DARK_PALETTE if self.dark_mode else LIGHT_PALETTE
+        for tag, (foreground, underline) in palette.items():
+            self.text.tag_configure(tag, foreground=foreground, underline=underline)
+
+        #yazı değiştikçe highlight yap
+        self.scheduler = AnalysisScheduler(self) if background else None
+        on_modified = self.scheduler.on_modified if background else self.on_modified
+        self.text.bind("<KeyRelease>", on_modified)
+        self.text.bind("<<Paste>>", on_modified)
+        self.text.bind("<<Cut>>", on_modified)
+
+    #kullanıcı kod yazdıkça cagrılıyor
+    def on_modified(self, event=None):
+        if self.suspended:
+            return
+        try:
+            with self.profiler.run("edit"):
+                content = self.text.get("1.0", "end-1c")
+                self.highlight(content)
+                self.update_parse_result(content)
+                #change eventi gönder (satır numaraları için)
+                self.text.event_generate("<<Change>>")
+        except Exception as e:
+            print(f"Error in on_modified: {e}")
+
+
+    #metin parça parça değiştirilirken (dosya yükleme) analiz durdurulur: arka plandaki parse iptal edilir,
+    #zamanlanmış analiz kaldırılır ve düzenleme eventleri yok sayılır. highlight yine doğrudan çağrılabilir
+    def suspend(self):
+        self.suspended = True
+        if self.scheduler is not None:
+            self.scheduler.cancel()
+
+    #analizi sürdürür ve güncel metni bir kere renklendirip parse eder
+    def resume(self):
+        self.suspended = False
+        if self.scheduler is not None:
+            self.scheduler.on_modified()
+        else:
+            self.on_modified()
+
+    #lexer ile tokenlara ayırır ve renklendirmeyi uygular
+    #önceki metne göre sadece düzenlemenin bozduğu bölge yeniden tokenize edilip renklendirilir
+    #tcl_calls bu geçişte yapılan tag_add/tag_remove/dump/tag_names çağrılarının sayısıdır
+    #text verilmezse widget'ın kaydettiği düzenlemeler uygulanır ve metin incremental lexer'dan alınır
+    #(dosya yükleme: her parçada tüm metin alınıp karşılaştırılmaz)
+    def highlight(self, text=None):
+        profiler = self.profiler
+        try:
+            with profiler.run("highlight"):
+                with profiler.stage("lex"):
+                    start, end = self.relex(text)
+                    if text is None:
+                        text = self.incremental.text
+                self.tcl_calls = 0
+
+                with profiler.stage("tag"):
+                    #konumlar doğrudan "satır.sütun" indekslerine çevrilir, tk'nin metni yürümesine gerek kalmaz
+                    line_index = self.get_line_index(text)
+
+                    #bölge dışındaki taglar tk tarafından metinle birlikte kaydırılmıştır
+                    if start < end:
+                        self.retag_region(line_index, start, end)
+
+                    self.tag_visible(line_index)
+                profiler.set("tokens", len(self.incremental.tokens))
+                profiler.set("relexed_chars", end - start)
+                profiler.set("tcl_calls", self.tcl_calls)
+        except Exception as e:
+            print(f"Highlighting error: {e}")
+
+    #yeniden tokenize edilen [start, end) bölgesinde tk'deki taglar yeni tokenlarla karşılaştırılır,
+    #sadece türü değişen aralıklar kaldırılıp eklenir (bir tanımlayıcının içine yazmak hiç tag değiştirmez)
+    #bölgenin görünmeyen kısmındaki taglar kaldırılır, orası görünür olunca tag_visible renklendirir
+    def retag_region(self, line_index, start, end):
+        window_start, window_end = self.visible_range(line_index)
+        wanted_start, wanted_end = max(start, window_start), min(end, window_end)
+        #renklendirilmiş aralıkların dışında tag yoktur, tk'ye sormaya gerek kalmaz
+        if missing_ranges(self.tagged, start, end) == [(start, end)]:
+            current = {}
+        else:
+            current = self.applied_tags(line_index, start, end)
+        wanted = self.token_ranges(wanted_start, wanted_end) if wanted_start < wanted_end else {}
+
+        removes, adds = {}, {}
+        for tag in self.token_tags:
+            have, want = current.get(tag, []), wanted.get(tag, [])
+            if have != want:
+                removes[tag] = range_difference(have, want)
+                adds[tag] = range_difference(want, have)
+        self.apply_tag_changes(line_index, removes)
+        self.apply_tag_changes(line_index, adds, add=True)
+
+        self.tagged = subtract_range(self.tagged, start, end)
+        if wanted_start < wanted_end:
+            self.tagged = add_range(self.tagged, wanted_start, wanted_end)
+
+    #[start, end) içinde tk'de şu an duran token tagları: tag -> sıralı aralıklar
+    #başlangıçta açık olan taglar tag_names ile, içerideki geçişler tek bir dump çağrısıyla alınır
+    def applied_tags(self, line_index, start, end):
+        start_index, end_index = line_index.tk_index(start), line_index.tk_index(end)
+        token_tags = set(self.token_tags)
+        opened = {tag: start for tag in self.text.tag_names(start_index) if tag in token_tags}
+        ranges = {}
+        for key, tag, index in self.text.dump(start_index, end_index, tag=True):
+            if tag not in token_tags:
+                continue
+            line, column = index.split(".")
+            offset = line_index.offset(int(line), int(column))
+            if key == "tagon":
+                opened.setdefault(tag, offset)
+            elif key == "tagoff" and tag in opened:
+                tag_start = opened.pop(tag)
+                if tag_start < offset:
+                    ranges.setdefault(tag, []).append((tag_start, min(offset, end)))
+        for tag, tag_start in opened.items():
+            if tag_start < end:
+                ranges.setdefault(tag, []).append((tag_start, end))
+        self.tcl_calls += 2
+        return ranges
+
+    #[start, end) içindeki tokenların aralıkları: tag -> sıralı aralıklar, bitişik aynı türler birleşir
+    #token_index satırın kontrol noktasından başlar, böylece aralığın üstünde açılmış çok satırlı bir
+    #string de bulunur
+    def token_ranges(self, start, end):
+        tokens = self.incremental.tokens
+        ranges = {}
+        for index in range(self.incremental.token_index(start), len(tokens)):
+            token = tokens[index]
+            token_start, token_end = token.position
+            if token_start >= end:
+                break
+            token_start, token_end = max(token_start, start), min(token_end, end)
+            tag_ranges = ranges.get(token.type)
+            if tag_ranges is None:
+                ranges[token.type] = [(token_start, token_end)]
+            elif tag_ranges[-1][1] == token_start:
+                tag_ranges[-1] = (tag_ranges[-1][0], token_end)
+            else:
+                tag_ranges.append((token_start, token_end))
+        return ranges
+
+    #her tag için tüm aralıklar tek bir tag_add ya da tag_remove çağrısıyla (i1, i2, i3, i4, ...) uygulanır
+    def apply_tag_changes(self, line_index, changes, add=False):
+        for tag, ranges in changes.items():
+            if not ranges:
+                continue
+            indices = []
+            for range_start, range_end in ranges:
+                indices.append(line_index.tk_index(range_start))
+                indices.append(line_index.tk_index(range_end))
+            if add:
+                self.text.tag_add(tag, *indices)
+            else:
+                self.text.tag_remove(tag, *indices)
+            self.tcl_calls += 1
+
+    #görünen aralıkta (viewport kapalıysa tüm metinde) henüz renklendirilmemiş kısımları renklendirir
+    #boşluklarda tag olmadığı için karşılaştırma yapılmaz, her tag tek çağrıyla eklenir
+    def tag_visible(self, line_index=None):
+        if self.incremental.text is None:
+            return
+        if line_index is None:
+            line_index = LineIndex(line_starts=self.incremental.line_starts)
+        window_start, window_end = self.visible_range(line_index)
+
+        adds = {}
+        for gap_start, gap_end in missing_ranges(self.tagged, window_start, window_end):
+            for tag, ranges in self.token_ranges(gap_start, gap_end).items():
+                adds.setdefault(tag, []).extend(ranges)
+        self.apply_tag_changes(line_index, adds, add=True)
+        self.tagged = add_range(self.tagged, window_start, window_end)
+
+    #renklendirilecek [başlangıç, bitiş) karakter aralığı: text.yview() ile görünen satırlar ve kenar payı
+    def visible_range(self, line_index):
+        length = len(self.incremental.text)
+        if not self.viewport:
+            return 0, length
+        top, bottom = self.text.yview()
+        line_count = line_index.line_count()
+        first_line = max(1, int(top * line_count) + 1 - self.viewport_margin)
+        last_line = min(line_count, int(bottom * line_count) + 1 + self.viewport_margin)
+        start = line_index.offset(first_line, 0)
+        end = line_index.offset(last_line + 1, 0) if last_line < line_count else length
+        return start, end
+
+    #main.py'deki scroll callback'lerinden çağrılır, yeni görünen satırlar boşta renklendirilir
+    def on_scroll(self, *args):
+        if not self.viewport or self._scroll_pending:
+            return
+        self._scroll_pending = True
+        self.text.after_idle(self.tag_after_scroll)
+
+    def tag_after_scroll(self):
+        self._scroll_pending = False
+        #highlight edilmemiş düzenleme varsa tokenlar güncel değildir, on_modified halledecek
+        if getattr(self.text, "edits", None):
+            return
+        if self.scheduler is not None and self.scheduler.scheduled is not None:
+            return
+        try:
+            with self.profiler.run("scroll"), self.profiler.stage("tag"):
+                self.tcl_calls = 0
+                self.tag_visible()
+                self.profiler.set("tcl_calls", self.tcl_calls)
+        except Exception as e:
+            print(f"Highlighting error: {e}")
+
+    #incremental lexer'ı yeni metne getirir ve yeniden renklendirilmesi gereken [start, end) aralığını döndürür
+    #widget düzenlemeleri kaydediyorsa (CustomText) onlar birebir uygulanır, çünkü tk'nin tag
+    #davranışı gerçek düzenlemeye göredir; kayıt yoksa düzenleme metin farkından çıkarılır
+    #text verilmezse kaydedilen düzenlemelerin sonucu widget'ın metni sayılır (kayıt yoksa widget'tan alınır)
+    def relex(self, text=None):
+        edits = self.text.take_edits() if hasattr(self.text, "take_edits") else None
+        if text is None and (edits is None or self.incremental.text is None):
+            text = self.text.get("1.0", "end-1c")
+        if self.incremental.text is None:
+            return self.reset(text)
+        if edits is None:
+            edits = [find_edit(self.incremental.text, text)]
+
+        start, end = None, None
+        for offset, deleted, inserted in edits:
+            #renklendirilmiş aralıklar ve önceki düzenlemelerin bölgesi bu düzenlemeye göre kaydırılır
+            self.tagged = shift_ranges(self.tagged, offset, deleted, inserted)
+            if start is not None:
+                start = shift_offset(start, offset, deleted, inserted)
+                end = shift_offset(end, offset, deleted, inserted)
+            damage = self.incremental.apply_edit(offset, deleted, inserted)
+            self.token_damage = merge_token_damage(self.token_damage, *damage[:3])
+            start = damage[3] if start is None else min(start, damage[3])
+            end = damage[4] if end is None else max(end, damage[4])
+
+        if text is not None and self.incremental.text != text:
+            #kayıt widget ile uyuşmuyorsa baştan tokenize et
+            return self.reset(text)
+        if start is None:
+            return 0, 0
+        return start, end
+
+    #metni baştan tokenize eder (önbellekte varsa oradan alır), tüm metin yeniden renklendirilecek
+    def reset(self, text):
+        self.tagged = []
+        return super().reset(text)
+
+    #ast cikarma ve gostermeyi gerceklestırır
+    def update_parse_result(self, text):
+        with self.profiler.run("parse"):
+            tokens = None
+            try:
+                tokens = self.get_tokens(text)
+                ast = self.parse(text, tokens)
+            except Exception as e:
+                self.show_parse_error(e, tokens)
+                return
+            self.show_parse_result(ast, tokens)
+
+    #parser'ın son durumunu (ast, hatalar, tanımlar) panellere yazar; tokens parse edilen tokenlardır
+    #symbol_index parse ya da index_symbols ile bu AST için kurulmuş olmalıdır
+    def show_parse_result(self, ast, tokens):
+        errors = self.incremental_parser.errors
+        with self.profiler.stage("symbols"):
+            if self.outline_view is not None:
+                self.outline_view.update(self.symbol_index)
+
+        with self.profiler.stage("format"):
+            #ağaç görünümünde sadece değişen statement'lar yenilenir, metin dökümü yapılmaz
+            if self.ast_view is not None:
+                self.ast_view.update(ast)
+                formatted_ast = f"{len(ast[1])} statement (ağaç görünümünde)"
+            else:
+                formatted_ast = self.format_ast(ast, indent=0)
+
+            #basarılı ise ast gosterilir degilse hata mesajı ve pos yazılır
+            if errors:
+                #tüm hatalar konumlarıyla, altında hatalı statement'lar ERROR olarak kısmi AST
+                error_lines = []
+                for message, position in errors:
+                    where = f"Satır: {position[0]}, Sütun: {position[1]}" if position else "EOF"
+                    error_lines.append(f"{where}: {message}")
+                error_msg = f"❌ Parse Hatası ({len(errors)}):\n" + "\n".join(error_lines)
+                self.set_parse_result(f"{error_msg}\n\nKısmi AST:\n{formatted_ast}", "red")
+            else:
+                self.set_parse_result(f"✅ Parse Başarılı!\n\nAST:\n{formatted_ast}", "darkgreen")
+
+    #parse yarıda kaldıysa hata ve parser'ın kaldığı konum yazılır
+    def show_parse_error(self, error, tokens=None):
+        error_msg = f"❌ Parse Hatası:\n{str(error)}\n\n"
+        parser = self.incremental_parser.parser
+        if parser is not None and parser.current_token:
+            error_msg += f"Token: {parser.current_token.value}\n"
+            #line_index olmadan parse edildiyse konum satır/sütun değil token sırasıdır (get_line_number gibi)
+            position = parser.get_position()
+            if position is None:
+                error_msg += f"Konum: pos:{parser.pos}\n"
+            else:
+                error_msg += f"Satır: {position[0]}, Sütun: {position[1]}\n"
+            error_msg += f"Position: {parser.pos}/{len(tokens) if tokens is not None else '?'}"
+        else:
+            error_msg += "Position: EOF"
+        self.set_parse_result(error_msg, "red")
+
+    def set_parse_result(self, message, color):
+        self.parse_result_widget.config(state='normal')
+        self.parse_result_widget.delete("1.0", "end")
+        self.parse_result_widget.insert("1.0", message)
+        self.parse_result_widget.config(fg=color)
+        self.parse_result_widget.config(state='disabled')
+
+
+    #ast'yi ekranda guzel gostermek icin girintileme
+    #astview.write_ast ile tek geçişte yazılır (dosyaya dışa aktarmada da o kullanılır)
+    def format_ast(self, node, indent=0):
+        out = io.StringIO()
+        write_ast(node, out, indent)
+        return out.getvalue()
+
+
+#bir konumu (offset, deleted, inserted) düzenlemesinden sonraki karşılığına taşır
+def shift_offset(position, offset, deleted, inserted):
+    if position <= offset:
+        return position
+    if position >= offset + deleted:
+        return position + len(inserted) - deleted
+    return offset + len(inserted)
+
+
+#sıralı ve çakışmayan [başlangıç, bitiş) aralık listeleri için yardımcılar (renklendirilmiş bölgeler)
+def shift_ranges(ranges, offset, deleted, inserted):
+    result = []
+    for start, end in ranges:
+        start = shift_offset(start, offset, deleted, inserted)
+        end = shift_offset(end, offset, deleted, inserted)
+        if start < end:
+            result.append((start, end))
+    return result
+
+
+def subtract_range(ranges, start, end):
+    result = []
+    for range_start, range_end in ranges:
+        if range_start < start:
+            result.append((range_start, min(range_end, start)))
+        if range_end > end:
+            result.append((max(range_start, end), range_end))
+    return result
+
+
+def add_range(ranges, start, end):
+    result = []
+    for range_start, range_end in ranges:
+        if range_end < start or range_start > end:
+            result.append((range_start, range_end))
+        else:
+            start, end = min(start, range_start), max(end, range_end)
+    result.append((start, end))
+    result.sort()
+    return result
+
+
+#a'daki aralıkların b tarafından kapsanmayan kısımları (ikisi de sıralı ve çakışmasız)
+def range_difference(a, b):
+    result = []
+    index = 0
+    for start, end in a:
+        while index < len(b) and b[index][1] <= start:
+            index += 1
+        cursor = start
+        other = index
+        while other < len(b) and b[other][0] < end:
+            if b[other][0] > cursor:
+                result.append((cursor, b[other][0]))
+            cursor = max(cursor, b[other][1])
+            other += 1
+        if cursor < end:
+            result.append((cursor, end))
+    return result
+
+
+#[start, end) içinde listedeki aralıkların kapsamadığı boşluklar
+def missing_ranges(ranges, start, end):
+    gaps = []
+    cursor = start
+    for range_start, range_end in ranges:
+        if range_end <= cursor:
+            continue
+        if range_start >= end:
+            break
+        if range_start > cursor:
+            gaps.append((cursor, range_start))
+        cursor = max(cursor, range_end)
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+#guı ye estetik olması için satır numraları ekleme
+class LineNumbers(tk.Text):
+    #profiler (profiling.Profiler) verilirse her güncelleme line_numbers aşaması olarak kaydedilir
+    def __init__(self, master, text_widget, bg='lightgray', fg='black', profiler=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.text_widget = None
+        self.profiler = profiler or Profiler(enabled=False)
+        #gösterilen satır sayısı, numaralar sadece bu değiştiğinde eklenip silinir
+        self.line_count = 0
+        #<<Change>> patlamaları tek güncellemede birleşir
+        self.pending = False
+        self.config(
+            width=4, 
+            padx=4, 
+            takefocus=0, 
+            border=0,
+            background=bg,
+            foreground=fg,
+            state='disabled', 
+            wrap='none', 
+            font=('Consolas', 12) if text_widget else ('Consolas', 12)
+        )
+        
+        if text_widget:
+            self.attach(text_widget)
+
+    #text widget'a bağlanır (widget sonradan oluşturulabilir), <<Change>> bu sınıf tarafından dinlenir
+    def attach(self, text_widget):
+        self.text_widget = text_widget
+        self.text_widget.bind("<<Change>>", self.on_change, add="+")
+        self.text_widget.bind("<MouseWheel>", self.on_mousewheel, add="+")
+        self.text_widget.bind("<Button-4>", self.on_mousewheel, add="+")
+        self.text_widget.bind("<Button-5>", self.on_mousewheel, add="+")
+        self.update_line_numbers()
+
+    def on_change(self, event=None):
+        #degişiklikten sonra satır numaralarını güncelleme
+        if not self.pending:
+            self.pending = True
+            self.after_idle(self.update_line_numbers)
+
+    def on_mousewheel(self, event=None):
+        #mouse ile scroll edildiğinde line numbersı da scroll et
+        self.after_idle(self.sync_scroll)
+
+    def sync_scroll(self):
+        if self.text_widget:
+            #text widgetın scroll pozisyonunu
+            top, bottom = self.text_widget.yview()
+            #line numbersı aynı pozisyona scroll etme
+            self.yview_moveto(top)
+
+    #satır sayısı değişmediyse hiçbir şey yapılmaz; arttıysa sadece yeni numaralar sona eklenir,
+    #azaldıysa fazlası sondan silinir (eskiden her tuşta tüm numaralar yeniden yazılıyordu)
+    def update_line_numbers(self):
+        self.pending = False
+        if not self.text_widget:
+            return
+
+        with self.profiler.run("line_numbers"), self.profiler.stage("line_numbers"):
+            #text widget'taki gerçek satır sayısı
+            last_line = self.text_widget.index("end-1c").split('.')[0]
+            line_count = int(last_line)
+            self.profiler.set("lines", line_count)
+            if line_count == self.line_count:
+                return
+
+            self.config(state='normal')
+            if line_count > self.line_count:
+                line_numbers = "\n".join(str(i) for i in range(self.line_count + 1, line_count + 1))
+                self.insert("end-1c", "\n" + line_numbers if self.line_count else line_numbers)
+            else:
+                self.delete(f"{line_count}.end", "end-1c")
+            #numaralar sığsın diye genişlik basamak sayısına göre ayarlanır
+            if len(str(line_count)) != len(str(self.line_count)):
+                self.config(width=max(4, len(str(line_count))))
+            self.line_count = line_count
+            self.config(state='disabled')
+
+            #scroll senkronizasyonu
+            self.sync_scroll()
+
+
+#sadece görünen satırların numaralarını çizen canvas tabanlı satır numaraları
+#numaralar widget'ta metin olarak tutulmaz; her çizimde text widget'ın ilk görünen satırından başlanıp
+#dlineinfo ile görünen satırların y konumları alınır, maliyet dosyanın boyutuna değil pencere
+#yüksekliğine bağlıdır. LineNumbers ile aynı arayüze sahiptir (update_line_numbers, yview, yview_moveto)
+class LineNumberCanvas(tk.Canvas):
+    def __init__(self, master, text_widget, bg='lightgray', fg='black', font=('Consolas', 12), profiler=None,
+                 **kwargs):
+        super().__init__(master, background=bg, highlightthickness=0, border=0, **kwargs)
+        self.text_widget = None
+        self.profiler = profiler or Profiler(enabled=False)
+        self.fg = fg
+        self.font = font
+        #bir basamağın piksel genişliği, genişlik satır sayısının basamak sayısına göre ayarlanır
+        self.digit_width = tkfont.Font(font=font).measure("0")
+        self.digits = 0
+        self.pending = False
+        if text_widget:
+            self.attach(text_widget)
+
+    def attach(self, text_widget):
+        self.text_widget = text_widget
+        self.text_widget.bind("<<Change>>", self.on_change, add="+")
+        self.text_widget.bind("<Configure>", self.on_change, add="+")
+        self.update_line_numbers()
+
+    #değişiklik, kaydırma ve yeniden boyutlandırmada çizim boşta bir kere yapılır
+    def on_change(self, event=None):
+        if not self.pending:
+            self.pending = True
+            self.after_idle(self.update_line_numbers)
+
+    #text widget'ın kaydırma komutları buraya da iletildiğinde sadece yeniden çizilir
+    def yview(self, *args):
+        self.on_change()
+
+    def yview_moveto(self, fraction):
+        self.on_change()
+
+    def update_line_numbers(self):
+        self.pending = False
+        if not self.text_widget:
+            return
+        with self.profiler.run("line_numbers"), self.profiler.stage("line_numbers"):
+            self.draw_line_numbers()
+
+    def draw_line_numbers(self):
+        text = self.text_widget
+        last_line = text.index("end-1c").split('.')[0]
+        digits = max(4, len(last_line))
+        if digits != self.digits:
+            self.digits = digits
+            self.config(width=(digits + 1) * self.digit_width)
+        width = int(self["width"])
+        self.delete("all")
+        #ilk görünen satırdan itibaren görünmeyen ilk satıra kadar
+        line = first_line = int(text.index("@0,0").split('.')[0])
+        while line <= int(last_line):
+            info = text.dlineinfo(f"{line}.0")
+            if info is None:
+                break
+            self.create_text(width - self.digit_width // 2, info[1], anchor="ne",
+                             text=str(line), fill=self.fg, font=self.font)
+            line += 1
+        self.profiler.set("lines", int(last_line))
+        self.profiler.set("lines_drawn", line - first_line)
+
+
+#satır numaraları ve highlighting özellikleri eklemek için oluşturuldu
+#widget komutunun araya girilerek insert/delete/replace düzenlemeleri (offset, silinen, eklenen) olarak kaydedilir
+class CustomText(tk.Text):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.edits = []
+        self._orig = self._w + "_orig"
+        self.tk.call("rename", self._w, self._orig)
+        self.tk.createcommand(self._w, self._proxy)
+
+    #kaydedilen düzenlemeleri verir ve kaydı temizler, çözümlenemeyen bir düzenleme olduysa None döner
+    def take_edits(self):
+        edits, self.edits = self.edits, []
+        if None in edits:
+            return None
+        return edits
+
+    #karakter konumu (1.0'dan itibaren karakter sayısı)
+    def _offset(self, index):
+        return self.tk.getint(self.tk.call(self._orig, "count", "-chars", "1.0", index) or 0)
+
+    def _proxy(self, command, *args):
+        if command not in ("insert", "delete", "replace"):
+            return self.tk.call((self._orig, command) + args)
+
+        #kapalı (disabled) widget düzenlemeleri yok sayar
+        if str(self.tk.call(self._orig, "cget", "-state")) == "disabled":
+            return self.tk.call((self._orig, command) + args)
+
+        length = self._offset("end-1c")
+        if command == "delete" and len(args) > 2:
+            #birden fazla aralık silme, kayıt yerine yeniden tokenize ettirir
+            offset, inserted = None, ""
+        else:
+            offset = min(self._offset(args[0]), length)
+            inserted = "".join(args[1::2] if command == "insert" else args[2::2])
+
+        result = self.tk.call((self._orig, command) + args)
+
+        if offset is None:
+            self.edits.append(None)
+        else:
+            deleted = length + len(inserted) - self._offset("end-1c")
+            if deleted or inserted:
+                self.edits.append((offset, deleted, inserted))
+        return result
+
+
+#durum çubuğunda gösterilen aşamalar ve kısa adları
+PROFILE_LABELS = (("load", "yükleme"), ("lex", "lex"), ("parse", "parse"), ("format", "ast"), ("symbols", "anahat"),
+                  ("tag", "tag"), ("line_numbers", "satır no"))
+
+
+#analiz aşamalarının son sürelerini ve sayaçlarını gösteren durum çubuğu
+#profiler kancası her run'da (arka plan parse'ında işçi thread'den de) sadece son değerleri saklar,
+#etiket tk thread'inde interval ms'de bir ve ancak yeni bir run geldiyse yenilenir. Kanca ve etiket farklı
+#thread'lerde çalıştığı için sözlükler kilitle güncellenir, etiket kilit altında alınan kopyadan yazılır
+class ProfileBar(tk.Label):
+    def __init__(self, master, profiler, interval=250, **kwargs):
+        super().__init__(master, anchor="w", **kwargs)
+        self.profiler = profiler
+        self.interval = interval
+        self.stages = {}
+        self.counters = {}
+        self.dirty = False
+        self.lock = threading.Lock()
+        profiler.add_hook(self.on_run)
+        self.after(interval, self.refresh)
+
+    def on_run(self, run):
+        with self.lock:
+            self.stages.update(run["stages"])
+            self.counters.update(run["counters"])
+            self.dirty = True
+
+    def refresh(self):
+        with self.lock:
+            dirty = self.dirty
+            self.dirty = False
+        if dirty:
+            self.config(text=self.describe())
+        self.after(self.interval, self.refresh)
+
+    def describe(self):
+        with self.lock:
+            stages = dict(self.stages)
+            counters = dict(self.counters)
+        parts = [f"{label} {stages[stage] * 1000:.1f} ms" for stage, label in PROFILE_LABELS if stage in stages]
+        details = [f"{counters[name]} {label}" for name, label in
+                   (("tokens", "token"), ("statements", "statement"), ("ast_nodes", "düğüm"),
+                    ("tcl_calls", "tcl çağrısı")) if name in counters]
+        rate = self.profiler.cache_hit_rate()
+        if rate is not None:
+            details.append(f"önbellek %{rate * 100:.0f}")
+        return "   ".join(parts) + "   |   " + "   ".join(details)
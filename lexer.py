@@ -1,173 +1,651 @@
-#Token'lari oluşturma
-class Token:
-    def __init__(self, type, value, position):
-        self.type = type
-        self.value = value
-        self.position = position
-
-#Token sınıfı yardımıyla kodu tokenlara ayıran class 
-class Lexer:
-    def __init__(self):         #gereklii sabitler tanımlanır
-        self.keywords = ["if", "else", "while", "for", "def", "return", "print", 
-                        "class", "import", "from", "as", "try", "except", "finally",
-                        "with", "lambda", "yield", "async", "await", "None", "True", 
-                        "False", "and", "or", "not", "in", "is", "break", "continue",
-                        "elif", "pass", "raise", "assert", "del", "global", "nonlocal"]
-        
-        self.operators = ["+", "-", "*", "/", "=", "==", "!=", "<", ">", "<=", ">=",
-                         "+=", "-=", "*=", "/=", "%", "//", "**", "&", "|", "^", "~",
-                         "<<", ">>"]
-        
-        self.delimiters = ["(", ")", "{", "}", "[", "]", ";", ",", ".", ":", "'", '"']
-        
-        self.builtins = {"print", "len", "str", "int", "float", "list", "dict", "range", 
-                        "enumerate", "zip", "map", "filter", "sum", "max", "min", "abs",
-                        "round", "type", "isinstance", "hasattr", "getattr", "setattr",
-                        "open", "input", "sorted", "reversed", "any", "all", "bool",
-                        "set", "tuple", "frozenset", "bytes", "bytearray", "memoryview",
-                        "self", "cls", "__init__", "__str__", "__repr__", "__len__",
-                        "super", "property", "staticmethod", "classmethod"}
-    
-    #karakterin ne olduguna bakılır
-    
-    #boşluk mu 
-    def is_whitespace(self, char):
-        return char in [' ', '\t', '\n', '\r']
-    
-    #sayı mı 
-    def is_digit(self, char):
-        return '0' <= char <= '9'
-    
-    #harf ya da _ mi
-    def is_letter(self, char):
-        return ('a' <= char <= 'z') or ('A' <= char <= 'Z') or char == '_'
-    
-    #metni karakter karakter okur ve token haline getirir
-    def tokenize(self, text):
-        tokens = []
-        i = 0
-        
-        while i < len(text):
-            #bosluklar atlanır
-            if self.is_whitespace(text[i]):
-                i += 1
-                continue
-            
-            #yorum satırı 
-            if text[i] == '#':
-                start = i
-                i += 1
-                while i < len(text) and text[i] != '\n':
-                    i += 1
-                tokens.append(Token("COMMENT", text[start:i], (start, i)))
-                continue
-
-            #f-stringleri tanımlama
-            if text[i] == 'f' and i + 1 < len(text) and text[i + 1] in ['"', "'"]:
-                start = i
-                i += 1  # f'yi atla
-                quote_type = text[i]
-                i += 1  # tırnağı atla
-                while i < len(text) and text[i] != quote_type:
-                    if text[i] == '\\' and i + 1 < len(text):
-                        i += 2
-                    else:
-                        i += 1
-                if i < len(text):
-                    i += 1
-                tokens.append(Token("FSTRING", text[start:i], (start, i)))
-                continue
-            
-            #tek tırnaklı string
-            if text[i] == "'":
-                start = i
-                i += 1
-                while i < len(text) and text[i] != "'":
-                    if text[i] == '\\' and i + 1 < len(text):
-                        i += 2
-                    else:
-                        i += 1
-                if i < len(text):
-                    i += 1
-                tokens.append(Token("STRING", text[start:i], (start, i)))
-                continue
-            
-            #çift tırnaklı string
-            if text[i] == '"':
-                start = i
-                i += 1
-                while i < len(text) and text[i] != '"':
-                    if text[i] == '\\' and i + 1 < len(text):
-                        i += 2
-                    else:
-                        i += 1
-                if i < len(text):
-                    i += 1
-                tokens.append(Token("STRING", text[start:i], (start, i)))
-                continue
-            
-            #üç tırnaklı string
-            if i < len(text) - 2 and text[i:i+3] in ['"""', "'''"]:
-                quote_type = text[i:i+3]
-                start = i
-                i += 3
-                while i <= len(text) - 3:
-                    if text[i:i+3] == quote_type:
-                        i += 3
-                        break
-                    i += 1
-                tokens.append(Token("STRING", text[start:i], (start, i)))
-                continue
-            
-            #sayıları tanımlama
-            if self.is_digit(text[i]):
-                start = i
-                has_dot = False
-                while i < len(text) and (self.is_digit(text[i]) or (text[i] == '.' and not has_dot)):
-                    if text[i] == '.':
-                        has_dot = True
-                    i += 1
-                tokens.append(Token("NUMBER", text[start:i], (start, i)))
-                continue
-            
-            #tanımlayıcılar ve anahtar kelimeleri tanıma
-            if self.is_letter(text[i]):
-                start = i
-                while i < len(text) and (self.is_letter(text[i]) or self.is_digit(text[i])):
-                    i += 1
-                word = text[start:i]
-                
-                if word in self.keywords:
-                    tokens.append(Token("KEYWORD", word, (start, i)))
-                elif word in self.builtins:
-                    tokens.append(Token("BUILTIN", word, (start, i)))
-                else:
-                    tokens.append(Token("IDENTIFIER", word, (start, i)))
-                continue
-
-            #ayraçları tanıma
-            if text[i] in self.delimiters:
-                tokens.append(Token("DELIMITER", text[i], (i, i+1)))
-                i += 1
-                continue
-
-            #operatörleri tanımlama
-            found_operator = False
-            for op_length in [2, 1]:
-                if i + op_length <= len(text):
-                    op = text[i:i+op_length]
-                    if op in self.operators:
-                        tokens.append(Token("OPERATOR", op, (i, i+op_length)))
-                        i += op_length
-                        found_operator = True
-                        break
-            
-            if found_operator:
-                continue
-            
-            #tanımlanamayan bi karakter olursa consola bastırsın
-            if i < len(text) and not self.is_whitespace(text[i]):
-                print(f"Tanımlanamayan karakter: '{text[i]}' konum: {i}")
-                i += 1
-        
-        return tokens
\ No newline at end of file
+import codecs
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from lineindex import Utf8Offsets
+
+#token türleri, TokenArray bunları küçük tamsayı kodlarıyla saklar
+TOKEN_TYPES = ("KEYWORD", "BUILTIN", "IDENTIFIER", "NUMBER", "STRING", "FSTRING",
+               "COMMENT", "OPERATOR", "DELIMITER", "ERROR")
+TOKEN_CODES = {name: code for code, name in enumerate(TOKEN_TYPES)}
+
+#tokenize_bytes'ta satır sonlarını aramak için (memoryview'da find yok)
+LINE_END = re.compile(b"\n")
+
+#Token'lari oluşturma
+class Token:
+    __slots__ = ("type", "value", "position")
+
+    def __init__(self, type, value, position):
+        self.type = type
+        self.value = value
+        self.position = position
+
+
+#tokenları sütunlar halinde saklayan kompakt dizi: tür kodları array('B'), başlangıç ve
+#bitişler array('I') içinde tutulur, value ancak istendiğinde kaynaktan kesilir
+#liste gibi indekslenip dolaşılabilir, her erişimde geçici bir Token üretir (Parser ve highlight için)
+class TokenArray:
+    def __init__(self, source, kinds=None, starts=None, ends=None):
+        self.source = source
+        self.kinds = kinds if kinds is not None else array("B")
+        self.starts = starts if starts is not None else array("I")
+        self.ends = ends if ends is not None else array("I")
+
+    #Token listesinden oluşturur
+    @classmethod
+    def from_tokens(cls, source, tokens):
+        result = cls(source)
+        for token in tokens:
+            result.append(TOKEN_CODES[token.type], token.position[0], token.position[1])
+        return result
+
+    def append(self, code, start, end):
+        self.kinds.append(code)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return TokenArray(self.source, self.kinds[index], self.starts[index], self.ends[index])
+        start, end = self.starts[index], self.ends[index]
+        return Token(TOKEN_TYPES[self.kinds[index]], self.source[start:end], (start, end))
+
+    def __iter__(self):
+        source = self.source
+        for code, start, end in zip(self.kinds, self.starts, self.ends):
+            yield Token(TOKEN_TYPES[code], source[start:end], (start, end))
+
+    #Token üretmeden tek alan okumak için
+    def type_at(self, index):
+        return TOKEN_TYPES[self.kinds[index]]
+
+    def value_at(self, index):
+        return self.source[self.starts[index]:self.ends[index]]
+
+    #tokenize_bytes sonucunu (kaynak utf-8 tampon, konumlar bayt) str kaynaklı ve karakter
+    #konumlu diziye çevirir; tk highlighter gibi karakter konumu isteyenler için
+    def decode(self, encoding="utf-8"):
+        offsets = Utf8Offsets(self.source)
+        return TokenArray(bytes(self.source).decode(encoding), array("B", self.kinds),
+                          array("I", offsets.char_offsets(self.starts)),
+                          array("I", offsets.char_offsets(self.ends)))
+
+    #dizilerin kapladığı bayt (kaynak metin hariç)
+    def nbytes(self):
+        return sum(len(column) * column.itemsize for column in (self.kinds, self.starts, self.ends))
+
+#Token sınıfı yardımıyla kodu tokenlara ayıran class 
+class Lexer:
+    #kullanılabilen tokenize motorları
+    ENGINES = ("regex", "loop")
+
+    def __init__(self, engine="regex"):         #gereklii sabitler tanımlanır
+        if engine not in self.ENGINES:
+            raise ValueError(f"Bilinmeyen lexer motoru: {engine} (seçenekler: {', '.join(self.ENGINES)})")
+        self.engine = engine
+
+        self.keywords = ["if", "else", "while", "for", "def", "return", "print", 
+                        "class", "import", "from", "as", "try", "except", "finally",
+                        "with", "lambda", "yield", "async", "await", "None", "True", 
+                        "False", "and", "or", "not", "in", "is", "break", "continue",
+                        "elif", "pass", "raise", "assert", "del", "global", "nonlocal"]
+        
+        self.operators = ["+", "-", "*", "/", "=", "==", "!=", "<", ">", "<=", ">=",
+                         "+=", "-=", "*=", "/=", "%", "//", "**", "&", "|", "^", "~",
+                         "<<", ">>"]
+        
+        self.delimiters = ["(", ")", "{", "}", "[", "]", ";", ",", ".", ":", "'", '"']
+        
+        self.builtins = {"print", "len", "str", "int", "float", "list", "dict", "range", 
+                        "enumerate", "zip", "map", "filter", "sum", "max", "min", "abs",
+                        "round", "type", "isinstance", "hasattr", "getattr", "setattr",
+                        "open", "input", "sorted", "reversed", "any", "all", "bool",
+                        "set", "tuple", "frozenset", "bytes", "bytearray", "memoryview",
+                        "self", "cls", "__init__", "__str__", "__repr__", "__len__",
+                        "super", "property", "staticmethod", "classmethod"}
+
+        #tanımlanamayan karakter dizileri ERROR tokenı olur ve son taramanın teşhisleri burada tutulur:
+        #("Tanımlanamayan karakter", değer, (başlangıç, bitiş))
+        self.diagnostics = []
+
+        #regex motoru için tablolar bir kere derlenir
+        self.master_pattern = self.build_master_pattern()
+        self.word_types = {word: "BUILTIN" for word in self.builtins}
+        self.word_types.update((word, "KEYWORD") for word in self.keywords)
+        self.word_codes = {word: TOKEN_CODES[kind] for word, kind in self.word_types.items()}
+
+        #tokenize_bytes için aynı tabloların bayt karşılıkları
+        self.byte_pattern = self.build_master_pattern(binary=True)
+        self.byte_word_codes = {word.encode("ascii"): code for word, code in self.word_codes.items()}
+
+    #keyword, operator ve delimiter tablolarından tek bir alternation regex üretir
+    #alternatiflerin sırası tokenize_loop'taki kontrol sırasıyla aynıdır, böylece iki motor aynı tokenları üretir
+    #binary=True ise utf-8 baytlar üzerinde çalışan karşılığı derlenir: ascii olmayan her bayt isim
+    #karakteri sayılır, bu durumlar tokenize_bytes'ta str regex'i ile tekrar taranır
+    def build_master_pattern(self, binary=False):
+        #kaçış karakteri sonraki karakteri de yutar, kapanmayan string metin sonuna kadar gider
+        def quoted(quote):
+            return quote + r"[^" + quote + r"\\]*(?:\\[\s\S]?[^" + quote + r"\\]*)*" + quote + "?"
+        strings = quoted("'") + "|" + quoted('"')
+
+        #loop motoru sadece 2 ve 1 karakterlik operatörlere bakar, uzun olanlar önce denenir
+        operators = sorted((op for op in self.operators if len(op) <= 2), key=len, reverse=True)
+
+        delimiters = "|".join(re.escape(d) for d in self.delimiters)
+        operators = "|".join(re.escape(op) for op in operators)
+
+        #isimler unicode harfle başlayabilir (\w'den rakamlar çıkarılmış hali), devamında rakam da olabilir
+        word = r"[^\W\d]\w*"
+        letter = r"[^\W\d]"
+        if binary:
+            word = r"[A-Za-z_\x80-\xff][A-Za-z0-9_\x80-\xff]*"
+            letter = r"[A-Za-z_\x80-\xff]"
+        #hiçbir tokenı başlatmayan karakterler tek bir ERROR tokenında birleştirilir
+        error = r"(?:(?!" + letter + r"|[#'\"0-9]|" + delimiters + "|" + operators + r")[^ \t\n\r])+"
+
+        alternatives = [
+            ("COMMENT", r"#[^\n]*"),
+            ("FSTRING", "f(?:" + strings + ")"),
+            ("STRING", strings),
+            ("NUMBER", r"[0-9]+(?:\.[0-9]*)?"),
+            ("WORD", word),
+            ("DELIMITER", delimiters),
+            ("OPERATOR", operators),
+            ("ERROR", error),
+        ]
+        body = "|".join(f"(?P<{name}>{pattern})" for name, pattern in alternatives)
+        #tokenlardan önceki boşluklar aynı eşleşmede atlanır
+        source = r"[ \t\n\r]*(?:" + body + ")"
+        return re.compile(source.encode("ascii") if binary else source)
+
+    #karakterin ne olduguna bakılır
+    
+    #boşluk mu 
+    def is_whitespace(self, char):
+        return char in [' ', '\t', '\n', '\r']
+    
+    #sayı mı 
+    def is_digit(self, char):
+        return '0' <= char <= '9'
+    
+    #harf ya da _ mi, ascii dışı karakterler için unicode sınıflandırmasına bakılır
+    def is_letter(self, char):
+        if ('a' <= char <= 'z') or ('A' <= char <= 'Z') or char == '_':
+            return True
+        return char > '\x7f' and char.isalnum() and not char.isdecimal()
+
+    #ismin devamında olabilir mi (harf, _ ya da rakam)
+    def is_identifier_char(self, char):
+        if ('a' <= char <= 'z') or ('A' <= char <= 'Z') or ('0' <= char <= '9') or char == '_':
+            return True
+        return char > '\x7f' and char.isalnum()
+
+    #text[i] hiçbir tokenı başlatmıyor mu (ERROR dizisinin parçası mı)
+    def is_unknown(self, text, i):
+        char = text[i]
+        if (self.is_whitespace(char) or char in "#'\"" or self.is_digit(char)
+                or self.is_letter(char) or char in self.delimiters):
+            return False
+        return char not in self.operators and text[i:i+2] not in self.operators
+    
+    #seçili motora göre metni tokenlara ayırır
+    def tokenize(self, text):
+        return list(self.iter_tokens(text))
+
+    #seçili motorla pos konumundan başlayarak tokenları tek tek üretir
+    #pos bir token sınırı ya da boşluk olmalı (IncrementalLexer kontrol noktaları bunu sağlar)
+    def iter_tokens(self, text, pos=0):
+        if self.engine == "regex":
+            return self.iter_tokens_regex(text, pos)
+        return self.iter_tokens_loop(text, pos)
+
+    #Token nesneleri üretmeden doğrudan TokenArray doldurur (regex motoru)
+    def tokenize_array(self, text):
+        result = TokenArray(text)
+        kinds, starts, ends = result.kinds, result.starts, result.ends
+        codes = TOKEN_CODES
+        word_codes = self.word_codes
+        identifier = codes["IDENTIFIER"]
+        diagnostics = self.diagnostics = []
+        for match in self.master_pattern.finditer(text):
+            kind = match.lastgroup
+            start, end = match.span(kind)
+            if kind == "WORD":
+                code = word_codes.get(match.group(kind), identifier)
+            else:
+                code = codes[kind]
+                if kind == "ERROR":
+                    diagnostics.append(("Tanımlanamayan karakter", match.group(kind), (start, end)))
+            kinds.append(code)
+            starts.append(start)
+            ends.append(end)
+        return result
+
+    #utf-8 baytları (bytes, mmap ya da memoryview) str'ye çözmeden tokenize eder
+    #sonuç kaynağı bu tampon olan, konumları bayt cinsinden bir TokenArray'dir; memoryview verilirse
+    #value'lar kopyalanmadan kesilir, karakter konumları gerekince TokenArray.decode ile çevrilir
+    #ascii olmayan bayt içeren isimler ve bunlara bitişik ERROR dizileri bulunduğu satır çözülerek
+    #str regex'i ile taranır, böylece tokenlar tokenize ile birebir aynıdır
+    def tokenize_bytes(self, buffer):
+        result = TokenArray(buffer)
+        kinds, starts, ends = result.kinds, result.starts, result.ends
+        codes = TOKEN_CODES
+        byte_word_codes = self.byte_word_codes
+        identifier = codes["IDENTIFIER"]
+        diagnostics = self.diagnostics = []
+        length = len(buffer)
+
+        pos = 0
+        while pos < length:
+            unicode_start = None
+            for match in self.byte_pattern.finditer(buffer, pos):
+                kind = match.lastgroup
+                start, end = match.span(kind)
+                if kind == "WORD":
+                    value = match.group(kind)
+                    if not value.isascii():
+                        unicode_start = start
+                        break
+                    code = byte_word_codes.get(value, identifier)
+                else:
+                    if kind == "ERROR":
+                        if end < length and buffer[end] >= 0x80:
+                            unicode_start = start
+                            break
+                        diagnostics.append(("Tanımlanamayan karakter", match.group(kind).decode("ascii"), (start, end)))
+                    code = codes[kind]
+                kinds.append(code)
+                starts.append(start)
+                ends.append(end)
+            if unicode_start is None:
+                break
+            pos = self.tokenize_unicode_line(buffer, unicode_start, result)
+        return result
+
+    #tokenize_bytes için: start'tan satır sonuna kadar olan baytları çözüp str regex'i ile tarar
+    #ve tokenları bayt konumlarıyla result'a ekler; satır sonunda kapanmamış string varsa
+    #bölge sonraki satırlara genişletilir. Taramanın devam edeceği bayt konumunu döndürür
+    def tokenize_unicode_line(self, buffer, start, result):
+        length = len(buffer)
+        end = start
+        while True:
+            newline = LINE_END.search(buffer, end)
+            end = newline.end() if newline else length
+            text = bytes(buffer[start:end]).decode("utf-8", "surrogateescape")
+            matches = list(self.master_pattern.finditer(text))
+            if end == length or not matches or matches[-1].end() < len(text):
+                break
+
+        codes = TOKEN_CODES
+        word_codes = self.word_codes
+        identifier = codes["IDENTIFIER"]
+        char_pos, byte_pos = 0, start
+        for match in matches:
+            kind = match.lastgroup
+            token_start, token_end = match.span(kind)
+            value = match.group(kind)
+            byte_start = byte_pos + len(text[char_pos:token_start].encode("utf-8", "surrogateescape"))
+            byte_pos = byte_start + len(value.encode("utf-8", "surrogateescape"))
+            char_pos = token_end
+            if kind == "WORD":
+                code = word_codes.get(value, identifier)
+            else:
+                code = codes[kind]
+                if kind == "ERROR":
+                    self.diagnostics.append(("Tanımlanamayan karakter", value, (byte_start, byte_pos)))
+            result.append(code, byte_start, byte_pos)
+        return end
+
+    def tokenize_regex(self, text):
+        return list(self.iter_tokens_regex(text))
+
+    def tokenize_loop(self, text):
+        return list(self.iter_tokens_loop(text))
+
+    #derlenmiş tek regex ile tarar, iter_tokens_loop ile birebir aynı token akışını üretir
+    def iter_tokens_regex(self, text, pos=0):
+        word_types = self.word_types
+        diagnostics = self.diagnostics = []
+        for match in self.master_pattern.finditer(text, pos):
+            kind = match.lastgroup
+            start, end = match.span(kind)
+            value = match.group(kind)
+            if kind == "WORD":
+                kind = word_types.get(value, "IDENTIFIER")
+            elif kind == "ERROR":
+                diagnostics.append(("Tanımlanamayan karakter", value, (start, end)))
+            yield Token(kind, value, (start, end))
+
+    #dosya ya da dosya benzeri bir nesneyi parça parça okuyup tokenları tek tek üretir
+    #metnin tamamı ve token listesi bellekte tutulmaz (teşhis listesi hariç), konumlar dosyanın başına göredir
+    #parça sonuna değen token (yarım kalmış string, yorum, isim ya da iki karakterli operatör)
+    #bir sonraki parça okunana kadar bekletilir; bu mod her zaman regex motorunu kullanır
+    def tokenize_stream(self, stream, chunk_size=1 << 16, encoding="utf-8"):
+        word_types = self.word_types
+        diagnostics = self.diagnostics = []
+        pattern = self.master_pattern
+        decoder = None
+        buffer = ""
+        base = 0            #buffer'ın ilk karakterinin dosyadaki konumu
+        eof = False
+
+        while not eof:
+            #bekleyen kısım büyüdükçe daha büyük okunur, böylece uzun tokenlar tekrar tekrar taranmaz
+            chunk = stream.read(max(chunk_size, len(buffer)))
+            eof = not chunk
+            if isinstance(chunk, bytes):
+                #çok baytlı karakterler parça sınırında bölünebilir
+                if decoder is None:
+                    decoder = codecs.getincrementaldecoder(encoding)()
+                chunk = decoder.decode(chunk, final=eof)
+            buffer += chunk
+
+            consumed = 0
+            for match in pattern.finditer(buffer):
+                if not eof and match.end() == len(buffer):
+                    #devamı sonraki parçada olabilir
+                    consumed = match.start()
+                    break
+                consumed = match.end()
+                kind = match.lastgroup
+                start, end = match.span(kind)
+                value = match.group(kind)
+                if kind == "WORD":
+                    kind = word_types.get(value, "IDENTIFIER")
+                elif kind == "ERROR":
+                    diagnostics.append(("Tanımlanamayan karakter", value, (base + start, base + end)))
+                yield Token(kind, value, (base + start, base + end))
+
+            buffer = buffer[consumed:]
+            base += consumed
+
+    #metni karakter karakter okur ve token haline getirir
+    def iter_tokens_loop(self, text, pos=0):
+        diagnostics = self.diagnostics = []
+        i = pos
+        
+        while i < len(text):
+            #bosluklar atlanır
+            if self.is_whitespace(text[i]):
+                i += 1
+                continue
+            
+            #yorum satırı 
+            if text[i] == '#':
+                start = i
+                i += 1
+                while i < len(text) and text[i] != '\n':
+                    i += 1
+                yield Token("COMMENT", text[start:i], (start, i))
+                continue
+
+            #f-stringleri tanımlama
+            if text[i] == 'f' and i + 1 < len(text) and text[i + 1] in ['"', "'"]:
+                start = i
+                i += 1  # f'yi atla
+                quote_type = text[i]
+                i += 1  # tırnağı atla
+                while i < len(text) and text[i] != quote_type:
+                    if text[i] == '\\' and i + 1 < len(text):
+                        i += 2
+                    else:
+                        i += 1
+                if i < len(text):
+                    i += 1
+                yield Token("FSTRING", text[start:i], (start, i))
+                continue
+            
+            #tek tırnaklı string
+            if text[i] == "'":
+                start = i
+                i += 1
+                while i < len(text) and text[i] != "'":
+                    if text[i] == '\\' and i + 1 < len(text):
+                        i += 2
+                    else:
+                        i += 1
+                if i < len(text):
+                    i += 1
+                yield Token("STRING", text[start:i], (start, i))
+                continue
+            
+            #çift tırnaklı string
+            if text[i] == '"':
+                start = i
+                i += 1
+                while i < len(text) and text[i] != '"':
+                    if text[i] == '\\' and i + 1 < len(text):
+                        i += 2
+                    else:
+                        i += 1
+                if i < len(text):
+                    i += 1
+                yield Token("STRING", text[start:i], (start, i))
+                continue
+            
+            #üç tırnaklı string
+            if i < len(text) - 2 and text[i:i+3] in ['"""', "'''"]:
+                quote_type = text[i:i+3]
+                start = i
+                i += 3
+                while i <= len(text) - 3:
+                    if text[i:i+3] == quote_type:
+                        i += 3
+                        break
+                    i += 1
+                yield Token("STRING", text[start:i], (start, i))
+                continue
+            
+            #sayıları tanımlama
+            if self.is_digit(text[i]):
+                start = i
+                has_dot = False
+                while i < len(text) and (self.is_digit(text[i]) or (text[i] == '.' and not has_dot)):
+                    if text[i] == '.':
+                        has_dot = True
+                    i += 1
+                yield Token("NUMBER", text[start:i], (start, i))
+                continue
+            
+            #tanımlayıcılar ve anahtar kelimeleri tanıma
+            if self.is_letter(text[i]):
+                start = i
+                while i < len(text) and self.is_identifier_char(text[i]):
+                    i += 1
+                word = text[start:i]
+                
+                if word in self.keywords:
+                    yield Token("KEYWORD", word, (start, i))
+                elif word in self.builtins:
+                    yield Token("BUILTIN", word, (start, i))
+                else:
+                    yield Token("IDENTIFIER", word, (start, i))
+                continue
+
+            #ayraçları tanıma
+            if text[i] in self.delimiters:
+                yield Token("DELIMITER", text[i], (i, i+1))
+                i += 1
+                continue
+
+            #operatörleri tanımlama
+            found_operator = False
+            for op_length in [2, 1]:
+                if i + op_length <= len(text):
+                    op = text[i:i+op_length]
+                    if op in self.operators:
+                        yield Token("OPERATOR", op, (i, i+op_length))
+                        i += op_length
+                        found_operator = True
+                        break
+            
+            if found_operator:
+                continue
+            
+            #tanımlanamayan karakterler tek bir ERROR tokenında birleştirilir, konsola basılmaz
+            start = i
+            i += 1
+            while i < len(text) and self.is_unknown(text, i):
+                i += 1
+            diagnostics.append(("Tanımlanamayan karakter", text[start:i], (start, i)))
+            yield Token("ERROR", text[start:i], (start, i))
+
+#iki metin arasındaki tek bir düzenlemeyi bulur: (offset, silinen uzunluk, eklenen metin)
+#ortak önek ve sonek bloklar halinde karşılaştırılır, böylece karşılaştırma C hızında yapılır
+def find_edit(old, new, block=4096):
+    limit = min(len(old), len(new))
+
+    prefix = 0
+    while prefix < limit:
+        step = min(block, limit - prefix)
+        if old[prefix:prefix + step] == new[prefix:prefix + step]:
+            prefix += step
+            continue
+        while old[prefix] == new[prefix]:
+            prefix += 1
+        break
+
+    suffix = 0
+    limit -= prefix     #önek ve sonek çakışmamalı
+    while suffix < limit:
+        step = min(block, limit - suffix)
+        if old[len(old) - suffix - step:len(old) - suffix] == new[len(new) - suffix - step:len(new) - suffix]:
+            suffix += step
+            continue
+        while old[len(old) - suffix - 1] == new[len(new) - suffix - 1]:
+            suffix += 1
+        break
+
+    return prefix, len(old) - prefix - suffix, new[prefix:len(new) - suffix]
+
+
+#düzenlemelerden sonra sadece bozulan bölgeyi yeniden tokenize eden lexer
+#tokens listesi ve düzenlemeden sonraki tokenlar yerinde güncellenir
+#her satır başı için bir kontrol noktası tutulur: (satır başı, token indeksi, durum)
+#token indeksi satır başında ya da sonrasında biten ilk tokendir, durum ise satır başı bir
+#tokenın içinde kalıyorsa o tokenın türüdür (çok satırlı STRING/FSTRING), değilse None
+class IncrementalLexer:
+    def __init__(self, lexer):
+        self.lexer = lexer
+        self.text = None
+        self.tokens = []
+        self.checkpoints = []
+        self.line_starts = []
+
+    #tüm metni baştan tokenize eder
+    def reset(self, text):
+        self.text = text
+        self.tokens = list(self.lexer.iter_tokens(text))
+        self.checkpoints = self.build_checkpoints(text, self.tokens, 0, 0, len(text) + 1)
+        self.line_starts = [checkpoint[0] for checkpoint in self.checkpoints]
+        return 0, 0, len(self.tokens), 0, len(text)
+
+    #güncel durumun önbellekte saklanabilir kopyası: (metin, (tür, değer, konum) listesi, kontrol noktaları)
+    #token ve kontrol noktası listeleri düzenlemelerde yerinde güncellendiği için paylaşılmaz, kopyalanır
+    def snapshot(self):
+        return self.text, [(token.type, token.value, token.position) for token in self.tokens], list(self.checkpoints)
+
+    #snapshot'taki duruma döner, metin yeniden tokenize edilmez; dönüş reset ile aynıdır
+    def restore(self, snapshot):
+        text, fields, checkpoints = snapshot
+        self.text = text
+        self.tokens = [Token(type, value, position) for type, value, position in fields]
+        self.checkpoints = list(checkpoints)
+        self.line_starts = [checkpoint[0] for checkpoint in checkpoints]
+        return 0, 0, len(self.tokens), 0, len(text)
+
+    #yeni metni eskisiyle karşılaştırıp düzenlemeyi uygular
+    def update(self, text):
+        if self.text is None:
+            return self.reset(text)
+        offset, deleted, inserted = find_edit(self.text, text)
+        return self.apply_edit(offset, deleted, inserted)
+
+    #offset konumundan sonra biten ilk tokenın indeksi, aramaya satırın kontrol noktasından başlanır
+    def token_index(self, offset):
+        line = bisect_right(self.line_starts, offset) - 1
+        index = self.checkpoints[line][1]
+        while index < len(self.tokens) and self.tokens[index].position[1] <= offset:
+            index += 1
+        return index
+
+    #[start, stop) aralığındaki satır başları için kontrol noktalarını üretir
+    #first_token, start konumunda ya da sonrasında biten ilk tokenın indeksidir
+    def build_checkpoints(self, text, tokens, start, first_token, stop):
+        checkpoints = []
+        index = first_token
+        line_start = start
+        if start > 0 and text[start - 1] != "\n":
+            line_start = text.find("\n", start) + 1 or len(text) + 1
+        while line_start < stop and line_start <= len(text):
+            while index < len(tokens) and tokens[index].position[1] < line_start:
+                index += 1
+            state = None
+            if index < len(tokens) and tokens[index].position[0] < line_start:
+                state = tokens[index].type
+            checkpoints.append((line_start, index, state))
+            line_start = text.find("\n", line_start) + 1 or len(text) + 1
+        return checkpoints
+
+    #offset konumunda deleted karakter silinip yerine inserted eklenmiş gibi tokenları günceller
+    #dönüş: (ilk, eski_son, yeni_son, başlangıç, bitiş) -> tokens[ilk:yeni_son] eski tokens[ilk:eski_son]
+    #yerine geldi ve metnin [başlangıç, bitiş) aralığı yeniden tokenize edildi
+    def apply_edit(self, offset, deleted, inserted):
+        old_text, old_tokens, old_checkpoints = self.text, self.tokens, self.checkpoints
+        text = old_text[:offset] + inserted + old_text[offset + deleted:]
+        delta = len(inserted) - deleted
+
+        #düzenlemenin yapıldığı satırın kontrol noktasından başla
+        line = bisect_right(self.line_starts, offset) - 1
+        line_start, first, state = old_checkpoints[line]
+        restart = old_tokens[first].position[0] if state else line_start
+
+        #eski tokenlarla tekrar hizalanana kadar yeniden tokenize et
+        new_tokens = []
+        damage_end = offset + len(inserted)
+        old_index = first
+        synced = False
+        for token in self.lexer.iter_tokens(text, restart):
+            start = token.position[0]
+            if start >= damage_end:
+                old_start = start - delta
+                while old_index < len(old_tokens) and old_tokens[old_index].position[0] < old_start:
+                    old_index += 1
+                if old_index < len(old_tokens) and old_tokens[old_index].position[0] == old_start:
+                    synced = True
+                    break
+            new_tokens.append(token)
+
+        #sonraki tokenlar kaydırılmış konumlarıyla yeni Token'larla değiştirilir, liste yerinde güncellenir
+        #Token nesneleri hiç değiştirilmez: arka plan parse'ı listenin eski bir kopyasını okurken bile
+        #gördüğü tokenlar o kopyanın metnine aittir
+        if synced:
+            end = old_tokens[old_index].position[0] + delta
+            if delta:
+                for index in range(old_index, len(old_tokens)):
+                    token = old_tokens[index]
+                    start, stop = token.position
+                    old_tokens[index] = Token(token.type, token.value, (start + delta, stop + delta))
+        else:
+            old_index = len(old_tokens)
+            end = len(text)
+        old_tokens[first:old_index] = new_tokens
+        new_stop = first + len(new_tokens)
+
+        #kontrol noktaları: öncekiler aynı kalır, bozulan bölge yeniden hesaplanır, sonrakiler kaydırılır
+        #listeler yerinde güncellenir, sona ekleme (dosya yükleme) düzenlemeden önceki satırları hiç dolaşmaz
+        keep = bisect_left(self.line_starts, restart)
+        checkpoints = self.build_checkpoints(text, old_tokens, restart, first, end + 1 if synced else len(text) + 1)
+        if synced:
+            token_delta = new_stop - old_index
+            tail = bisect_right(self.line_starts, end - delta)
+            checkpoints += [(start + delta, index + token_delta, state)
+                            for start, index, state in old_checkpoints[tail:]]
+        self.text = text
+        old_checkpoints[keep:] = checkpoints
+        self.line_starts[keep:] = [checkpoint[0] for checkpoint in checkpoints]
+        return first, old_index, new_stop, restart, end
@@ -0,0 +1,120 @@
+from bisect import bisect_right
+
+#numpy varsa satır başları vektörel olarak bulunur, yoksa str.find ile
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#bu boyuttan küçük metinlerde numpy'ye dönüştürme maliyeti kazançtan fazla
+NUMPY_MIN_LENGTH = 1 << 14
+
+
+#metindeki satır başlarının karakter konumlarını döndürür (ilk satır 0)
+def find_line_starts(text):
+    if numpy is not None and len(text) >= NUMPY_MIN_LENGTH:
+        if text.isascii():
+            codes = numpy.frombuffer(text.encode("ascii"), dtype=numpy.uint8)
+        else:
+            codes = numpy.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=numpy.uint32)
+        return [0] + (numpy.flatnonzero(codes == 10) + 1).tolist()
+
+    starts = [0]
+    append = starts.append
+    find = text.find
+    index = find("\n")
+    while index >= 0:
+        append(index + 1)
+        index = find("\n", index + 1)
+    return starts
+
+
+#karakter konumlarını (satır, sütun) bilgisine ve tk indekslerine çeviren satır başı indeksi
+#satırlar tk gibi 1'den, sütunlar 0'dan başlar; metin bir kere taranır, her sorgu bisect ile yapılır
+class LineIndex:
+    def __init__(self, text=None, line_starts=None):
+        if line_starts is None:
+            line_starts = find_line_starts(text or "")
+        self.line_starts = line_starts
+
+    def line_count(self):
+        return len(self.line_starts)
+
+    #karakter konumu -> (satır, sütun)
+    def position(self, offset):
+        line = bisect_right(self.line_starts, offset)
+        return line, offset - self.line_starts[line - 1]
+
+    #karakter konumu -> "satır.sütun" (tk text indeksi)
+    def tk_index(self, offset):
+        line = bisect_right(self.line_starts, offset)
+        return f"{line}.{offset - self.line_starts[line - 1]}"
+
+    #(satır, sütun) -> karakter konumu
+    def offset(self, line, column):
+        return self.line_starts[line - 1] + column
+
+    #birçok konumu tek seferde çevirir, numpy varsa searchsorted ile
+    def positions(self, offsets):
+        if numpy is not None and len(offsets) >= NUMPY_MIN_LENGTH:
+            starts = numpy.asarray(self.line_starts)
+            offsets = numpy.asarray(offsets)
+            lines = numpy.searchsorted(starts, offsets, side="right")
+            columns = offsets - starts[lines - 1]
+            return list(zip(lines.tolist(), columns.tolist()))
+        return [self.position(offset) for offset in offsets]
+
+
+#utf-8 devam baytları (0b10xxxxxx), her karakterin ilk baytı dışındaki baytlar
+CONTINUATION_BYTES = bytes(range(0x80, 0xC0))
+
+
+#utf-8 tampondaki bayt sayısından o kısımdaki devam baytları çıkarılınca karakter sayısı kalır
+def count_continuation(data):
+    return len(data) - len(data.translate(None, CONTINUATION_BYTES))
+
+
+#utf-8 tampondaki (bytes, mmap ya da memoryview) bayt konumlarını karakter konumlarına çevirir
+#tampon çözülmez; her BLOCK baytlık bloğun başına kadarki devam baytı sayısı ilk sorguda bir kere
+#hesaplanır, tek sorgu en fazla bir blok tarar. Tamamen ascii tamponlarda konumlar aynen döner
+class Utf8Offsets:
+    BLOCK = 1 << 12
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.block_counts = None
+
+    def build(self):
+        buffer, block = self.buffer, self.BLOCK
+        counts = [0]
+        total = 0
+        for block_start in range(0, len(buffer), block):
+            total += count_continuation(bytes(buffer[block_start:block_start + block]))
+            counts.append(total)
+        self.block_counts = counts
+
+    #bayt konumu -> karakter konumu
+    def char_offset(self, offset):
+        if self.block_counts is None:
+            self.build()
+        if not self.block_counts[-1]:
+            return offset
+        block = offset // self.BLOCK
+        block_start = block * self.BLOCK
+        skipped = self.block_counts[block] + count_continuation(bytes(self.buffer[block_start:offset]))
+        return offset - skipped
+
+    #sıralı bayt konumlarını tek geçişte çevirir (token başlangıçları ya da bitişleri için)
+    def char_offsets(self, offsets):
+        if self.block_counts is None:
+            self.build()
+        if not self.block_counts[-1]:
+            return list(offsets)
+        buffer = self.buffer
+        result = []
+        previous = skipped = 0
+        for offset in offsets:
+            skipped += count_continuation(bytes(buffer[previous:offset]))
+            previous = offset
+            result.append(offset - skipped)
+        return result
@@ -0,0 +1,200 @@
+import codecs
+import gc
+import io
+import mmap
+import os
+import tempfile
+import time
+
+#büyük dosyaları tk döngüsünü kilitlemeden Text widget'a parça parça yükleyen yükleyici ve dosya kaydetme
+#dosya mmap üzerinden okunur ve artımlı olarak çözülür (utf-8, BOM atlanır, \r\n ve \r satır sonları \n olur),
+#her tick'te budget saniyeyi doldurana kadar parça eklenir ve sıra tk'ye bırakılır. İlk parça hemen eklenir,
+#böylece dosyanın başı ilk tick'te görünür. Yükleme sırasında widget salt okunurdur (kaydırılabilir) ve
+#highlighter durdurulur: her eklenen parça incremental lexer'a bir düzenleme olarak uygulanıp sadece görünen
+#satırlar renklendirilir, parse yükleme bitince bir kere (arka plan modunda işçi thread'de) yapılır
+#tüm metin alınmaz ve kopyası tutulmaz: parça başına tokenize ve renklendirme parçanın boyutu kadardır, dosya
+#boyutuyla büyüyen tek iş incremental lexer'ın metni yeni str'ye kopyalamasıdır (10 MB'ta parça başına ~1 ms)
+
+#bir seferde okunup widget'a eklenen bayt sayısı
+CHUNK_SIZE = 1 << 15
+
+
+#(metin, okunan bayt, toplam bayt) parçaları; son parça çözücüde bekleyen karakterleri de içerir
+def read_chunks(path, chunk_size=CHUNK_SIZE):
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8-sig")(), translate=True)
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        #boş dosya mmap ile açılamaz
+        if size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for start in range(0, size, chunk_size):
+                end = min(start + chunk_size, size)
+                yield decoder.decode(data[start:end], final=end == size), end, size
+
+
+#dosyanın ilk gördüğü satır sonu ("\n", "\r\n" ya da "\r"), kaydederken aynısı kullanılır
+def detect_newline(path, limit=CHUNK_SIZE):
+    with open(path, "rb") as file:
+        head = file.read(limit)
+    index = head.find(b"\n")
+    carriage = head.find(b"\r")
+    if carriage >= 0 and (index < 0 or carriage < index):
+        return "\r\n" if head[carriage + 1:carriage + 2] == b"\n" else "\r"
+    return "\n"
+
+
+#metni yanına yazılan geçici dosya üzerinden kaydeder, yarıda kalan yazma eski dosyayı bozmaz
+def save_text(path, text, newline="\n"):
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=".kaydediliyor-", suffix=".tmp")
+    try:
+        with open(descriptor, "w", encoding="utf-8", newline=newline) as file:
+            file.write(text)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+class FileLoader:
+    #highlighter (SyntaxHighlighter) verilirse yükleme sırasında durdurulur ve parçalar renklendirilir
+    #progress(okunan bayt, toplam bayt) her tick'ten sonra, done(hata) yükleme bitince ya da bir okuma
+    #hatasıyla durunca çağrılır (başarılıysa hata None)
+    #interval tick'ler arasında tk'ye bırakılan süre (ms), budget bir tick'in en fazla süresi (saniye)
+    def __init__(self, text_widget, highlighter=None, progress=None, done=None, chunk_size=CHUNK_SIZE,
+                 interval=1, budget=0.02):
+        self.text = text_widget
+        self.highlighter = highlighter
+        self.progress = progress
+        self.done = done
+        self.chunk_size = chunk_size
+        self.interval = interval
+        self.budget = budget
+        #açık dosyanın yolu ve satır sonu (kaydetmek için)
+        self.path = None
+        self.newline = "\n"
+        self.chunks = None
+        self.job = None
+        #yükleme sırasında çöp toplayıcı donduruldu mu (bkz. freeze)
+        self.frozen = False
+        #widget'a eklenmiş karakter sayısı
+        self.length = 0
+        self.loaded = 0
+        self.size = 0
+
+    @property
+    def loading(self):
+        return self.chunks is not None
+
+    #dosyayı açar, widget'ı boşaltır ve ilk tick'i hemen çalıştırır
+    #açma hataları (dosya yok, izin) satır sonu okunurken buradan yükselir, önceki metin değişmez
+    def load(self, path):
+        newline = detect_newline(path)
+        self.stop()
+        self.path, self.newline = path, newline
+        self.chunks = read_chunks(path, self.chunk_size)
+        self.length = 0
+        self.loaded = self.size = 0
+        if self.highlighter is not None:
+            self.highlighter.suspend()
+        self.text.config(state="normal")
+        self.text.delete("1.0", "end")
+        self.text.config(state="disabled")
+        self.tick()
+
+    #yarıda kalan yüklemeyi bırakır, eklenmiş kısım widget'ta kalır ve düzenlenebilir
+    def cancel(self):
+        if self.loading:
+            self.stop()
+            self.finish()
+
+    def stop(self):
+        if self.job is not None:
+            self.text.after_cancel(self.job)
+            self.job = None
+        if self.chunks is not None:
+            self.chunks.close()
+            self.chunks = None
+        self.thaw()
+
+    #yüklenen nesneler (tokenlar) tick'ler arasında çöp toplayıcının kalıcı nesline alınır: yoksa tam toplama
+    #turları yükleme boyunca büyüyen token listesini tekrar tekrar dolaşır ve kesinti dosya boyutuyla uzar
+    #gc durumu süreç geneli olduğu için sadece süren bir yüklemede yapılır (highlighter durdurulmuş, arka
+    #plan parse'ı iptal edilmiştir) ve yükleme nasıl biterse bitsin (finish, cancel, yeni load, hata) thaw ile
+    #geri alınır
+    def freeze(self):
+        gc.freeze()
+        self.frozen = True
+
+    def thaw(self):
+        if self.frozen:
+            self.frozen = False
+            gc.unfreeze()
+
+    #budget dolana kadar parça okuyup ekler, kalan varsa sonraki tick'i zamanlar
+    def tick(self):
+        self.job = None
+        deadline = time.perf_counter() + self.budget
+        error = None
+        try:
+            for chunk, self.loaded, self.size in self.chunks:
+                self.append(chunk)
+                if time.perf_counter() >= deadline:
+                    break
+            else:
+                self.chunks = None
+        except (OSError, UnicodeDecodeError) as e:
+            self.stop()
+            error = e
+        except BaseException:
+            #beklenmeyen hata: yükleme bırakılır, gc de eski haline döner
+            self.stop()
+            raise
+        if self.chunks is not None:
+            self.freeze()
+        self.text.event_generate("<<Change>>")
+        if self.progress is not None:
+            self.progress(self.loaded, self.size)
+        if self.chunks is None:
+            self.finish(error)
+        else:
+            self.job = self.text.after(self.interval, self.tick)
+
+    #parçayı widget'ın sonuna ekler; highlighter widget'ın kaydettiği ekleme düzenlemesini artımlı uygular,
+    #sadece eklenen kısım tokenize edilir ve görünen satırlar renklendirilir. Tüm metin hiç alınmaz ve
+    #karşılaştırılmaz
+    #Satır numaraları tick sonunda <<Change>> ile güncellenir
+    def append(self, chunk):
+        first = not self.length
+        if self.highlighter is None:
+            self.insert(chunk)
+        else:
+            profiler = self.highlighter.profiler
+            with profiler.run("load"):
+                with profiler.stage("load"):
+                    self.insert(chunk)
+                self.highlighter.highlight()
+                profiler.set("loaded_bytes", self.loaded)
+        #imleç sona eklenen metinle birlikte kaymasın, dosyanın başında kalsın
+        if first:
+            self.text.mark_set("insert", "1.0")
+
+    def insert(self, chunk):
+        self.text.config(state="normal")
+        self.text.insert("end-1c", chunk)
+        self.text.config(state="disabled")
+        self.length += len(chunk)
+
+    #widget düzenlemeye açılır, highlighter sürdürülür (parse burada bir kere yapılır)
+    #okuma hatasıyla durduysa dosya yarımdır, üzerine kaydedilmemesi için yol unutulur
+    def finish(self, error=None):
+        self.chunks = None
+        if error is not None:
+            self.path = None
+        self.text.config(state="normal")
+        self.thaw()
+        if self.highlighter is not None:
+            self.highlighter.resume()
+        if self.done is not None:
+            self.done(error)
@@ -1,162 +1,302 @@
-from highlighter import CustomText, LineNumbers, SyntaxHighlighter
-from lexer import Lexer
-import tkinter as tk
-        
-def main():
-    #dark mode renk paleti
-    DARK_BG = "#2d2d2d"
-    DARK_FG = "#e0e0e0"
-    DARK_TEXT_BG = "#3d3d3d"
-    DARK_SELECTION = "#4d4d4d"
-    DARK_LINE_NUMBERS = "#5d5d5d"
-    DARK_RESULT_BG = "#252525"
-
-    #tk pencere oluşturma
-    root = tk.Tk()
-    root.title("Python Syntax Highlighter - Anlık Parse Sonucu")
-    root.geometry("1200x800")
-    root.configure(bg=DARK_BG)
-
-    #ana frame
-    main_frame = tk.Frame(root, bg=DARK_BG)
-    main_frame.pack(fill="both", expand=True, padx=10, pady=10)
-
-    #kodun yazıldığı üst kısım
-    editor_frame = tk.Frame(main_frame, bg=DARK_BG)
-    editor_frame.pack(fill="both", expand=True)
-
-    #satır numaraları
-    line_numbers = LineNumbers(
-        editor_frame, 
-        None,  
-        bg=DARK_LINE_NUMBERS,
-        fg=DARK_FG
-    )
-    line_numbers.pack(side="left", fill="y")
-
-    #text widget ve scrollbar için frame
-    text_frame = tk.Frame(editor_frame, bg=DARK_BG)
-    text_frame.pack(side="right", fill="both", expand=True)
-    
-    #text widget için scrollbar
-    text_scrollbar = tk.Scrollbar(text_frame)
-    text_scrollbar.pack(side="right", fill="y")
-
-    #text widget
-    text = CustomText(
-        text_frame, 
-        width=80, 
-        height=20, 
-        font=("Consolas", 12), 
-        wrap="none",
-        bg=DARK_TEXT_BG,
-        fg=DARK_FG,
-        insertbackground=DARK_FG,
-        selectbackground=DARK_SELECTION,
-        yscrollcommand=lambda *args: on_scroll(*args)
-    )
-    text.pack(side="left", fill="both", expand=True)
-    
-    #simdi line_numbersa text widgetini ata
-    line_numbers.text_widget = text
-    
-    #scroll fonksiyonu - hem text hem line_numbers
-    def on_scroll(*args):
-        text_scrollbar.set(*args)
-        line_numbers.yview_moveto(args[0])
-    
-    #scrollbari text widget ile bağla ve line_numbersi de scroll et
-    def on_scrollbar(*args):
-        text.yview(*args)
-        line_numbers.yview(*args)
-    
-    text_scrollbar.config(command=on_scrollbar)
-
-    #parse sonucu gösterme alt kısım
-    result_label = tk.Label(
-        main_frame, 
-        text="Parse Sonucu:", 
-        font=("Arial", 12, "bold"),
-        bg=DARK_BG,
-        fg=DARK_FG
-    )
-    result_label.pack(anchor="w", pady=(10, 5))
-
-    #parse result için frame
-    result_frame = tk.Frame(main_frame, bg=DARK_BG)
-    result_frame.pack(fill="both", expand=True)
-    
-    #parse result için scrollbar
-    result_scrollbar = tk.Scrollbar(result_frame)
-    result_scrollbar.pack(side="right", fill="y")
-
-    #parse result text widget
-    parse_result = tk.Text(
-        result_frame, 
-        height=15, 
-        width=80, 
-        font=("Consolas", 10), 
-        wrap="word", 
-        state='disabled', 
-        bg=DARK_RESULT_BG,
-        fg=DARK_FG,
-        insertbackground=DARK_FG,
-        selectbackground=DARK_SELECTION,
-        yscrollcommand=result_scrollbar.set
-    )
-    parse_result.pack(side="left", fill="both", expand=True)
-    result_scrollbar.config(command=parse_result.yview)
-
-    #lexer ve highlighter oluşturma
-    lexer = Lexer()
-    highlighter = SyntaxHighlighter(text, lexer, parse_result, dark_mode=True)
-
-    #satır numaralarının güncellenmesi için
-    def on_text_change(event=None):
-        line_numbers.update_line_numbers()
-    
-    text.bind("<<Change>>", on_text_change)
-
-    #frame açılınca örnek kod
-    sample_code = '''# Python Syntax Highlighter Example
-def calculate_fibonacci(n):
-    """Calculate nth Fibonacci number"""
-    if n <= 1:
-        return n
-    else:
-        return calculate_fibonacci(n-1) + calculate_fibonacci(n-2)
-
-# Test the function
-numbers = [0, 1, 2, 3, 5, 8, 13]
-for num in numbers:
-    result = calculate_fibonacci(num)
-    print(f"Fibonacci({num}) = {result}")
-
-class Person:
-    def __init__(self, name, age):
-        self.name = name
-        self.age = age
-    
-    def greet(self):
-        return f"Hello, I'm {self.name} and I'm {self.age} years old!"
-
-# Create person instance
-person = Person("Alice", 25)
-message = person.greet()
-print(message)
-
-# Number examples
-integer = 42
-floating = 3.14159
-'''
-    
-    text.insert("1.0", sample_code)
-    highlighter.highlight(sample_code)
-    highlighter.update_parse_result(sample_code)
-    line_numbers.update_line_numbers()
-
-    root.mainloop()
-
-#maini başlat
-if __name__ == "__main__":
+from astview import ASTView
+from highlighter import CustomText, LineNumberCanvas, ProfileBar, SyntaxHighlighter
+from lexer import Lexer
+from loader import FileLoader, save_text
+from profiling import Profiler
+from symbols import OutlineView
+import batch
+import os
+import sys
+import tkinter as tk
+from tkinter import filedialog, messagebox, ttk
+        
+def main():
+    #"python main.py --batch dizin ..." GUI açmadan batch.py komut satırı modunu çalıştırır
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        batch.main(sys.argv[2:])
+        return
+
+    #dark mode renk paleti
+    DARK_BG = "#2d2d2d"
+    DARK_FG = "#e0e0e0"
+    DARK_TEXT_BG = "#3d3d3d"
+    DARK_SELECTION = "#4d4d4d"
+    DARK_LINE_NUMBERS = "#5d5d5d"
+    DARK_RESULT_BG = "#252525"
+
+    #tk pencere oluşturma
+    root = tk.Tk()
+    root.title("Python Syntax Highlighter - Anlık Parse Sonucu")
+    root.geometry("1200x800")
+    root.configure(bg=DARK_BG)
+
+    #ana frame
+    main_frame = tk.Frame(root, bg=DARK_BG)
+    main_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+    #AST ve anahat ağaçları için koyu tema
+    style = ttk.Style()
+    style.configure("AST.Treeview", background=DARK_RESULT_BG, fieldbackground=DARK_RESULT_BG,
+                    foreground=DARK_FG, font=("Consolas", 10))
+
+    #kodun yazıldığı üst kısım
+    editor_frame = tk.Frame(main_frame, bg=DARK_BG)
+    editor_frame.pack(fill="both", expand=True)
+
+    #analiz aşamalarının süreleri ve sayaçları (alttaki durum çubuğunda gösterilir)
+    profiler = Profiler()
+
+    #satır numaraları (sadece görünen satırlar çizilir)
+    line_numbers = LineNumberCanvas(
+        editor_frame, 
+        None,  
+        bg=DARK_LINE_NUMBERS,
+        fg=DARK_FG,
+        profiler=profiler
+    )
+    line_numbers.pack(side="left", fill="y")
+
+    #sağda tanımların anahattı (class, def, atama), seçilen tanıma gidilir
+    outline_tree = ttk.Treeview(editor_frame, show="tree", style="AST.Treeview")
+    outline_tree.column("#0", width=220)
+    outline_tree.pack(side="right", fill="y")
+
+    def select_definition(start, end):
+        text.tag_remove("sel", "1.0", "end")
+        text.tag_add("sel", f"1.0 + {start} chars", f"1.0 + {end} chars")
+        text.mark_set("insert", f"1.0 + {start} chars")
+        text.see("insert")
+        text.focus_set()
+
+    outline_view = OutlineView(outline_tree, select_definition)
+
+    #text widget ve scrollbar için frame
+    text_frame = tk.Frame(editor_frame, bg=DARK_BG)
+    text_frame.pack(side="right", fill="both", expand=True)
+    
+    #text widget için scrollbar
+    text_scrollbar = tk.Scrollbar(text_frame)
+    text_scrollbar.pack(side="right", fill="y")
+
+    #text widget
+    text = CustomText(
+        text_frame, 
+        width=80, 
+        height=20, 
+        font=("Consolas", 12), 
+        wrap="none",
+        bg=DARK_TEXT_BG,
+        fg=DARK_FG,
+        insertbackground=DARK_FG,
+        selectbackground=DARK_SELECTION,
+        yscrollcommand=lambda *args: on_scroll(*args)
+    )
+    text.pack(side="left", fill="both", expand=True)
+    
+    #simdi line_numbersa text widgetini ata (<<Change>> ile kendisi güncellenir)
+    line_numbers.attach(text)
+    
+    #scroll fonksiyonu - hem text hem line_numbers
+    def on_scroll(*args):
+        text_scrollbar.set(*args)
+        line_numbers.yview_moveto(args[0])
+        #yeni görünen satırları renklendir
+        highlighter.on_scroll()
+    
+    #scrollbari text widget ile bağla ve line_numbersi de scroll et
+    def on_scrollbar(*args):
+        text.yview(*args)
+        line_numbers.yview(*args)
+    
+    text_scrollbar.config(command=on_scrollbar)
+
+    #parse sonucu gösterme alt kısım
+    result_label = tk.Label(
+        main_frame, 
+        text="Parse Sonucu:", 
+        font=("Arial", 12, "bold"),
+        bg=DARK_BG,
+        fg=DARK_FG
+    )
+    result_label.pack(anchor="w", pady=(10, 5))
+
+    #parse result için frame
+    result_frame = tk.Frame(main_frame, bg=DARK_BG)
+    result_frame.pack(fill="both", expand=True)
+    
+    #parse result için scrollbar
+    result_scrollbar = tk.Scrollbar(result_frame)
+    result_scrollbar.pack(side="right", fill="y")
+
+    #parse durumu (başarılı/hatalar) için küçük text widget
+    parse_result = tk.Text(
+        result_frame, 
+        height=4, 
+        width=40, 
+        font=("Consolas", 10), 
+        wrap="word", 
+        state='disabled', 
+        bg=DARK_RESULT_BG,
+        fg=DARK_FG,
+        insertbackground=DARK_FG,
+        selectbackground=DARK_SELECTION
+    )
+    parse_result.pack(side="left", fill="y")
+
+    #AST ağaç görünümü, alt düğümler açıldıkça oluşturulur
+    ast_tree = ttk.Treeview(result_frame, show="tree", style="AST.Treeview",
+                            yscrollcommand=result_scrollbar.set)
+    ast_tree.pack(side="left", fill="both", expand=True)
+    result_scrollbar.config(command=ast_tree.yview)
+    ast_view = ASTView(ast_tree)
+
+    #tüm AST'yi girintili metin olarak dosyaya yazar
+    def export_ast():
+        path = filedialog.asksaveasfilename(defaultextension=".txt", title="AST'yi Kaydet")
+        if path:
+            with open(path, "w", encoding="utf-8") as file:
+                ast_view.export(file)
+
+    #durum çubuğu: son analizin aşama süreleri ve sayaçları, yanında iz dosyası ve AST kaydetme
+    status_frame = tk.Frame(main_frame, bg=DARK_BG)
+    status_frame.pack(fill="x", pady=(5, 0))
+
+    #chrome://tracing, Perfetto ya da speedscope ile açılabilen Chrome trace JSON dosyası
+    def export_trace():
+        path = filedialog.asksaveasfilename(defaultextension=".json", title="İz Dosyasını Kaydet",
+                                            filetypes=[("Chrome trace", "*.json")])
+        if path:
+            profiler.save_trace(path)
+
+    export_button = tk.Button(status_frame, text="AST'yi Kaydet", command=export_ast,
+                              bg=DARK_BG, fg=DARK_FG)
+    export_button.pack(side="right")
+    trace_button = tk.Button(status_frame, text="İzi Kaydet", command=export_trace,
+                             bg=DARK_BG, fg=DARK_FG)
+    trace_button.pack(side="right", padx=(0, 5))
+    profile_bar = ProfileBar(status_frame, profiler, font=("Consolas", 9), bg=DARK_BG, fg=DARK_FG)
+    profile_bar.pack(side="left", fill="x", expand=True)
+
+    #lexer ve highlighter oluşturma
+    lexer = Lexer()
+    #büyük dosyalarda sadece görünen satırlar renklendirilir, parse arka planda yapılır
+    highlighter = SyntaxHighlighter(text, lexer, parse_result, dark_mode=True, viewport=True, ast_view=ast_view,
+                                    outline_view=outline_view, background=True, profiler=profiler)
+
+    #dosya açma: büyük dosyalar parça parça yüklenir, ilerleme çubuğu sadece yüklenirken görünür
+    progress_bar = ttk.Progressbar(status_frame, length=160, maximum=100)
+
+    def update_title():
+        name = os.path.basename(loader.path) if loader.path else "Adsız"
+        root.title(f"{name} - Python Syntax Highlighter")
+
+    def show_progress(loaded, size):
+        if not progress_bar.winfo_ismapped():
+            progress_bar.pack(side="right", padx=(0, 5))
+        progress_bar["value"] = loaded / size * 100 if size else 100
+
+    def loading_done(error):
+        progress_bar.pack_forget()
+        update_title()
+        if error is not None:
+            messagebox.showerror("Dosya Okunamadı", f"Dosyanın sadece bir kısmı yüklendi:\n{error}")
+
+    loader = FileLoader(text, highlighter, show_progress, loading_done)
+
+    def open_path(path):
+        try:
+            loader.load(path)
+        except OSError as e:
+            messagebox.showerror("Dosya Açılamadı", str(e))
+
+    #"break": Text'in kendi Ctrl+O (satır açma) bağlantısı çalışmasın
+    def open_file(event=None):
+        path = filedialog.askopenfilename(title="Dosya Aç",
+                                          filetypes=[("Python", "*.py"), ("Tüm dosyalar", "*.*")])
+        if path:
+            open_path(path)
+        return "break"
+
+    #dosya, açılırkenki satır sonlarıyla kaydedilir; yüklenirken metin yarım olduğu için kaydedilmez
+    def save_file(event=None):
+        if loader.loading:
+            return "break"
+        if loader.path is None:
+            return save_file_as()
+        try:
+            save_text(loader.path, text.get("1.0", "end-1c"), loader.newline)
+        except OSError as e:
+            messagebox.showerror("Kaydedilemedi", str(e))
+        return "break"
+
+    def save_file_as(event=None):
+        if loader.loading:
+            return "break"
+        path = filedialog.asksaveasfilename(defaultextension=".py", title="Farklı Kaydet",
+                                            filetypes=[("Python", "*.py"), ("Tüm dosyalar", "*.*")])
+        if path:
+            loader.path = path
+            save_file()
+            update_title()
+        return "break"
+
+    menu_bar = tk.Menu(root)
+    file_menu = tk.Menu(menu_bar, tearoff=0)
+    file_menu.add_command(label="Aç...", accelerator="Ctrl+O", command=open_file)
+    file_menu.add_command(label="Kaydet", accelerator="Ctrl+S", command=save_file)
+    file_menu.add_command(label="Farklı Kaydet...", accelerator="Ctrl+Shift+S", command=save_file_as)
+    menu_bar.add_cascade(label="Dosya", menu=file_menu)
+    root.config(menu=menu_bar)
+    for widget in (root, text):
+        widget.bind("<Control-o>", open_file)
+        widget.bind("<Control-s>", save_file)
+        widget.bind("<Control-S>", save_file_as)
+
+    #frame açılınca örnek kod
+    sample_code = '''# Python Syntax Highlighter Example
+def calculate_fibonacci(n):
+    """Calculate nth Fibonacci number"""
+    if n <= 1:
+        return n
+    else:
+        return calculate_fibonacci(n-1) + calculate_fibonacci(n-2)
+
+# Test the function
+numbers = [0, 1, 2, 3, 5, 8, 13]
+for num in numbers:
+    result = calculate_fibonacci(num)
+    print(f"Fibonacci({num}) = {result}")
+
+class Person:
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+    
+    def greet(self):
+        return f"Hello, I'm {self.name} and I'm {self.age} years old!"
+
+# Create person instance
+person = Person("Alice", 25)
+message = person.greet()
+print(message)
+
+# Number examples
+integer = 42
+floating = 3.14159
+'''
+    
+    #"python main.py dosya.py" örnek kod yerine dosyayı açar
+    if len(sys.argv) > 1:
+        open_path(sys.argv[1])
+    else:
+        text.insert("1.0", sample_code)
+        highlighter.highlight(sample_code)
+        highlighter.update_parse_result(sample_code)
+        line_numbers.update_line_numbers()
+
+    root.mainloop()
+    highlighter.scheduler.shutdown()
+
+#maini başlat
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,415 +1,776 @@
-class Parser:
-    #tokenları alır ve pos ile takip eder
-    def __init__(self, tokens):
-        self.tokens = tokens
-        self.pos = 0
-        self.current_token = self.tokens[self.pos] if self.tokens else None
-
-    #bir sonraki tokene gecmeyi saglar
-    def advance(self):
-        self.pos += 1
-        if self.pos < len(self.tokens):
-            self.current_token = self.tokens[self.pos]
-        else:
-            self.current_token = None
-
-    #gelecek tokene bakmayı saglar
-    def peek(self, offset=1):
-        peek_pos = self.pos + offset
-        if peek_pos < len(self.tokens):
-            return self.tokens[peek_pos]
-        return None
-
-    #satır numara takibi
-    def get_line_number(self):
-        if self.current_token is None:
-            return "EOF"
-        return f"pos:{self.pos}"
-
-    #sıradaki tokenin type ve valuesine bakar uygunluk durumuna gore error uretir ya da advance ile ilerler
-    def expect(self, type_, value=None):
-        if self.current_token is None:
-            raise SyntaxError(f"Beklenmeyen giriş sonu (beklenen: {type_})")
-        if self.current_token.type != type_:
-            raise SyntaxError(f"{self.get_line_number()} satırı: Beklenen tür '{type_}', ancak '{self.current_token.type}' bulundu ('{self.current_token.value}')")
-        if value is not None and self.current_token.value != value:
-            raise SyntaxError(f"{self.get_line_number()} satırı: Beklenen değer '{value}', ancak '{self.current_token.value}' bulundu")
-        self.advance()
-
-    def parse(self):
-        return self.parse_program()
-
-    #tum satırları sırayla işleyen fonk.
-    def parse_program(self):
-        statements = []
-        while self.current_token is not None:
-            stmt = self.parse_statement()
-            statements.append(stmt)
-        return ("PROGRAM", statements)
-
-    #tokenları ilgili fonksiyona yonlendirme ve tanımlama işlemini yapar
-    def parse_statement(self):
-        #yorum satırlarını atla
-        if self.current_token.type == "COMMENT":
-            comment_value = self.current_token.value
-            self.advance()
-            return ("COMMENT", comment_value)
-            
-        if self.current_token.type == "KEYWORD":
-            if self.current_token.value == "if":
-                return self.parse_if_stmt()
-            elif self.current_token.value == "while":
-                return self.parse_while_stmt()
-            elif self.current_token.value == "for":  
-                return self.parse_for_stmt()
-            elif self.current_token.value == "def":
-                return self.parse_func_def()
-            elif self.current_token.value == "return":
-                return self.parse_return_stmt()
-            elif self.current_token.value == "print":
-                return self.parse_print_stmt()
-            elif self.current_token.value == "class":
-                return self.parse_class_def()
-            elif self.current_token.value == "elif":
-                return self.parse_if_stmt()
-            #hata almamak için tanımlamalar, bosta kalan keywordler için
-            elif self.current_token.value == "pass":        
-                self.advance()
-                return ("PASS",)
-            elif self.current_token.value == "break":
-                self.advance()
-                return ("BREAK",)
-            elif self.current_token.value == "continue":
-                self.advance()
-                return ("CONTINUE",)
-            else:
-                #diğer anahtar kelimeler
-                value = self.current_token.value
-                self.advance()
-                return ("KEYWORD", value)
-            
-        elif self.current_token.type in ["IDENTIFIER", "BUILTIN"]:
-            #atama mı yoksa ifade mi kontrolu ve sonuca gore yonlendirme
-            if self.is_assignment():
-                return self.parse_assign_stmt()
-            else:
-                return self.parse_expr_stmt()
-        else:
-            return self.parse_expr_stmt()
-
-    #bu bi atama mı kontrolu
-    def is_assignment(self):
-        saved_pos = self.pos
-        try:
-            #ilk identifier-builtini atla
-            if self.current_token.type in ["IDENTIFIER", "BUILTIN"]:
-                self.advance()
-                
-                #nokta notasyonu varsa devam et (self.abc = ... desteği için)
-                while self.current_token and self.current_token.value == ".":
-                    self.advance()  # . yı atla
-                    if self.current_token and self.current_token.type in ["IDENTIFIER", "BUILTIN"]:
-                        self.advance()  # identifier atla
-                    else:
-                        break
-                
-                # = işareti var mı kontrol et, varsa atamadır
-                result = self.current_token and self.current_token.value == "="
-                return result
-        finally:
-            #pozisyonu geriye al
-            self.pos = saved_pos
-            self.current_token = self.tokens[self.pos] if self.pos < len(self.tokens) else None
-
-
-    #class tanımını parse ediyor
-    def parse_class_def(self):
-        self.expect("KEYWORD", "class")
-        class_name = self.current_token.value
-        self.expect("IDENTIFIER")
-        
-        #kalıtım için (class Myclass(a1,b1) gibi)
-        bases = []
-        if self.current_token and self.current_token.value == "(":
-            self.advance()
-            while self.current_token and self.current_token.value != ")":
-                if self.current_token.type == "IDENTIFIER":
-                    bases.append(self.current_token.value)
-                    self.advance()
-                    if self.current_token and self.current_token.value == ",":
-                        self.advance()
-            self.expect("DELIMITER", ")")
-        
-        #sondaki : kontrolu
-        self.expect("DELIMITER", ":")
-        body = self.parse_block()
-        return ("CLASS_DEF", class_name, bases, body)
-    
-
-    #fonk. işleme
-    def parse_func_def(self):
-        self.expect("KEYWORD", "def")
-        
-        #fonksiyon ad kontrolu (__init__ gibi özel metodlar dahil edildi)
-        if self.current_token.type not in ["IDENTIFIER", "BUILTIN"]:
-            raise SyntaxError(f"Fonksiyon ismi bekleniyordu, ancak {self.current_token.type} bulundu")
-        func_name = self.current_token.value
-        self.advance()
-        self.expect("DELIMITER", "(")
-        
-        #parametre listesi parse etme
-        params = []
-        if self.current_token and self.current_token.value != ")":
-            params = self.parse_param_list()
-        
-        self.expect("DELIMITER", ")")
-        self.expect("DELIMITER", ":")
-        body = self.parse_block()
-        return ("FUNC_DEF", func_name, params, body)
-
-    #parametreleri , le ayrılmış okur
-    def parse_param_list(self):
-        params = []
-        if self.current_token and self.current_token.type in ["IDENTIFIER", "BUILTIN"]:
-            params.append(self.current_token.value)
-            self.advance()
-            while self.current_token and self.current_token.value == ",":
-                self.advance()
-                if self.current_token and self.current_token.type in ["IDENTIFIER", "BUILTIN"]:
-                    params.append(self.current_token.value)
-                    self.advance()
-                else:
-                    raise SyntaxError("',' sonrasında parametre ismi bekleniyor")
-        return params
-    
-
-    #if koşulu ve sonrasının parse işlemini yapar
-    def parse_if_stmt(self):
-        keyword = self.current_token.value       #if veya elif olabilir
-        self.advance()
-        condition = self.parse_expression()
-        self.expect("DELIMITER", ":")
-        if_block = self.parse_block()
-        
-        elif_blocks = []
-        else_block = None
-        
-        #elif bloklarını işleme
-        while self.current_token and self.current_token.type == "KEYWORD" and self.current_token.value == "elif":
-            self.advance()
-            elif_condition = self.parse_expression()
-            self.expect("DELIMITER", ":")
-            elif_block = self.parse_block()
-            elif_blocks.append(("ELIF", elif_condition, elif_block))
-        
-        #else bloğunu işleme
-        if self.current_token and self.current_token.type == "KEYWORD" and self.current_token.value == "else":
-            self.advance()
-            self.expect("DELIMITER", ":")
-            else_block = self.parse_block()
-        
-        return ("IF", keyword, condition, if_block, elif_blocks, else_block)
-
-    #while dongusu parse işlemii
-    def parse_while_stmt(self):
-        self.expect("KEYWORD", "while")
-        condition = self.parse_expression()
-        self.expect("DELIMITER", ":")
-        body = self.parse_block()
-        return ("WHILE", condition, body)
-    
-    #for için parse işlemi ((for i in liste:) gibi bi tanım için "in" ":" vs. kontrolu yapılır)
-    def parse_for_stmt(self):
-        self.expect("KEYWORD", "for")
-        
-        if self.current_token.type != "IDENTIFIER":
-            raise SyntaxError(f"'for' döngüsü bir değişken gerektirir, ancak {self.current_token.type} bulundu")
-        target = self.current_token.value
-        self.advance()
-        
-        if not (self.current_token and self.current_token.type == "KEYWORD" and self.current_token.value == "in"):
-            raise SyntaxError(f"'for' döngüsü değişkeninden sonra 'in' anahtar kelimesi bekleniyordu, ancak '{self.current_token.value if self.current_token else 'EOF'}' bulundu")
-        self.advance()
-        
-        iterable = self.parse_expression()
-        
-        if not (self.current_token and self.current_token.type == "DELIMITER" and self.current_token.value == ":"):
-            raise SyntaxError(f"'for' döngüsünden sonra ':' bekleniyordu, ancak '{self.current_token.value if self.current_token else 'EOF'}' bulundu")
-        self.advance()
-        
-        body = self.parse_block()
-        return ("FOR", target, iterable, body)
-    
-    #kod blogunu parse etme, eger uygun tipteyse(if,while ....) parse eder
-    def parse_block(self):
-        statements = []
-        if self.current_token and (
-            self.current_token.type in ["KEYWORD", "IDENTIFIER", "BUILTIN", "COMMENT"]
-        ):
-            stmt = self.parse_statement()
-            statements.append(stmt)
-        return statements
-    
-    #ifade baslatır
-    def parse_expression(self):
-        return self.parse_comparison()
-
-    #karsılastırma ifadeleri için
-    def parse_comparison(self):
-        left = self.parse_addition()
-        while self.current_token and self.current_token.type == "OPERATOR" and self.current_token.value in ["==", "!=", "<", ">", "<=", ">="]:
-            op = self.current_token.value
-            self.advance()
-            right = self.parse_addition()
-            left = ("BIN_OP", op, left, right)
-        return left
-
-    #toplama cıkarma işlemleri için
-    def parse_addition(self):
-        left = self.parse_term()
-        while self.current_token and self.current_token.type == "OPERATOR" and self.current_token.value in ["+", "-"]:
-            op = self.current_token.value
-            self.advance()
-            right = self.parse_term()
-            left = ("BIN_OP", op, left, right)
-        return left
-
-    #çarpma bolme için
-    def parse_term(self):
-        left = self.parse_factor()
-        while self.current_token and self.current_token.type == "OPERATOR" and self.current_token.value in ["*", "/", "%", "//"]:
-            op = self.current_token.value
-            self.advance()
-            right = self.parse_factor()
-            left = ("BIN_OP", op, left, right)
-        return left
-
-    #aritmetik ifadelerin en minik parcaya kadar cozumleme
-    def parse_factor(self):
-        token = self.current_token
-
-        #- + varsa unary operator
-        if token.type == "OPERATOR" and token.value in ["-", "+"]:
-            op = token.value
-            self.advance()
-            operand = self.parse_factor()
-            return ("UNARY_OP", op, operand)
-        #sayı varsa sayı parse etme
-        if token.type == "NUMBER":
-            self.advance()
-            return ("NUMBER", token.value)
-        #strigse
-        elif token.type == "STRING":
-            self.advance()
-            return ("STRING", token.value)
-        #fstringse
-        elif token.type == "FSTRING":
-            self.advance()
-            return ("FSTRING", token.value)
-        #degiskenler için ve nokta notasyonnu destekle
-        elif token.type in ["IDENTIFIER", "BUILTIN"]:
-            name = self.parse_dotted_name()
-            #fonk. cag. kontrolü
-            if self.current_token and self.current_token.value == "(":
-                return self.parse_function_call(name)
-            return ("IDENTIFIER", name)
-        #parantezli ifadeler için
-        elif token.value == "(":
-            self.expect("DELIMITER", "(")
-            expr = self.parse_expression()
-            self.expect("DELIMITER", ")")
-            return expr
-        #[] ve {} için
-        elif token.value == "[":
-            self.expect("DELIMITER", "[")
-            elements = []
-            if self.current_token and self.current_token.value != "]":
-                elements.append(self.parse_expression())
-                while self.current_token and self.current_token.value == ",":
-                    self.advance()
-                    if self.current_token and self.current_token.value != "]":
-                        elements.append(self.parse_expression())
-            self.expect("DELIMITER", "]")
-            return ("LIST", elements)
-        elif token.value == "{":
-            self.expect("DELIMITER", "{")
-            elements = []
-            if self.current_token and self.current_token.value != "}":
-                elements.append(self.parse_expression())
-                while self.current_token and self.current_token.value == ",":
-                    self.advance()
-                    if self.current_token and self.current_token.value != "}":
-                        elements.append(self.parse_expression())
-            self.expect("DELIMITER", "}")
-            return ("SET", elements)
-        #tanıyamazsa hata verir
-        else:
-            raise SyntaxError(f"Beklenmeyen token: {token.value if token else 'EOF'} (tür: {token.type if token else 'None'})")
-        
-
-    #self.a.b gibi noktalı ifadeleri tanımlamak için
-    def parse_dotted_name(self):
-        if self.current_token.type not in ["IDENTIFIER", "BUILTIN"]:
-            raise SyntaxError(f"Tanımlayıcı (identifier) bekleniyordu, ancak {self.current_token.type} bulundu")
-            
-        parts = [self.current_token.value]
-        self.advance()
-        
-        while self.current_token and self.current_token.value == ".":
-            self.advance()  # "." yı atla
-            if self.current_token and self.current_token.type in ["IDENTIFIER", "BUILTIN"]:
-                parts.append(self.current_token.value)
-                self.advance()
-            else:
-                raise SyntaxError("'.' karakterinden sonra tanımlayıcı (identifier) bekleniyordu")
-        
-        return ".".join(parts)
-
-    #atama işlemleri için fonk (x=0 vb.)
-    def parse_assign_stmt(self):
-        var_name = self.parse_dotted_name()
-        self.expect("OPERATOR", "=")
-        expr = self.parse_expression()
-        return ("ASSIGN", var_name, expr)
-
-    #sadece ifade parserde else'te cagrılıyor
-    def parse_expr_stmt(self):
-        expr = self.parse_expression()
-        return ("EXPR", expr)
-
-    #fonk. cagrıları işleme (fonk(1,2) vb.)
-    def parse_function_call(self, func_name):       #fonk adı cagrıldıgı yerde verilir
-        self.expect("DELIMITER", "(")
-        args = []
-        #fonk cagrısı ıcın gerekli seylerin kontrolu parantez, iki nokta vs.
-        if self.current_token and self.current_token.value != ")":
-            args.append(self.parse_expression())
-            while self.current_token and self.current_token.value == ",":
-                self.advance()
-                if self.current_token and self.current_token.value != ")":
-                    args.append(self.parse_expression())
-        self.expect("DELIMITER", ")")
-        return ("FUNC_CALL", func_name, args)
-
-    
-    #return kelimesi için tanımlama
-    def parse_return_stmt(self):
-        self.expect("KEYWORD", "return")
-        if self.current_token and self.current_token.type not in ["COMMENT"]:
-            expr = self.parse_expression()
-            return ("RETURN", expr)
-        return ("RETURN", None)
-
-    #print parse'i yapılır
-    def parse_print_stmt(self):
-        self.expect("KEYWORD", "print")
-        self.expect("DELIMITER", "(")
-        args = []
-        if self.current_token and self.current_token.value != ")":
-            args.append(self.parse_expression())
-            while self.current_token and self.current_token.value == ",":       #içine birden fazla ifade yazabilmek için
-                self.advance()
-                if self.current_token and self.current_token.value != ")":
-                    args.append(self.parse_expression())
-        self.expect("DELIMITER", ")")
-        return ("PRINT", args)
\ No newline at end of file
+from bisect import bisect_left
+
+#pratt motoru için operatör tabloları, yeni operatör eklemek için tabloya satır eklemek yeterli
+#ikili operatörler: değer -> (bağlama gücü, sağ tarafın parse edildiği en düşük güç)
+#sol birleşmeli operatörlerde sağ güç bir fazladır; ** sağ birleşmelidir ve sağında tekli operatör olabilir
+BINARY_OPERATORS = {
+    "or": (1, 2),
+    "and": (2, 3),
+    "==": (4, 5), "!=": (4, 5), "<": (4, 5), ">": (4, 5), "<=": (4, 5), ">=": (4, 5),
+    "in": (4, 5), "not in": (4, 5), "is": (4, 5), "is not": (4, 5),
+    "|": (5, 6),
+    "^": (6, 7),
+    "&": (7, 8),
+    "<<": (8, 9), ">>": (8, 9),
+    "+": (9, 10), "-": (9, 10),
+    "*": (10, 11), "/": (10, 11), "%": (10, 11), "//": (10, 11),
+    "**": (12, 11),
+}
+
+#tekli operatörler: değer -> operandın parse edildiği en düşük güç
+#(-a * b) -> (-a) * b, (-a ** b) -> -(a ** b), (not a == b) -> not (a == b)
+UNARY_OPERATORS = {"not": 3, "-": 11, "+": 11, "~": 11}
+
+#iki tokenlık ikili operatörlerin ilk ve ikinci kelimesi
+COMPOUND_OPERATORS = {"not": "in", "is": "not"}
+
+#recover modunda hatadan sonra parse'ın devam edebileceği anahtar kelimeler (satır başlarına ek olarak)
+SYNC_KEYWORDS = ("def", "class")
+
+
+class Parser:
+    #ifade motorları: pratt tablo tabanlı öncelik tırmanma, descent eski seviye seviye recursive descent
+    ENGINES = ("pratt", "descent")
+
+    #tokenları alır ve pos ile takip eder
+    #line_index (LineIndex) verilirse hatalarda gerçek satır ve sütun gösterilir
+    #memoize=False ise kural önbelleği kapalıdır (ileri bakış sonrası aynı tokenlar tekrar taranır)
+    def __init__(self, tokens, line_index=None, engine="pratt", memoize=True):
+        if engine not in self.ENGINES:
+            raise ValueError(f"Bilinmeyen ifade motoru: {engine} (seçenekler: {', '.join(self.ENGINES)})")
+        self.tokens = tokens
+        self.pos = 0
+        self.current_token = self.tokens[self.pos] if self.tokens else None
+        self.line_index = line_index
+        self.engine = engine
+        if engine == "pratt":
+            self.parse_expression = self.parse_pratt
+        #(kural, token konumu) -> (sonuç, bitiş konumu); sadece ileri bakış (speculating) sırasında
+        #yazılır, çünkü tekrar sorulan sonuçlar onlardır. Her üst seviye statement başında temizlenir,
+        #parse bir statement'ın başından geriye dönmediği için eski konumlar bir daha sorulmaz
+        self.memoize = memoize
+        self.memo = {}
+        self.memo_hits = 0
+        self.speculating = False
+        #parse sırasında bulunan tanımlar (FUNC_DEF, CLASS_DEF, ASSIGN), üst seviye statement başına bir tuple
+        #kayıt: (tür, isim, başlangıç, bitiş, ebeveyn); konumlar statement başına göre token indeksi,
+        #ebeveyn aynı tuple'daki kapsayan tanımın sırası (yoksa -1)
+        self.symbols = []
+        self.statement_symbols = []
+        self.symbol_parent = -1
+
+    #bir sonraki tokene gecmeyi saglar
+    def advance(self):
+        self.pos += 1
+        if self.pos < len(self.tokens):
+            self.current_token = self.tokens[self.pos]
+        else:
+            self.current_token = None
+
+    #gelecek tokene bakmayı saglar
+    def peek(self, offset=1):
+        peek_pos = self.pos + offset
+        if peek_pos < len(self.tokens):
+            return self.tokens[peek_pos]
+        return None
+
+    #satır numara takibi
+    def get_line_number(self):
+        if self.current_token is None:
+            return "EOF"
+        position = self.get_position()
+        if position is None:
+            return f"pos:{self.pos}"
+        return f"{position[0]}:{position[1]}"
+
+    #mevcut tokenın (satır, sütun) bilgisi, ikisi de 1'den başlar
+    def get_position(self):
+        if self.current_token is None or self.line_index is None:
+            return None
+        line, column = self.line_index.position(self.current_token.position[0])
+        return line, column + 1
+
+    #sıradaki tokenin type ve valuesine bakar uygunluk durumuna gore error uretir ya da advance ile ilerler
+    def expect(self, type_, value=None):
+        if self.current_token is None:
+            raise SyntaxError(f"Beklenmeyen giriş sonu (beklenen: {type_})")
+        if self.current_token.type != type_:
+            raise SyntaxError(f"{self.get_line_number()} satırı: Beklenen tür '{type_}', ancak '{self.current_token.type}' bulundu ('{self.current_token.value}')")
+        if value is not None and self.current_token.value != value:
+            raise SyntaxError(f"{self.get_line_number()} satırı: Beklenen değer '{value}', ancak '{self.current_token.value}' bulundu")
+        self.advance()
+
+    #kuralın okuyacağı token; giriş bittiyse None üzerinden devam etmek yerine SyntaxError verir
+    def require_token(self, expected):
+        if self.current_token is None:
+            raise SyntaxError(f"Beklenmeyen giriş sonu (beklenen: {expected})")
+        return self.current_token
+
+    #recover=True ise ilk hatada durulmaz: hatalı statement ("ERROR", mesaj) düğümü olur, parse bir
+    #sonraki senkron noktasından devam eder ve hatalar (mesaj, (satır, sütun)) olarak self.errors'a yazılır
+    def parse(self, recover=False):
+        self.recover = recover
+        self.errors = []
+        return self.parse_program()
+
+    #tum satırları sırayla işleyen fonk.
+    #her üst seviye statement'ın [başlangıç, bitiş) token aralığı statement_spans'e yazılır
+    #tanımlar da aynı geçişte statement başına symbols listesine yazılır
+    def parse_program(self):
+        statements = []
+        self.statement_spans = []
+        self.symbols = []
+        while self.current_token is not None:
+            start = self.pos
+            stmt = self.parse_top_statement()
+            statements.append(stmt)
+            self.statement_spans.append((start, self.pos))
+            self.symbols.append(self.take_symbols(start))
+        return ("PROGRAM", statements)
+
+    #üst seviye statement; recover modunda hata yakalanıp senkron noktasına atlanır
+    #hatanın oluştuğu token indeksi error_index'te kalır (IncrementalParser için)
+    def parse_top_statement(self):
+        self.memo.clear()
+        self.statement_symbols = []
+        self.symbol_parent = -1
+        if not getattr(self, "recover", False):
+            return self.parse_statement()
+        start = self.pos
+        try:
+            return self.parse_statement()
+        except (SyntaxError, RecursionError) as e:
+            #hatalı statement'ın yarım kalan tanımları atılır
+            self.statement_symbols = []
+            message = str(e)
+            self.error_index = self.pos
+            self.errors.append((message, self.get_position()))
+            self.synchronize(start)
+            return ("ERROR", message)
+
+    #hatadan sonra devam edilecek token: hatanın oluştuğu yerden itibaren satırın ilk tokenı olan
+    #(line_index varsa) ya da def/class olan ilk token; statement'ın en az bir tokenı atlanır
+    def synchronize(self, start):
+        tokens = self.tokens
+        pos = max(start + 1, min(self.pos, len(tokens)))
+        while pos < len(tokens):
+            token = tokens[pos]
+            if token.type == "KEYWORD" and token.value in SYNC_KEYWORDS:
+                break
+            if self.line_index is not None and \
+                    self.token_line(pos) > self.token_line(pos - 1):
+                break
+            pos += 1
+        self.seek(pos)
+
+    #son üst seviye statement'ın tanımlarını start'a göre konumlarla tuple olarak verir
+    def take_symbols(self, start):
+        return tuple((kind, name, begin - start, end - start, parent)
+                     for kind, name, begin, end, parent in self.statement_symbols)
+
+    #tanım kaydını başlatır, bitiş konumu end_symbol ile yazılır; içinde başlayan tanımların ebeveyni olur
+    def begin_symbol(self, kind, name, start):
+        index = len(self.statement_symbols)
+        self.statement_symbols.append((kind, name, start, None, self.symbol_parent))
+        self.symbol_parent = index
+        return index
+
+    def end_symbol(self, index):
+        kind, name, start, _, parent = self.statement_symbols[index]
+        self.statement_symbols[index] = (kind, name, start, self.pos, parent)
+        self.symbol_parent = parent
+
+    def token_line(self, index):
+        return self.line_index.position(self.tokens[index].position[0])[0]
+
+    #parse'a başka bir token konumundan devam etmek için
+    def seek(self, pos):
+        self.pos = pos
+        self.current_token = self.tokens[pos] if pos < len(self.tokens) else None
+
+    #tokenları ilgili fonksiyona yonlendirme ve tanımlama işlemini yapar
+    def parse_statement(self):
+        #yorum satırlarını atla
+        if self.current_token.type == "COMMENT":
+            comment_value = self.current_token.value
+            self.advance()
+            return ("COMMENT", comment_value)
+            
+        if self.current_token.type == "KEYWORD":
+            if self.current_token.value == "if":
+                return self.parse_if_stmt()
+            elif self.current_token.value == "while":
+                return self.parse_while_stmt()
+            elif self.current_token.value == "for":  
+                return self.parse_for_stmt()
+            elif self.current_token.value == "def":
+                return self.parse_func_def()
+            elif self.current_token.value == "return":
+                return self.parse_return_stmt()
+            elif self.current_token.value == "print":
+                return self.parse_print_stmt()
+            elif self.current_token.value == "class":
+                return self.parse_class_def()
+            elif self.current_token.value == "elif":
+                return self.parse_if_stmt()
+            #hata almamak için tanımlamalar, bosta kalan keywordler için
+            elif self.current_token.value == "pass":        
+                self.advance()
+                return ("PASS",)
+            elif self.current_token.value == "break":
+                self.advance()
+                return ("BREAK",)
+            elif self.current_token.value == "continue":
+                self.advance()
+                return ("CONTINUE",)
+            else:
+                #diğer anahtar kelimeler
+                value = self.current_token.value
+                self.advance()
+                return ("KEYWORD", value)
+            
+        elif self.current_token.type in ["IDENTIFIER", "BUILTIN"]:
+            #atama mı yoksa ifade mi kontrolu ve sonuca gore yonlendirme
+            if self.is_assignment():
+                return self.parse_assign_stmt()
+            else:
+                return self.parse_expr_stmt()
+        else:
+            return self.parse_expr_stmt()
+
+    #bu bi atama mı kontrolu
+    #noktalı isim (self.abc = ... desteği için) memoized olarak okunur, ardından = varsa atamadır;
+    #parse_assign_stmt ya da parse_atom aynı ismi tekrar istediğinde tokenlar yeniden taranmaz
+    def is_assignment(self):
+        saved_pos = self.pos
+        self.speculating = True
+        try:
+            if self.current_token.type not in ["IDENTIFIER", "BUILTIN"]:
+                return False
+            self.parse_dotted_name()
+            return self.current_token is not None and self.current_token.value == "="
+        except SyntaxError:
+            #yarım noktalı isim, hatayı asıl parse kuralı verecek
+            return False
+        finally:
+            #pozisyonu geriye al
+            self.speculating = False
+            self.seek(saved_pos)
+
+    #packrat önbelleği: kural bu konumda daha önce başarıyla çalıştıysa sonucu ve bitiş konumu
+    #tekrar kullanılır; sonuç sadece tokenlara bağlı olan kurallar için (hatalar saklanmaz)
+    def memoized(self, rule, parse):
+        if not self.memoize:
+            return parse()
+        start = self.pos
+        if self.memo:
+            entry = self.memo.get((rule, start))
+            if entry is not None:
+                self.memo_hits += 1
+                result, end = entry
+                self.seek(end)
+                return result
+        result = parse()
+        if self.speculating:
+            self.memo[(rule, start)] = (result, self.pos)
+        return result
+
+
+    #class tanımını parse ediyor
+    def parse_class_def(self):
+        start = self.pos
+        self.expect("KEYWORD", "class")
+        class_name = self.require_token("IDENTIFIER").value
+        self.expect("IDENTIFIER")
+        symbol = self.begin_symbol("CLASS_DEF", class_name, start)
+        
+        #kalıtım için (class Myclass(a1,b1) gibi)
+        bases = []
+        if self.current_token and self.current_token.value == "(":
+            self.advance()
+            while self.current_token and self.current_token.value != ")":
+                if self.current_token.type == "IDENTIFIER":
+                    bases.append(self.current_token.value)
+                    self.advance()
+                    if self.current_token and self.current_token.value == ",":
+                        self.advance()
+                else:
+                    #tanımlayıcı olmayan token atlanmadığı için döngü hiç bitmiyordu
+                    raise SyntaxError(f"{self.get_line_number()} satırı: Üst sınıf ismi bekleniyordu, ancak '{self.current_token.value}' bulundu")
+            self.expect("DELIMITER", ")")
+        
+        #sondaki : kontrolu
+        self.expect("DELIMITER", ":")
+        body = self.parse_block()
+        self.end_symbol(symbol)
+        return ("CLASS_DEF", class_name, bases, body)
+    
+
+    #fonk. işleme
+    def parse_func_def(self):
+        start = self.pos
+        self.expect("KEYWORD", "def")
+        
+        #fonksiyon ad kontrolu (__init__ gibi özel metodlar dahil edildi)
+        if self.require_token("IDENTIFIER").type not in ["IDENTIFIER", "BUILTIN"]:
+            raise SyntaxError(f"Fonksiyon ismi bekleniyordu, ancak {self.current_token.type} bulundu")
+        func_name = self.current_token.value
+        self.advance()
+        symbol = self.begin_symbol("FUNC_DEF", func_name, start)
+        self.expect("DELIMITER", "(")
+        
+        #parametre listesi parse etme
+        params = []
+        if self.current_token and self.current_token.value != ")":
+            params = self.parse_param_list()
+        
+        self.expect("DELIMITER", ")")
+        self.expect("DELIMITER", ":")
+        body = self.parse_block()
+        self.end_symbol(symbol)
+        return ("FUNC_DEF", func_name, params, body)
+
+    #parametreleri , le ayrılmış okur
+    def parse_param_list(self):
+        params = []
+        if self.current_token and self.current_token.type in ["IDENTIFIER", "BUILTIN"]:
+            params.append(self.current_token.value)
+            self.advance()
+            while self.current_token and self.current_token.value == ",":
+                self.advance()
+                if self.current_token and self.current_token.type in ["IDENTIFIER", "BUILTIN"]:
+                    params.append(self.current_token.value)
+                    self.advance()
+                else:
+                    raise SyntaxError("',' sonrasında parametre ismi bekleniyor")
+        return params
+    
+
+    #if koşulu ve sonrasının parse işlemini yapar
+    def parse_if_stmt(self):
+        keyword = self.current_token.value       #if veya elif olabilir
+        self.advance()
+        condition = self.parse_expression()
+        self.expect("DELIMITER", ":")
+        if_block = self.parse_block()
+        
+        elif_blocks = []
+        else_block = None
+        
+        #elif bloklarını işleme
+        while self.current_token and self.current_token.type == "KEYWORD" and self.current_token.value == "elif":
+            self.advance()
+            elif_condition = self.parse_expression()
+            self.expect("DELIMITER", ":")
+            elif_block = self.parse_block()
+            elif_blocks.append(("ELIF", elif_condition, elif_block))
+        
+        #else bloğunu işleme
+        if self.current_token and self.current_token.type == "KEYWORD" and self.current_token.value == "else":
+            self.advance()
+            self.expect("DELIMITER", ":")
+            else_block = self.parse_block()
+        
+        return ("IF", keyword, condition, if_block, elif_blocks, else_block)
+
+    #while dongusu parse işlemii
+    def parse_while_stmt(self):
+        self.expect("KEYWORD", "while")
+        condition = self.parse_expression()
+        self.expect("DELIMITER", ":")
+        body = self.parse_block()
+        return ("WHILE", condition, body)
+    
+    #for için parse işlemi ((for i in liste:) gibi bi tanım için "in" ":" vs. kontrolu yapılır)
+    def parse_for_stmt(self):
+        self.expect("KEYWORD", "for")
+        
+        if self.require_token("IDENTIFIER").type != "IDENTIFIER":
+            raise SyntaxError(f"'for' döngüsü bir değişken gerektirir, ancak {self.current_token.type} bulundu")
+        target = self.current_token.value
+        self.advance()
+        
+        if not (self.current_token and self.current_token.type == "KEYWORD" and self.current_token.value == "in"):
+            raise SyntaxError(f"'for' döngüsü değişkeninden sonra 'in' anahtar kelimesi bekleniyordu, ancak '{self.current_token.value if self.current_token else 'EOF'}' bulundu")
+        self.advance()
+        
+        iterable = self.parse_expression()
+        
+        if not (self.current_token and self.current_token.type == "DELIMITER" and self.current_token.value == ":"):
+            raise SyntaxError(f"'for' döngüsünden sonra ':' bekleniyordu, ancak '{self.current_token.value if self.current_token else 'EOF'}' bulundu")
+        self.advance()
+        
+        body = self.parse_block()
+        return ("FOR", target, iterable, body)
+    
+    #kod blogunu parse etme, eger uygun tipteyse(if,while ....) parse eder
+    def parse_block(self):
+        statements = []
+        if self.current_token and (
+            self.current_token.type in ["KEYWORD", "IDENTIFIER", "BUILTIN", "COMMENT"]
+        ):
+            stmt = self.parse_statement()
+            statements.append(stmt)
+        return statements
+    
+    #ifade baslatır (pratt motorunda __init__ bunu parse_pratt ile değiştirir)
+    def parse_expression(self):
+        return self.parse_comparison()
+
+    #tablo tabanlı öncelik tırmanma (Pratt): operatörün gücü min_power'dan küçükse döngü biter
+    #her yaprak tek parse_pratt + parse_atom çağrısıdır, seviye başına ayrı fonksiyon yoktur
+    #tablolara token değeriyle bakılır: bu değerler sadece OPERATOR ya da KEYWORD tokenı olabilir
+    #(string'lerde tırnak vardır, ERROR dizileri operatör karakteri içermez)
+    def parse_pratt(self, min_power=0):
+        token = self.current_token
+        power = UNARY_OPERATORS.get(token.value) if token is not None else None
+        if power is not None:
+            self.advance()
+            left = ("UNARY_OP", token.value, self.parse_pratt(power))
+        else:
+            left = self.parse_atom()
+
+        while True:
+            token = self.current_token
+            if token is None:
+                return left
+            op = token.value
+            entry = BINARY_OPERATORS.get(op)
+            #iki tokenlık operatörler: "not in", "is not"
+            if entry is None:
+                if op not in COMPOUND_OPERATORS:
+                    return left
+                second = COMPOUND_OPERATORS[op]
+            else:
+                second = COMPOUND_OPERATORS.get(op)
+            if second is not None:
+                following = self.peek()
+                if following is not None and following.type == "KEYWORD" and following.value == second:
+                    op = f"{op} {second}"
+                    entry = BINARY_OPERATORS[op]
+                else:
+                    second = None
+            if entry is None or entry[0] < min_power:
+                return left
+            self.advance()
+            if second is not None:
+                self.advance()
+            left = ("BIN_OP", op, left, self.parse_pratt(entry[1]))
+
+    #karsılastırma ifadeleri için
+    def parse_comparison(self):
+        left = self.parse_addition()
+        while self.current_token and self.current_token.type == "OPERATOR" and self.current_token.value in ["==", "!=", "<", ">", "<=", ">="]:
+            op = self.current_token.value
+            self.advance()
+            right = self.parse_addition()
+            left = ("BIN_OP", op, left, right)
+        return left
+
+    #toplama cıkarma işlemleri için
+    def parse_addition(self):
+        left = self.parse_term()
+        while self.current_token and self.current_token.type == "OPERATOR" and self.current_token.value in ["+", "-"]:
+            op = self.current_token.value
+            self.advance()
+            right = self.parse_term()
+            left = ("BIN_OP", op, left, right)
+        return left
+
+    #çarpma bolme için
+    def parse_term(self):
+        left = self.parse_factor()
+        while self.current_token and self.current_token.type == "OPERATOR" and self.current_token.value in ["*", "/", "%", "//"]:
+            op = self.current_token.value
+            self.advance()
+            right = self.parse_factor()
+            left = ("BIN_OP", op, left, right)
+        return left
+
+    #aritmetik ifadelerin en minik parcaya kadar cozumleme
+    def parse_factor(self):
+        token = self.current_token
+
+        #- + varsa unary operator
+        if token is not None and token.type == "OPERATOR" and token.value in ["-", "+"]:
+            op = token.value
+            self.advance()
+            operand = self.parse_factor()
+            return ("UNARY_OP", op, operand)
+        return self.parse_atom()
+
+    #sayı, string, isim, fonksiyon çağrısı, parantezli ifade, liste ve küme (iki motor için ortak)
+    def parse_atom(self):
+        token = self.current_token
+        if token is None:
+            raise SyntaxError("Beklenmeyen token: EOF (tür: None)")
+        #sayı varsa sayı parse etme
+        if token.type == "NUMBER":
+            self.advance()
+            return ("NUMBER", token.value)
+        #strigse
+        elif token.type == "STRING":
+            self.advance()
+            return ("STRING", token.value)
+        #fstringse
+        elif token.type == "FSTRING":
+            self.advance()
+            return ("FSTRING", token.value)
+        #degiskenler için ve nokta notasyonnu destekle
+        elif token.type in ["IDENTIFIER", "BUILTIN"]:
+            name = self.parse_dotted_name()
+            #fonk. cag. kontrolü
+            if self.current_token and self.current_token.value == "(":
+                return self.parse_function_call(name)
+            return ("IDENTIFIER", name)
+        #parantezli ifadeler için
+        elif token.value == "(":
+            self.expect("DELIMITER", "(")
+            expr = self.parse_expression()
+            self.expect("DELIMITER", ")")
+            return expr
+        #[] ve {} için
+        elif token.value == "[":
+            self.expect("DELIMITER", "[")
+            elements = []
+            if self.current_token and self.current_token.value != "]":
+                elements.append(self.parse_expression())
+                while self.current_token and self.current_token.value == ",":
+                    self.advance()
+                    if self.current_token and self.current_token.value != "]":
+                        elements.append(self.parse_expression())
+            self.expect("DELIMITER", "]")
+            return ("LIST", elements)
+        elif token.value == "{":
+            self.expect("DELIMITER", "{")
+            elements = []
+            if self.current_token and self.current_token.value != "}":
+                elements.append(self.parse_expression())
+                while self.current_token and self.current_token.value == ",":
+                    self.advance()
+                    if self.current_token and self.current_token.value != "}":
+                        elements.append(self.parse_expression())
+            self.expect("DELIMITER", "}")
+            return ("SET", elements)
+        #tanıyamazsa hata verir
+        else:
+            raise SyntaxError(f"Beklenmeyen token: {token.value if token else 'EOF'} (tür: {token.type if token else 'None'})")
+        
+
+    #self.a.b gibi noktalı ifadeleri tanımlamak için
+    def parse_dotted_name(self):
+        return self.memoized("dotted_name", self.scan_dotted_name)
+
+    def scan_dotted_name(self):
+        if self.require_token("IDENTIFIER").type not in ["IDENTIFIER", "BUILTIN"]:
+            raise SyntaxError(f"Tanımlayıcı (identifier) bekleniyordu, ancak {self.current_token.type} bulundu")
+            
+        parts = [self.current_token.value]
+        self.advance()
+        
+        while self.current_token and self.current_token.value == ".":
+            self.advance()  # "." yı atla
+            if self.current_token and self.current_token.type in ["IDENTIFIER", "BUILTIN"]:
+                parts.append(self.current_token.value)
+                self.advance()
+            else:
+                raise SyntaxError("'.' karakterinden sonra tanımlayıcı (identifier) bekleniyordu")
+        
+        return ".".join(parts)
+
+    #atama işlemleri için fonk (x=0 vb.)
+    def parse_assign_stmt(self):
+        start = self.pos
+        var_name = self.parse_dotted_name()
+        symbol = self.begin_symbol("ASSIGN", var_name, start)
+        self.expect("OPERATOR", "=")
+        expr = self.parse_expression()
+        self.end_symbol(symbol)
+        return ("ASSIGN", var_name, expr)
+
+    #sadece ifade parserde else'te cagrılıyor
+    def parse_expr_stmt(self):
+        expr = self.parse_expression()
+        return ("EXPR", expr)
+
+    #fonk. cagrıları işleme (fonk(1,2) vb.)
+    def parse_function_call(self, func_name):       #fonk adı cagrıldıgı yerde verilir
+        self.expect("DELIMITER", "(")
+        args = []
+        #fonk cagrısı ıcın gerekli seylerin kontrolu parantez, iki nokta vs.
+        if self.current_token and self.current_token.value != ")":
+            args.append(self.parse_expression())
+            while self.current_token and self.current_token.value == ",":
+                self.advance()
+                if self.current_token and self.current_token.value != ")":
+                    args.append(self.parse_expression())
+        self.expect("DELIMITER", ")")
+        return ("FUNC_CALL", func_name, args)
+
+    
+    #return kelimesi için tanımlama
+    def parse_return_stmt(self):
+        self.expect("KEYWORD", "return")
+        if self.current_token and self.current_token.type not in ["COMMENT"]:
+            expr = self.parse_expression()
+            return ("RETURN", expr)
+        return ("RETURN", None)
+
+    #print parse'i yapılır
+    def parse_print_stmt(self):
+        self.expect("KEYWORD", "print")
+        self.expect("DELIMITER", "(")
+        args = []
+        if self.current_token and self.current_token.value != ")":
+            args.append(self.parse_expression())
+            while self.current_token and self.current_token.value == ",":       #içine birden fazla ifade yazabilmek için
+                self.advance()
+                if self.current_token and self.current_token.value != ")":
+                    args.append(self.parse_expression())
+        self.expect("DELIMITER", ")")
+        return ("PRINT", args)
+
+
+#düzenlemeden sonra sadece değişen tokenlara dokunan üst seviye statement'ları yeniden parse eder
+#statement'ın AST'si sadece kendi tokenlarına ve bitişindeki iki token ileri bakışa ("not in", "is not")
+#bağlıdır (konum tutmaz), bu yüzden damage'dan önce biten ve değişmeyen kısımda başlayan statement'lar
+#aynen kullanılır
+#recover=True ise hatalı statement'lar ERROR düğümü olur ve parse hiç yarıda kalmaz; hatalar her parse'ta
+#errors listesinde (mesaj, (satır, sütun)) olarak verilir, tekrar kullanılan hatalı statement'lar da dahil
+class IncrementalParser:
+    def __init__(self, engine="pratt", recover=False):
+        self.engine = engine
+        self.recover = recover
+        #üst seviye statement'lar ve token aralıkları (başlangıçlar ve bitişler ayrı listelerde, bisect için)
+        self.statements = []
+        self.starts = []
+        self.ends = []
+        #hatalı statement'larda hatanın statement başına göre token indeksi, diğerlerinde None
+        self.error_offsets = []
+        self.errors = []
+        #statement başına tanımlar (Parser.symbols gibi, statement başına göre konumlarla)
+        self.symbols = []
+        #son parse metin sonuna kadar başarılı mı; değilse sadece hatadan önceki statement'lar saklıdır
+        self.complete = False
+        #son parse'ta kullanılan Parser (hata mesajı ve konumu için) ve yeniden parse edilen statement sayısı
+        self.parser = None
+        self.reparsed = 0
+
+    #damage (first, old_stop, new_stop): eski tokenlardaki [first, old_stop) aralığı yeni tokenlarda
+    #[first, new_stop) oldu demektir (IncrementalLexer.apply_edit); None verilirse baştan parse edilir
+    #cancel (threading.Event) başka bir thread'den kurulursa parse statement aralarında bırakılır ve None
+    #döner; bu durumda önceki parse'ın durumu değişmez, damage sonraki parse'a eklenmelidir
+    def parse(self, tokens, line_index=None, damage=None, cancel=None):
+        parser = self.parser = Parser(tokens, line_index, self.engine)
+        parser.recover = self.recover
+        parser.errors = []
+        old_statements, old_starts, old_ends = self.statements, self.starts, self.ends
+        old_error_offsets = self.error_offsets
+        old_symbols = self.symbols
+        if damage is None:
+            first, old_stop, new_stop = 0, len(tokens), len(tokens)
+            keep = 0
+        else:
+            first, old_stop, new_stop = damage
+            #bitişindeki iki ileri bakış tokenı da değişmemiş olmalı: parse_pratt "not in" ve "is not" için
+            #bitişteki tokendan sonrakine de bakar (peek)
+            keep = bisect_left(old_ends, first - 1)
+        shift = new_stop - old_stop
+        #eski statement'lar ancak önceki parse sona kadar başarılıysa tekrar kullanılabilir
+        reuse = damage is not None and self.complete
+
+        statements = old_statements[:keep]
+        starts = old_starts[:keep]
+        ends = old_ends[:keep]
+        error_offsets = old_error_offsets[:keep]
+        symbols = old_symbols[:keep]
+        self.reparsed = 0
+        parser.seek(ends[-1] if ends else 0)
+        while parser.current_token is not None:
+            if cancel is not None and cancel.is_set():
+                return None
+            #değişmeyen kısımda eski bir statement başına denk gelindiyse gerisi aynıdır
+            if reuse and parser.pos >= new_stop:
+                old_pos = parser.pos - shift
+                index = bisect_left(old_starts, old_pos, keep)
+                if index < len(old_starts) and old_starts[index] == old_pos:
+                    statements.extend(old_statements[index:])
+                    starts.extend(start + shift for start in old_starts[index:])
+                    ends.extend(end + shift for end in old_ends[index:])
+                    error_offsets.extend(old_error_offsets[index:])
+                    symbols.extend(old_symbols[index:])
+                    #hata mesajları satır numarası içerebilir, tekrar kullanılan hatalı statement'lar
+                    #yeni konumlarında tekrar parse edilir (token aralıkları değişmez)
+                    for reused in range(len(statements) - len(old_statements) + index, len(statements)):
+                        if error_offsets[reused] is not None:
+                            parser.seek(starts[reused])
+                            statements[reused] = parser.parse_top_statement()
+                    break
+            start = parser.pos
+            errors_before = len(parser.errors)
+            try:
+                statement = parser.parse_top_statement()
+            except Exception:
+                #hatalı parse'larda hatadan önceki statement'lar saklanır
+                self.statements, self.starts, self.ends = statements, starts, ends
+                self.error_offsets, self.symbols, self.complete = error_offsets, symbols, False
+                raise
+            statements.append(statement)
+            starts.append(start)
+            ends.append(parser.pos)
+            error_offsets.append(parser.error_index - start if len(parser.errors) > errors_before else None)
+            symbols.append(parser.take_symbols(start))
+            self.reparsed += 1
+
+        self.statements, self.starts, self.ends = statements, starts, ends
+        self.error_offsets, self.symbols, self.complete = error_offsets, symbols, True
+        parser.statement_spans = list(zip(starts, ends))
+        parser.symbols = symbols
+        if self.recover:
+            self.errors = parser.errors = self.collect_errors(tokens, line_index)
+        return ("PROGRAM", list(statements))
+
+    #son başarılı parse'ın önbellekte saklanabilir durumu, listeler sonraki parse'larda yerinde değişmez
+    def snapshot(self):
+        return self.statements, self.starts, self.ends, self.error_offsets, self.errors, self.symbols
+
+    #aynı tokenlar için alınmış bir snapshot'a döner, parse etmeden AST'yi döndürür
+    def restore(self, snapshot):
+        self.statements, self.starts, self.ends, self.error_offsets, self.errors, self.symbols = snapshot
+        self.complete = True
+        self.reparsed = 0
+        return ("PROGRAM", list(self.statements))
+
+    #hata konumları tokenlarla birlikte kaydığı için her parse'ta statement başlarından yeniden hesaplanır
+    def collect_errors(self, tokens, line_index):
+        errors = []
+        for statement, start, offset in zip(self.statements, self.starts, self.error_offsets):
+            if offset is None:
+                continue
+            index = start + offset
+            position = None
+            if line_index is not None and index < len(tokens):
+                line, column = line_index.position(tokens[index].position[0])
+                position = (line, column + 1)
+            errors.append((statement[1], position))
+        return errors
+
+
+#son parse'tan beri hiç düzenleme olmadığını gösteren damage (None ise bilinmiyor, baştan parse edilir)
+#boş bir aralıktan (first == old_stop == new_stop) farklıdır: sadece boşluk değiştiren bir düzenlemenin
+#aralığı da boştur ama sonraki tokenların konumları kaymıştır
+NO_DAMAGE = ()
+
+
+#highlight ile parse arasında birden çok düzenleme olursa token damage'ları birleştirilir
+#previous None ise (bilinmiyor) sonuç da None olur, NO_DAMAGE ise yeni damage aynen alınır
+def merge_token_damage(previous, first, old_stop, new_stop):
+    if previous is None:
+        return None
+    if previous == NO_DAMAGE:
+        return first, old_stop, new_stop
+    previous_first, previous_old_stop, previous_new_stop = previous
+    #ikinci düzenlemenin eski bitişi, ilk düzenlemeden önceki tokenlara göre
+    old_stop_before = max(previous_old_stop, old_stop - (previous_new_stop - previous_old_stop))
+    new_stop_after = max(previous_new_stop, old_stop) + new_stop - old_stop
+    return min(previous_first, first), old_stop_before, new_stop_after
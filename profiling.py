@@ -0,0 +1,192 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+#analiz hattının ölçümü: aşama süreleri, sayaçlar, kancalar ve iz dosyası
+#bir analiz (run) bir düzenlemenin, kaydırmanın ya da arka plan parse'ının yaptığı işin tamamıdır; run'lar
+#thread başınadır ve iç içe açılan run en dıştakine katılır (on_modified içindeki highlight gibi).
+#Aşamalar (load, lex, parse, format, symbols, tag, line_numbers) açık run'a süre, sayaçlar (token, statement,
+#AST düğümü, tcl çağrısı, önbellek isabeti ...) değer ekler. Her run bitince kancalar hook(run) ile
+#çağrılır, run = {"name", "thread", "start", "duration", "stages": {aşama: saniye}, "counters": {...}}.
+#Kancalar run'ı bitiren thread'de çağrılır, tk'ye dokunacaklarsa tk thread'ine kendileri taşımalıdır.
+#Kapalı (enabled=False) bir Profiler hiçbir şey kaydetmez, analiz sınıfları profiler verilmezse bunu kullanır
+
+STAGES = ("load", "lex", "parse", "format", "symbols", "tag", "line_numbers")
+
+
+class Profiler:
+    #history, iz dosyası için saklanan en son olay (run ve aşama) sayısıdır
+    def __init__(self, enabled=True, history=20000):
+        self.enabled = enabled
+        self.hooks = []
+        #(ad, thread, başlangıç, süre, sayaçlar): run'larda sayaçlar sözlüktür, aşamalarda None
+        self.events = deque(maxlen=history)
+        self.local = threading.local()
+        self.origin = time.perf_counter()
+        self.thread_names = {}
+        self.lock = threading.Lock()
+        #aşama -> [sayı, toplam süre, en uzun süre], sayaç -> toplam (açılıştan beri)
+        self.stage_totals = {}
+        self.counter_totals = {}
+        self.run_count = 0
+        #son sayılan statement'lar ve düğüm sayıları, değişmeyen statement'lar tekrar sayılmaz
+        self.node_statements = []
+        self.node_counts = []
+        self.node_total = 0
+
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook):
+        self.hooks.remove(hook)
+
+    #with profiler.run("edit"): ... bu thread'de açık run yoksa yeni bir run açar
+    @contextmanager
+    def run(self, name):
+        if not self.enabled or getattr(self.local, "current", None) is not None:
+            yield
+            return
+        current = self.local.current = {"name": name, "stages": {}, "counters": {}}
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.local.current = None
+            self.finish(current, start, time.perf_counter())
+
+    #with profiler.stage("lex"): ... süre açık run'a eklenir ve iz dosyasına bir olay olarak yazılır
+    @contextmanager
+    def stage(self, name):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            current = getattr(self.local, "current", None)
+            if current is not None:
+                stages = current["stages"]
+                stages[name] = stages.get(name, 0.0) + end - start
+            self.events.append((name, self.thread_id(), start, end - start, None))
+
+    #açık run'ın sayacını artırır (run yoksa yok sayılır)
+    def count(self, name, value=1):
+        current = getattr(self.local, "current", None) if self.enabled else None
+        if current is not None:
+            counters = current["counters"]
+            counters[name] = counters.get(name, 0) + value
+
+    #açık run'ın sayacını verilen değere ayarlar (token sayısı gibi anlık değerler için)
+    def set(self, name, value):
+        current = getattr(self.local, "current", None) if self.enabled else None
+        if current is not None:
+            current["counters"][name] = value
+
+    def thread_id(self):
+        thread = threading.current_thread()
+        if thread.ident not in self.thread_names:
+            self.thread_names[thread.ident] = thread.name
+        return thread.ident
+
+    def finish(self, current, start, end):
+        thread = self.thread_id()
+        current["thread"] = thread
+        current["start"] = start - self.origin
+        current["duration"] = end - start
+        self.events.append((current["name"], thread, start, end - start, current["counters"]))
+        with self.lock:
+            self.run_count += 1
+            for name, seconds in current["stages"].items():
+                totals = self.stage_totals.get(name)
+                if totals is None:
+                    self.stage_totals[name] = [1, seconds, seconds]
+                else:
+                    totals[0] += 1
+                    totals[1] += seconds
+                    totals[2] = max(totals[2], seconds)
+            for name, value in current["counters"].items():
+                self.counter_totals[name] = self.counter_totals.get(name, 0) + value
+        for hook in self.hooks:
+            hook(current)
+
+    #statement'lardaki düğüm (tuple) sayısı; IncrementalParser değişmeyen statement'lar için aynı tuple'ları
+    #döndürdüğü için önceki listeyle baştan ve sondan kimlikle (is) eşleşen kısım atlanır, sadece aradaki
+    #yeni statement'lar dolaşılır
+    def count_nodes(self, statements):
+        if not self.enabled:
+            return 0
+        old, counts = self.node_statements, self.node_counts
+        limit = min(len(statements), len(old))
+        prefix = 0
+        while prefix < limit and statements[prefix] is old[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and statements[-1 - suffix] is old[-1 - suffix]:
+            suffix += 1
+        middle = [count_tuples(statement) for statement in statements[prefix:len(statements) - suffix]]
+        removed = counts[prefix:len(counts) - suffix]
+        self.node_total += sum(middle) - sum(removed)
+        self.node_statements = list(statements)
+        self.node_counts = counts[:prefix] + middle + counts[len(counts) - suffix:]
+        return self.node_total
+
+    #önbellek isabet oranı (0-1), hiç sorgu yoksa None
+    def cache_hit_rate(self):
+        hits = self.counter_totals.get("cache_hits", 0)
+        misses = self.counter_totals.get("cache_misses", 0)
+        return hits / (hits + misses) if hits + misses else None
+
+    #açılıştan beri aşama başına sayı, toplam, ortalama ve en uzun süre (ms) ile sayaç toplamları
+    def summary(self):
+        with self.lock:
+            stages = {name: {"count": count, "total_ms": total * 1000, "mean_ms": total / count * 1000,
+                             "max_ms": longest * 1000}
+                      for name, (count, total, longest) in self.stage_totals.items()}
+            counters = dict(self.counter_totals)
+            runs = self.run_count
+        return {"runs": runs, "stages": stages, "counters": counters, "cache_hit_rate": self.cache_hit_rate()}
+
+    #Chrome trace event biçimi (chrome://tracing, Perfetto, speedscope açar): run'lar ve aşamalar
+    #"X" (süreli) olayları, run sonundaki sayaçlar "C" (sayaç) olaylarıdır; zamanlar mikrosaniye
+    def trace_events(self):
+        pid = os.getpid()
+        events = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+                   "args": {"name": "python-syntax-highlighter"}}]
+        for thread, name in list(self.thread_names.items()):
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread, "args": {"name": name}})
+        for name, thread, start, duration, counters in list(self.events):
+            timestamp = (start - self.origin) * 1e6
+            event = {"name": name, "cat": "stage" if counters is None else "run", "ph": "X",
+                     "pid": pid, "tid": thread, "ts": round(timestamp, 3), "dur": round(duration * 1e6, 3)}
+            if counters:
+                event["args"] = counters
+                events.append({"name": "counters", "ph": "C", "pid": pid, "tid": thread,
+                               "ts": round(timestamp + duration * 1e6, 3), "args": counters})
+            events.append(event)
+        return events
+
+    def export_trace(self, out):
+        json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, out)
+
+    def save_trace(self, path):
+        with open(path, "w", encoding="utf-8") as file:
+            self.export_trace(file)
+
+
+#düğümdeki ve altındaki tuple sayısı (özyinelemesiz)
+def count_tuples(node):
+    count = 0
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if type(node) is tuple:
+            count += 1
+            stack.extend(node[1:])
+        elif type(node) is list:
+            stack.extend(node)
+    return count
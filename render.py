@@ -0,0 +1,197 @@
+import argparse
+import sys
+from lexer import TOKEN_TYPES, Lexer, TokenArray
+from themes import THEMES, DARK_COLORS, DARK_PALETTE, hex_to_rgb
+
+#tk olmadan renklendirilmiş çıktı (HTML, ANSI, LaTeX)
+#tokenlar Lexer.tokenize (Token listesi) ya da Lexer.tokenize_array (TokenArray) sonucudur;
+#çıktı out'a (dosya, StringIO, stdout) parça parça yazılır, tüm belge bellekte birleştirilmez
+
+#write_tokens parçaları bu kadar biriktirip tek write ile yazar
+WRITE_CHUNK = 8192
+
+#tek satırda kalan, çok tekrarlanan token türleri; render edilmiş halleri önbelleğe alınır
+SHORT_TYPES = ("KEYWORD", "BUILTIN", "IDENTIFIER", "NUMBER", "OPERATOR", "DELIMITER")
+
+
+#bir çıktı biçiminin token başına ihtiyaç duyduğu her şey:
+#(tür -> açılış, kapanış, kaçış tablosu (str.translate), kaçış gerekebilen türler, çok satırlı tokenlar
+#satır satır kapatılıp açılsın mı)
+def make_style(opens, close, table, escaped, split_lines):
+    return (opens, close, str.maketrans(table), frozenset(escaped), split_lines)
+
+
+#tokenlar (tür, başlangıç, bitiş) olarak; TokenArray'in dizileri token nesnesi üretmeden dolaşılır
+def token_spans(tokens):
+    if isinstance(tokens, TokenArray):
+        if not isinstance(tokens.source, str):
+            raise ValueError("Bayt konumlu TokenArray önce decode() ile karakter konumlarına çevrilmeli")
+        return zip(map(TOKEN_TYPES.__getitem__, tokens.kinds), tokens.starts, tokens.ends)
+    return ((token.type, token.position[0], token.position[1]) for token in tokens)
+
+
+#metni tokenların açılış/kapanışlarıyla sararak out'a yazar
+#tokenlar arasındaki boşluklar metinden kesilip olduğu gibi yazılır (lexer'ın atladığı kısımlar sadece
+#boşluktur); değerler sadece kaçış gerekebilen türlerde translate'den geçer. Kısa türlerde önceki
+#boşlukla birlikte kesilen parça ("    return") anahtardır: render edilmiş hali bir kere oluşturulur,
+#tekrarlarında token başına tek kesme, tek sözlük araması ve tek parça eklenir
+def write_tokens(text, tokens, out, style):
+    opens, close, table, escaped, split_lines = style
+    short = {kind: {} for kind in SHORT_TYPES}
+    pieces = []
+    append = pieces.append
+    position = 0
+    for kind, start, end in token_spans(tokens):
+        cache = short.get(kind)
+        if cache is not None:
+            piece = text[position:end]
+            rendered = cache.get(piece)
+            if rendered is None:
+                value = text[start:end]
+                rendered = cache[piece] = "".join((text[position:start], opens[kind],
+                                                   value.translate(table) if kind in escaped else value, close))
+            append(rendered)
+        else:
+            if start != position:
+                append(text[position:start])
+            value = text[start:end]
+            if kind in escaped:
+                value = value.translate(table)
+            if split_lines and "\n" in value:
+                value = value.replace("\n", close + "\n" + opens[kind])
+            append(opens[kind])
+            append(value)
+            append(close)
+        position = end
+        if len(pieces) >= WRITE_CHUNK:
+            out.write("".join(pieces))
+            pieces.clear()
+    append(text[position:])
+    out.write("".join(pieces))
+
+
+#HTML: her tür bir CSS sınıfıdır (hl-KEYWORD ...), kod <pre class="hl"> içindedir
+HTML_ESCAPES = {"&": "&amp;", "<": "&lt;", ">": "&gt;"}
+
+
+def html_style():
+    opens = {kind: f'<span class="hl-{kind}">' for kind in TOKEN_TYPES}
+    return make_style(opens, "</span>", HTML_ESCAPES,
+                      ("OPERATOR", "STRING", "FSTRING", "COMMENT", "ERROR"), False)
+
+
+def html_css(palette=DARK_PALETTE, colors=DARK_COLORS):
+    background, foreground = colors
+    rules = [f"pre.hl {{ background: {background}; color: {foreground}; "
+             "font-family: Consolas, monospace; padding: 8px; }"]
+    for kind, (color, underline) in palette.items():
+        decoration = " text-decoration: underline;" if underline else ""
+        rules.append(f".hl-{kind} {{ color: {color};{decoration} }}")
+    return "\n".join(rules)
+
+
+#standalone=False ise sadece <pre> yazılır (sayfaya gömmek için, stil html_css ile ayrıca eklenir)
+def write_html(text, tokens, out, palette=DARK_PALETTE, colors=DARK_COLORS, standalone=True):
+    if standalone:
+        out.write('<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n<style>\n')
+        out.write(html_css(palette, colors))
+        out.write("\n</style>\n</head>\n<body>\n")
+    out.write('<pre class="hl">')
+    write_tokens(text, tokens, out, html_style())
+    out.write("</pre>\n")
+    if standalone:
+        out.write("</body>\n</html>\n")
+
+
+#ANSI: 24 bit renk kaçış dizileri; her satır kendi içinde kapanır (less -R, grep gibi araçlar için)
+#metindeki ESC karakterleri terminali bozmasın diye görünür hale getirilir
+ANSI_RESET = "\x1b[0m"
+ANSI_ESCAPES = {"\x1b": "^["}
+
+
+def ansi_style(palette=DARK_PALETTE):
+    opens = {}
+    for kind, (color, underline) in palette.items():
+        red, green, blue = hex_to_rgb(color)
+        opens[kind] = f"\x1b[38;2;{red};{green};{blue}m" + ("\x1b[4m" if underline else "")
+    return make_style(opens, ANSI_RESET, ANSI_ESCAPES, ("STRING", "FSTRING", "COMMENT", "ERROR"), True)
+
+
+def write_ansi(text, tokens, out, palette=DARK_PALETTE):
+    write_tokens(text, tokens, out, ansi_style(palette))
+
+
+#LaTeX: fancyvrb Verbatim içinde her tür bir makrodur (\hlKEYWORD{def}); \, { ve } makrolarla yazılır
+#Verbatim'de makro argümanı satır atlayamadığı için çok satırlı tokenlar satır satır kapatılır
+LATEX_ESCAPES = {"\\": "\\hlZbs{}", "{": "\\hlZob{}", "}": "\\hlZcb{}"}
+
+
+def latex_style():
+    opens = {kind: f"\\hl{kind}{{" for kind in TOKEN_TYPES}
+    return make_style(opens, "}", LATEX_ESCAPES, ("DELIMITER", "STRING", "FSTRING", "COMMENT", "ERROR"), True)
+
+
+#makro tanımları (belgenin önsözüne eklenir)
+def latex_preamble(palette=DARK_PALETTE):
+    lines = ["\\usepackage{fancyvrb}", "\\usepackage{xcolor}",
+             "\\newcommand\\hlZbs{\\char`\\\\}", "\\newcommand\\hlZob{\\char`\\{}",
+             "\\newcommand\\hlZcb{\\char`\\}}"]
+    for kind, (color, underline) in palette.items():
+        body = "\\underline{#1}" if underline else "#1"
+        lines.append(f"\\newcommand\\hl{kind}[1]{{\\textcolor[HTML]{{{color[1:].upper()}}}{{{body}}}}}")
+    return "\n".join(lines)
+
+
+#standalone=False ise sadece Verbatim ortamı yazılır (makrolar latex_preamble ile ayrıca eklenir)
+def write_latex(text, tokens, out, palette=DARK_PALETTE, colors=DARK_COLORS, standalone=True):
+    background, foreground = colors
+    if standalone:
+        out.write("\\documentclass{article}\n")
+        out.write(latex_preamble(palette))
+        out.write("\n\\begin{document}\n")
+        out.write(f"\\pagecolor[HTML]{{{background[1:].upper()}}}\n")
+    out.write(f"\\begin{{Verbatim}}[commandchars=\\\\\\{{\\}},formatcom=\\color[HTML]{{{foreground[1:].upper()}}}]\n")
+    write_tokens(text, tokens, out, latex_style())
+    out.write("\\end{Verbatim}\n" if text.endswith("\n") else "\n\\end{Verbatim}\n")
+    if standalone:
+        out.write("\\end{document}\n")
+
+
+FORMATS = ("html", "ansi", "latex")
+
+
+#metni tokenize edip seçilen biçimde out'a yazar
+def render(text, out, format="html", theme="dark", lexer=None):
+    palette, colors = THEMES[theme]
+    tokens = (lexer or Lexer()).tokenize_array(text)
+    if format == "html":
+        write_html(text, tokens, out, palette, colors)
+    elif format == "ansi":
+        write_ansi(text, tokens, out, palette)
+    elif format == "latex":
+        write_latex(text, tokens, out, palette, colors)
+    else:
+        raise ValueError(f"Bilinmeyen çıktı biçimi: {format} (seçenekler: {', '.join(FORMATS)})")
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(
+        prog="render.py",
+        description="Python dosyasını renklendirilmiş HTML, ANSI ya da LaTeX olarak yazar.")
+    arg_parser.add_argument("path", help="renklendirilecek dosya")
+    arg_parser.add_argument("-f", "--format", choices=FORMATS, default="html", help="çıktı biçimi")
+    arg_parser.add_argument("-t", "--theme", choices=tuple(THEMES), default="dark", help="renk paleti")
+    arg_parser.add_argument("-o", "--output", help="çıktı dosyası (varsayılan: stdout)")
+    args = arg_parser.parse_args(argv)
+
+    with open(args.path, encoding="utf-8") as file:
+        text = file.read()
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            render(text, output, args.format, args.theme)
+    else:
+        render(text, sys.stdout, args.format, args.theme)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+import time
+
+#başlangıç süresi import'lar dahil buradan ölçülür
+STARTED = time.perf_counter()
+
+import argparse
+import io
+import json
+import socket
+import socketserver
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from cache import LRUCache
+from core import Analyzer
+from lexer import Lexer
+from render import write_ansi, write_html, write_latex
+from themes import THEMES
+
+#GUI'siz analiz sunucusu: satır başına bir JSON-RPC 2.0 isteği alır, satır başına bir yanıt yazar
+#stdin/stdout üzerinden ya da yerel bir soket (TCP 127.0.0.1 veya unix soketi) üzerinden çalışır.
+#Lexer, analizciler ve önbellekler istekler arasında sıcak kalır; istekler bir thread havuzunda
+#işlenir, yanıtlar bitiş sırasıyla yazılır (id ile eşleştirilir). tkinter import edilmez
+
+#JSON-RPC hata kodları
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+#ısınma için tokenize ve parse edilen kısa örnek (regex'ler ve parser tabloları ilk istekten önce hazır olur)
+WARMUP_CODE = '''class Person:
+    def __init__(self, name):
+        self.name = name
+
+print(f"Hello {Person('Alice').name}", 3.14 * 2 // 7 != 1)
+'''
+
+
+class RequestError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+class Server:
+    #documents: isimle izlenen en fazla belge sayısı (her biri kendi artımlı durumunu tutar)
+    #cache_size: analizci başına token/AST önbelleği sınırı
+    def __init__(self, workers=4, documents=64, cache_size=8 << 20):
+        self.lexer = Lexer()
+        self.workers = workers
+        self.cache_size = cache_size
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        #belge adı -> (Analyzer, Lock); aynı belgeye gelen istekler sırayla, farklı belgeler aynı anda işlenir
+        self.documents = LRUCache(max_size=documents, max_entries=documents)
+        self.documents_lock = threading.Lock()
+        #belgesiz istekler için her işçi thread'in kendi analizcisi vardır (kilit gerekmez)
+        self.local = threading.local()
+        self.methods = {"highlight": self.highlight, "parse": self.parse, "symbols": self.symbols,
+                        "stats": self.stats}
+        #metot -> son isteklerin süreleri (sn) ve toplam istek sayısı
+        self.latencies = {}
+        self.counts = {}
+        self.stats_lock = threading.Lock()
+        self.started = STARTED
+        self.ready = None
+        self.stopping = threading.Event()
+
+    #ilk isteğin soğuk maliyetini başlangıçta öder, dönüş import dahil başlangıç süresi (sn)
+    def warm_up(self):
+        analyzer = Analyzer(self.lexer, 0)
+        analyzer.update(WARMUP_CODE)
+        analyzer.parse(WARMUP_CODE)
+        write_html(WARMUP_CODE, analyzer.incremental.tokens, io.StringIO())
+        self.ready = time.perf_counter()
+        return self.ready - self.started
+
+    #belgenin analizcisi ve kilidi; belge verilmezse thread'in kendi analizcisi
+    def analyzer(self, document):
+        if document is None:
+            analyzer = getattr(self.local, "analyzer", None)
+            if analyzer is None:
+                analyzer = self.local.analyzer = Analyzer(self.lexer, self.cache_size)
+            return analyzer, None
+        with self.documents_lock:
+            entry = self.documents.get(document)
+            if entry is None:
+                entry = (Analyzer(self.lexer, self.cache_size), threading.Lock())
+                self.documents.put(document, entry, 1)
+        return entry
+
+    #params'taki metin için analizciyi güncelleyip method(analyzer, text, params) çağırır
+    def with_analyzer(self, params, method):
+        text = params.get("text")
+        if not isinstance(text, str):
+            raise RequestError(INVALID_PARAMS, "params.text metin olmalı")
+        analyzer, lock = self.analyzer(params.get("document"))
+        if lock is None:
+            return method(analyzer, text, params)
+        with lock:
+            return method(analyzer, text, params)
+
+    #{"text", "document"?, "format"?: spans|html|ansi|latex, "theme"?: dark|light, "changed_only"?: bool}
+    #spans: {"changed": [başlangıç, bitiş], "tokens": [[tür, başlangıç, bitiş], ...]}, diğerleri {"output": metin}
+    #changed_only ile sadece yeniden tokenize edilen aralıktaki tokenlar döner (belgeyi izleyen istemciler
+    #için; aralığın dışındaki tokenlar bir önceki yanıttakilerin düzenlemeye göre kaydırılmış halidir)
+    #belgesiz isteklerin analizcisi thread'in başka isteklerle paylaşılır, aralık istemcinin önceki
+    #yanıtına göre değildir; bu yüzden changed_only ancak document ile kabul edilir
+    def highlight(self, params):
+        if params.get("changed_only") and params.get("document") is None:
+            raise RequestError(INVALID_PARAMS, "changed_only sadece document ile kullanılabilir")
+        return self.with_analyzer(params, self.highlight_text)
+
+    def highlight_text(self, analyzer, text, params):
+        start, end = analyzer.update(text)
+        tokens = analyzer.incremental.tokens
+        output_format = params.get("format", "spans")
+        if output_format == "spans":
+            if params.get("changed_only"):
+                first = analyzer.incremental.token_index(start) if start < end else len(tokens)
+                spans = []
+                for index in range(first, len(tokens)):
+                    token_start, token_end = tokens[index].position
+                    if token_start >= end:
+                        break
+                    spans.append((tokens[index].type, token_start, token_end))
+            else:
+                spans = [(token.type, token.position[0], token.position[1]) for token in tokens]
+            return {"changed": [start, end], "tokens": spans}
+        theme = THEMES.get(params.get("theme", "dark"))
+        if theme is None:
+            raise RequestError(INVALID_PARAMS, f"Bilinmeyen tema: {params['theme']}")
+        palette, colors = theme
+        out = io.StringIO()
+        if output_format == "html":
+            write_html(text, tokens, out, palette, colors, params.get("standalone", False))
+        elif output_format == "ansi":
+            write_ansi(text, tokens, out, palette)
+        elif output_format == "latex":
+            write_latex(text, tokens, out, palette, colors, params.get("standalone", False))
+        else:
+            raise RequestError(INVALID_PARAMS, f"Bilinmeyen çıktı biçimi: {output_format}")
+        return {"output": out.getvalue()}
+
+    #{"text", "document"?} -> {"ast", "errors": [[mesaj, [satır, sütun]], ...]}
+    #parse yarıda kalırsa batch.py'deki gibi {"error", "error_position"}
+    def parse(self, params):
+        return self.with_analyzer(params, self.parse_text)
+
+    def parse_text(self, analyzer, text, params):
+        analyzer.update(text)
+        try:
+            ast = analyzer.parse(text)
+        except (SyntaxError, RecursionError) as e:
+            parser = analyzer.incremental_parser.parser
+            return {"error": str(e), "error_position": parser.get_position() if parser else None}
+        #errors listesi sonraki parse'ta değişir, yanıt kilit dışında yazıldığı için kopyalanır
+        return {"ast": ast, "errors": list(analyzer.incremental_parser.errors)}
+
+    #{"text", "document"?} -> {"symbols": [[tür, isim, nitelikli isim, başlangıç, bitiş, derinlik], ...]}
+    def symbols(self, params):
+        return self.with_analyzer(params, self.symbols_text)
+
+    def symbols_text(self, analyzer, text, params):
+        result = self.parse_text(analyzer, text, params)
+        if "error" in result:
+            return result
+        return {"symbols": analyzer.symbol_index.outline()}
+
+    #başlangıç süresi ve metot başına istek sayısı ile gecikme yüzdelikleri (ms)
+    def stats(self, params=None):
+        methods = {}
+        with self.stats_lock:
+            for method, latencies in self.latencies.items():
+                ordered = sorted(latencies)
+                methods[method] = {
+                    "count": self.counts[method],
+                    "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+                    "p50_ms": round(ordered[len(ordered) // 2] * 1000, 3),
+                    "p99_ms": round(ordered[min(len(ordered) - 1, len(ordered) * 99 // 100)] * 1000, 3),
+                    "max_ms": round(ordered[-1] * 1000, 3),
+                }
+        return {"startup_ms": round((self.ready - self.started) * 1000, 3) if self.ready else None,
+                "uptime_s": round(time.perf_counter() - self.started, 3),
+                "workers": self.workers, "documents": len(self.documents), "methods": methods}
+
+    def record(self, method, elapsed):
+        with self.stats_lock:
+            latencies = self.latencies.get(method)
+            if latencies is None:
+                #yüzdelikler son 1024 istekten hesaplanır
+                latencies = self.latencies[method] = deque(maxlen=1024)
+                self.counts[method] = 0
+            latencies.append(elapsed)
+            self.counts[method] += 1
+
+    #çözülmüş isteği çalıştırır, yanıt satırını (bildirimlerde None) döndürür; hatalar JSON-RPC hata yanıtı olur
+    #bildirimlere (id'siz istekler) hata olsa da yanıt yazılmaz
+    def dispatch(self, request):
+        request_id = request.get("id") if isinstance(request, dict) else None
+        notification = isinstance(request, dict) and "id" not in request
+        try:
+            if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+                raise RequestError(INVALID_REQUEST, "İstek method içeren bir nesne olmalı")
+            method_name = request["method"]
+            if method_name == "shutdown":
+                self.stopping.set()
+                result = None
+            else:
+                method = self.methods.get(method_name)
+                if method is None:
+                    raise RequestError(METHOD_NOT_FOUND, f"Bilinmeyen metot: {method_name}")
+                params = request.get("params", {})
+                if not isinstance(params, dict):
+                    raise RequestError(INVALID_PARAMS, "params bir nesne olmalı")
+                start = time.perf_counter()
+                result = method(params)
+                self.record(method_name, time.perf_counter() - start)
+        except RequestError as e:
+            return None if notification else self.error_response(request_id, e)
+        except Exception as e:
+            if notification:
+                return None
+            return self.error_response(request_id, RequestError(INTERNAL_ERROR, f"{type(e).__name__}: {e}"))
+        if notification:
+            return None
+        return json.dumps({"jsonrpc": "2.0", "id": request_id, "result": result}, ensure_ascii=False)
+
+    def error_response(self, request_id, error):
+        return json.dumps({"jsonrpc": "2.0", "id": request_id, "error": {"code": error.code, "message": str(error)}},
+                          ensure_ascii=False)
+
+    #satırları okuyup havuza verir, yanıtları write ile (kilitli) yazar
+    #okuma bitince ya da shutdown isteğinde önce bekleyen isteklerin bitmesi beklenir
+    def serve_lines(self, lines, write):
+        write_lock = threading.Lock()
+
+        def send(response):
+            if response is not None:
+                with write_lock:
+                    write(response + "\n")
+
+        futures = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                send(self.error_response(None, RequestError(PARSE_ERROR, f"Geçersiz JSON: {e}")))
+                continue
+            if isinstance(request, dict) and request.get("method") == "shutdown":
+                for future in futures:
+                    future.result()
+                send(self.dispatch(request))
+                return
+            future = self.executor.submit(self.dispatch, request)
+            future.add_done_callback(lambda done: send(done.result()))
+            futures.append(future)
+            if len(futures) > 1024:
+                futures = [future for future in futures if not future.done()]
+        for future in futures:
+            future.result()
+
+    def serve_stdio(self, stdin=None, stdout=None):
+        stdin = stdin or sys.stdin
+        stdout = stdout or sys.stdout
+
+        def write(text):
+            stdout.write(text)
+            stdout.flush()
+
+        self.serve_lines(stdin, write)
+
+    #her bağlantı kendi thread'inde okunur, istekler ortak havuzda işlenir
+    #ready() soket bağlandıktan sonra çağrılır; TCP adresi TIME_WAIT'teyken de yeniden kullanılabilir
+    def serve_socket(self, address, unix=False, ready=None):
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                lines = (line.decode("utf-8") for line in self.rfile)
+
+                def write(text):
+                    self.wfile.write(text.encode("utf-8"))
+
+                server.serve_lines(lines, write)
+                if server.stopping.is_set():
+                    threading.Thread(target=self.server.shutdown).start()
+
+        class ReusableTCPServer(socketserver.ThreadingTCPServer):
+            allow_reuse_address = True
+
+        if unix:
+            socket_server = socketserver.ThreadingUnixStreamServer(address, Handler)
+        else:
+            socket_server = ReusableTCPServer(address, Handler)
+        socket_server.daemon_threads = True
+        with socket_server:
+            if ready is not None:
+                ready()
+            socket_server.serve_forever()
+
+    def close(self):
+        self.executor.shutdown()
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(
+        prog="server.py",
+        description="Highlight ve parse isteklerini JSON-RPC ile (stdin ya da yerel soket) karşılayan GUI'siz sunucu.")
+    arg_parser.add_argument("--port", type=int, help="127.0.0.1 üzerinde dinlenecek TCP portu (verilmezse stdin/stdout)")
+    arg_parser.add_argument("--unix", help="dinlenecek unix soketi yolu")
+    arg_parser.add_argument("-j", "--workers", type=int, default=4, help="istekleri işleyen thread sayısı")
+    arg_parser.add_argument("--documents", type=int, default=64, help="artımlı olarak izlenen en fazla belge sayısı")
+    args = arg_parser.parse_args(argv)
+
+    server = Server(args.workers, args.documents)
+    startup = server.warm_up()
+    try:
+        if args.unix:
+            if not hasattr(socket, "AF_UNIX"):
+                arg_parser.error("bu sistemde unix soketi yok, --port kullanın")
+            server.serve_socket(args.unix, unix=True, ready=lambda: print(
+                f"hazır: {startup * 1000:.1f} ms, {args.unix}", file=sys.stderr, flush=True))
+        elif args.port is not None:
+            server.serve_socket(("127.0.0.1", args.port), ready=lambda: print(
+                f"hazır: {startup * 1000:.1f} ms, 127.0.0.1:{args.port}", file=sys.stderr, flush=True))
+        else:
+            print(f"hazır: {startup * 1000:.1f} ms, stdin", file=sys.stderr, flush=True)
+            server.serve_stdio()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
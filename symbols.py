@@ -0,0 +1,145 @@
+#parser'ın statement başına kaydettiği tanımlardan (Parser.symbols, IncrementalParser.symbols) isim ve
+#konum sorguları; AST tekrar dolaşılmaz. Kayıtlar (tür, isim, nitelikli isim, başlangıç, bitiş, derinlik)
+#biçimindedir, konumlar karakter konumudur, nitelikli isim kapsayan tanımlarla birleşir ("Person.greet")
+class SymbolIndex:
+    #tokens ve starts (statement başlarının token indeksleri) parse'ta kullanılanlardır
+    def __init__(self, tokens=(), starts=(), symbols=()):
+        self.tokens = tokens
+        self.starts = starts
+        self.symbols = symbols
+        #isim -> [(statement, sıra)], ilk isim sorgusunda bir kere kurulur
+        self.by_name = None
+
+    def __len__(self):
+        return sum(len(statement) for statement in self.symbols)
+
+    #statement'ın local. tanımının kaydı
+    def record(self, statement, local):
+        entries = self.symbols[statement]
+        kind, name, begin, end, parent = entries[local]
+        qualified = name
+        depth = 0
+        while parent >= 0:
+            qualified = f"{entries[parent][1]}.{qualified}"
+            parent = entries[parent][4]
+            depth += 1
+        base = self.starts[statement]
+        return (kind, name, qualified, self.tokens[base + begin].position[0],
+                self.tokens[base + end - 1].position[1], depth)
+
+    def build(self):
+        by_name = {}
+        for statement, entries in enumerate(self.symbols):
+            for local, entry in enumerate(entries):
+                by_name.setdefault(entry[1], []).append((statement, local))
+        self.by_name = by_name
+
+    #isim ya da noktalı hedef ("self.name") için tüm tanımlar, metindeki sırayla
+    def definitions(self, name):
+        if self.by_name is None:
+            self.build()
+        return [self.record(statement, local) for statement, local in self.by_name.get(name, ())]
+
+    #tanımlı isimler
+    def names(self):
+        if self.by_name is None:
+            self.build()
+        return list(self.by_name)
+
+    #offset'i içeren en içteki tanım, yoksa None
+    #statement başları sıralı olduğu için ikili arama yapılır, sadece o statement'ın tanımlarına bakılır
+    def at(self, offset):
+        tokens, starts = self.tokens, self.starts
+        low, high = 0, len(starts)
+        while low < high:
+            middle = (low + high) // 2
+            if tokens[starts[middle]].position[0] <= offset:
+                low = middle + 1
+            else:
+                high = middle
+        statement = low - 1
+        if statement < 0:
+            return None
+        found = None
+        #kayıtlar ön sırada olduğu için içeren son kayıt en içtekidir
+        for local in range(len(self.symbols[statement])):
+            record = self.record(statement, local)
+            if record[3] <= offset < record[4]:
+                found = record
+        return found
+
+    #tüm tanımlar metindeki sırayla (anahat)
+    def outline(self):
+        return [self.record(statement, local)
+                for statement, entries in enumerate(self.symbols) for local in range(len(entries))]
+
+
+#ttk.Treeview üzerinde anahat (outline) paneli
+#update'te statement'ların tanım tuple'ları öncekilerle kimlikleri (is) ile karşılaştırılır, tekrar
+#kullanılan statement'ların tuple'ları aynı kaldığı için sadece değişen statement'ların öğeleri yenilenir
+#bir öğe seçilince select(başlangıç, bitiş) tanımın güncel karakter konumlarıyla çağrılır
+class OutlineView:
+    def __init__(self, tree, select=None):
+        self.tree = tree
+        self.select = select
+        self.index = SymbolIndex()
+        #gösterilen statement tuple'ları ve her biri için kök seviyedeki öğeler
+        self.shown = []
+        self.roots = []
+        #öğe -> (statement tuple'ı, sıra)
+        self.locations = {}
+        self.counter = 0
+        self.tree.bind("<<TreeviewSelect>>", self.on_select)
+
+    #dönüş yenilenen statement sayısı
+    def update(self, index):
+        self.index = index
+        symbols = index.symbols
+        old = self.shown
+        prefix = 0
+        limit = min(len(old), len(symbols))
+        while prefix < limit and old[prefix] is symbols[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old[-1 - suffix] is symbols[-1 - suffix]:
+            suffix += 1
+
+        removed = [item for roots in self.roots[prefix:len(old) - suffix] for item in roots]
+        if removed:
+            self.tree.delete(*removed)
+            removed = set(removed)
+            self.locations = {item: location for item, location in self.locations.items()
+                              if item.split(".", 1)[0] not in removed}
+        position = sum(len(roots) for roots in self.roots[:prefix])
+        added = []
+        for entries in symbols[prefix:len(symbols) - suffix]:
+            roots = []
+            items = []
+            for local, (kind, name, _, _, parent) in enumerate(entries):
+                if parent < 0:
+                    self.counter += 1
+                    item = f"s{self.counter}"
+                    self.tree.insert("", position, iid=item, text=name, values=(kind,), open=True)
+                    position += 1
+                    roots.append(item)
+                else:
+                    item = f"{items[parent]}.{local}"
+                    self.tree.insert(items[parent], "end", iid=item, text=name, values=(kind,), open=True)
+                items.append(item)
+                self.locations[item] = (entries, local)
+            added.append(roots)
+        self.roots[prefix:len(old) - suffix] = added
+        self.shown = list(symbols)
+        return len(added)
+
+    def on_select(self, event=None):
+        location = self.locations.get(self.tree.focus())
+        if location is None or self.select is None:
+            return
+        entries, local = location
+        #statement'ın güncel sırası (öğe oluşturulduktan sonra önüne statement eklenmiş olabilir)
+        for statement, shown in enumerate(self.index.symbols):
+            if shown is entries:
+                record = self.index.record(statement, local)
+                self.select(record[3], record[4])
+                return
@@ -0,0 +1,42 @@
+#renk paletleri: token türü -> (yazı rengi, altı çizili mi)
+#tk tagları (SyntaxHighlighter) ve tk'siz çıktılar (render.py) aynı paletleri kullanır
+#renkler "#rrggbb" biçimindedir, açık temadakiler tk'de kullanılan renk isimlerinin X11 değerleridir
+DARK_PALETTE = {
+    "KEYWORD": ("#7ab6e7", False),
+    "BUILTIN": ("#7c75d6", False),
+    "IDENTIFIER": ("#bc80d8", False),
+    "NUMBER": ("#4ec9b0", False),
+    "STRING": ("#ce9178", False),
+    "FSTRING": ("#caf7f4", False),
+    "COMMENT": ("#6a9955", False),
+    "OPERATOR": ("#d5e98f", False),
+    "DELIMITER": ("#d5e98f", False),
+    "ERROR": ("#f44747", True),
+}
+
+LIGHT_PALETTE = {
+    "KEYWORD": ("#0000ff", False),      #blue
+    "BUILTIN": ("#ff8c00", False),      #darkorange
+    "IDENTIFIER": ("#000000", False),   #black
+    "NUMBER": ("#a020f0", False),       #purple
+    "STRING": ("#00ff00", False),       #green
+    "FSTRING": ("#00ffff", False),      #cyan
+    "COMMENT": ("#bebebe", False),      #gray
+    "OPERATOR": ("#ff0000", False),     #red
+    "DELIMITER": ("#a52a2a", False),    #brown
+    "ERROR": ("#ff0000", True),         #red
+}
+
+#editörün (arka plan, düz yazı) renkleri, main.py'deki koyu tema ile aynı
+DARK_COLORS = ("#3d3d3d", "#e0e0e0")
+LIGHT_COLORS = ("#ffffff", "#000000")
+
+THEMES = {
+    "dark": (DARK_PALETTE, DARK_COLORS),
+    "light": (LIGHT_PALETTE, LIGHT_COLORS),
+}
+
+
+#"#rrggbb" -> (r, g, b)
+def hex_to_rgb(color):
+    return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)